@@ -15,7 +15,7 @@ Version: 2.0.0
 """
 
 from .core.game_engine import GameEngine, GameObject
-from .core.nlp_processor import NLPProcessor, ObjectDescription, ShapeType
+from .core.nlp_processor import NLPProcessor, ObjectDescription, ShapeType, get_nlp_processor
 from .core.physics_engine import PhysicsEngine, RigidBody, Collision
 from .core.asset_manager import AssetManager, AssetMetadata
 
@@ -32,6 +32,7 @@ __all__ = [
     'GameEngine',
     'GameObject',
     'NLPProcessor',
+    'get_nlp_processor',
     'ObjectDescription',
     'ShapeType',
     'PhysicsEngine',
@@ -67,7 +68,9 @@ DEFAULT_CONFIG = {
         'shadows': True,
         'anti_aliasing': True,
         'post_processing': True,
-        'max_lights': 8
+        'max_lights': 8,
+        'gpu_memory_budget_mb': None,
+        'target_fps': 60
     },
     'assets': {
         'cache_size_mb': 500,
@@ -102,5 +105,7 @@ def create_engine(config: dict = None) -> GameEngine:
     return GameEngine(
         width=config['window']['width'],
         height=config['window']['height'],
-        enable_physics=config['physics']['enabled']
+        enable_physics=config['physics']['enabled'],
+        gpu_memory_budget_mb=config['rendering'].get('gpu_memory_budget_mb'),
+        target_fps=config['rendering'].get('target_fps')
     )
\ No newline at end of file
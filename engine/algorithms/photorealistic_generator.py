@@ -3,13 +3,17 @@ import trimesh
 from typing import Dict, List, Tuple
 import cv2
 from scipy.ndimage import gaussian_filter
+from ..procedural.fractal_noise import diamond_square
+from ..procedural.grid_mesh import grid_mesh
+from ..procedural.seeding import SeedLike
 
 class PhotorealisticGenerator:
     """Advanced algorithms for photorealistic 3D generation"""
     
     @staticmethod
-    def generate_pbr_materials(mesh: trimesh.Trimesh, material_type: str) -> Dict:
+    def generate_pbr_materials(mesh: trimesh.Trimesh, material_type: str, seed: SeedLike = None) -> Dict:
         """Generate physically-based rendering materials"""
+        rng = np.random.default_rng(seed)
         materials = {
             'metal': {'base_color': [0.8, 0.8, 0.8], 'metallic': 1.0, 'roughness': 0.2},
             'plastic': {'base_color': [0.5, 0.5, 0.5], 'metallic': 0.0, 'roughness': 0.4},
@@ -20,71 +24,46 @@ class PhotorealisticGenerator:
         }
         
         mat = materials.get(material_type, materials['plastic'])
-        mat['albedo_map'] = PhotorealisticGenerator._generate_texture(1024, mat['base_color'])
-        mat['normal_map'] = PhotorealisticGenerator._generate_normal_map(1024)
+        mat['albedo_map'] = PhotorealisticGenerator._generate_texture(1024, mat['base_color'], rng)
+        mat['normal_map'] = PhotorealisticGenerator._generate_normal_map(1024, rng)
         return mat
     
     @staticmethod
-    def _generate_texture(resolution: int, base_color: List[float]) -> np.ndarray:
+    def _generate_texture(resolution: int, base_color: List[float], rng: np.random.Generator) -> np.ndarray:
         """Generate procedural texture"""
         texture = np.ones((resolution, resolution, 3)) * np.array(base_color)
-        noise = np.random.random((resolution, resolution, 3)) * 0.1
+        noise = rng.random((resolution, resolution, 3)) * 0.1
         texture += noise
         return np.clip(texture * 255, 0, 255).astype(np.uint8)
     
     @staticmethod
-    def _generate_normal_map(resolution: int) -> np.ndarray:
+    def _generate_normal_map(resolution: int, rng: np.random.Generator) -> np.ndarray:
         """Generate normal map"""
         normal_map = np.ones((resolution, resolution, 3)) * [0.5, 0.5, 1.0]
-        height = gaussian_filter(np.random.random((resolution, resolution)), sigma=2)
+        height = gaussian_filter(rng.random((resolution, resolution)), sigma=2)
         dy, dx = np.gradient(height)
         normal_map[:, :, 0] = 0.5 - dx * 0.5
         normal_map[:, :, 1] = 0.5 - dy * 0.5
         return (normal_map * 255).astype(np.uint8)
     
     @staticmethod
-    def generate_realistic_terrain(size: Tuple[int, int]) -> trimesh.Trimesh:
+    def generate_realistic_terrain(size: Tuple[int, int], seed: SeedLike = None) -> trimesh.Trimesh:
         """Generate photorealistic terrain with diamond-square algorithm"""
-        heightmap = PhotorealisticGenerator._diamond_square(size[0])
-        vertices, faces, colors = [], [], []
+        heightmap = PhotorealisticGenerator._diamond_square(max(size), seed=seed)[:size[0], :size[1]]
+        i, j = np.mgrid[0:size[0], 0:size[1]]
         
-        for i in range(size[0] - 1):
-            for j in range(size[1] - 1):
-                y = heightmap[i, j]
-                vertices.append([i, y, j])
-                
-                if y < 0.2:
-                    color = [50, 100, 200]
-                elif y < 0.7:
-                    color = [34, 139, 34]
-                else:
-                    color = [255, 255, 255]
-                colors.append(color + [255])
-                
-                idx = i * size[1] + j
-                faces.extend([[idx, idx + 1, idx + size[1]], [idx + 1, idx + size[1] + 1, idx + size[1]]])
+        colors = np.select(
+            [heightmap[..., None] < 0.2, heightmap[..., None] < 0.7],
+            [np.array([50, 100, 200, 255]), np.array([34, 139, 34, 255])],
+            np.array([255, 255, 255, 255])
+        ).astype(np.uint8)
         
-        return trimesh.Trimesh(vertices=vertices, faces=faces, vertex_colors=colors)
+        return grid_mesh(np.stack([i, heightmap, j], axis=-1), colors=colors)
     
     @staticmethod
-    def _diamond_square(size: int, roughness: float = 0.5) -> np.ndarray:
+    def _diamond_square(size: int, roughness: float = 0.5, seed: SeedLike = None) -> np.ndarray:
         """Diamond-square terrain algorithm"""
-        heightmap = np.zeros((size, size))
-        heightmap[[0, 0, size-1, size-1], [0, size-1, 0, size-1]] = np.random.random(4)
-        
-        step = size - 1
-        scale = 1.0
-        
-        while step > 1:
-            half = step // 2
-            for i in range(0, size-1, step):
-                for j in range(0, size-1, step):
-                    avg = (heightmap[i, j] + heightmap[i+step, j] + heightmap[i, j+step] + heightmap[i+step, j+step]) / 4
-                    heightmap[i+half, j+half] = avg + (np.random.random() - 0.5) * scale
-            step //= 2
-            scale *= roughness
-        
-        return heightmap
+        return diamond_square(size, roughness, seed)
     
     @staticmethod
     def apply_realistic_lighting(mesh: trimesh.Trimesh, light_setup: str) -> trimesh.Trimesh:
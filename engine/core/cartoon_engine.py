@@ -2,6 +2,8 @@ import numpy as np
 import trimesh
 from typing import List, Dict, Tuple
 import cv2
+from ..procedural.mesh_builder import MeshBuilder
+from ..procedural.seeding import SeedLike
 
 class CartoonEngine:
     """Production cartoon rendering engine with NPR techniques"""
@@ -143,94 +145,61 @@ class CartoonEngine:
     @staticmethod
     def generate_cartoon_character(character_type: str = 'hero') -> trimesh.Trimesh:
         """Generate stylized cartoon character"""
-        meshes = []
+        builder = MeshBuilder()
         
         if character_type == 'hero':
             # Large head (cartoon proportions)
-            head = trimesh.creation.icosphere(subdivisions=3, radius=1.2)
-            head.apply_translation([0, 2.5, 0])
-            head.visual.vertex_colors = [255, 220, 177, 255]
-            meshes.append(head)
+            builder.icosphere(subdivisions=3, radius=1.2, translation=[0, 2.5, 0], color=[255, 220, 177, 255])
             
             # Eyes
             for x in [-0.4, 0.4]:
-                eye = trimesh.creation.icosphere(subdivisions=2, radius=0.25)
-                eye.apply_translation([x, 2.7, 0.8])
-                eye.visual.vertex_colors = [255, 255, 255, 255]
-                meshes.append(eye)
+                builder.icosphere(subdivisions=2, radius=0.25, translation=[x, 2.7, 0.8], color=[255, 255, 255, 255])
                 
-                pupil = trimesh.creation.icosphere(subdivisions=1, radius=0.12)
-                pupil.apply_translation([x, 2.7, 0.95])
-                pupil.visual.vertex_colors = [0, 0, 0, 255]
-                meshes.append(pupil)
+                builder.icosphere(subdivisions=1, radius=0.12, translation=[x, 2.7, 0.95], color=[0, 0, 0, 255])
             
             # Body (muscular)
-            body = trimesh.creation.capsule(radius=0.6, height=1.5)
-            body.apply_translation([0, 1.2, 0])
-            body.visual.vertex_colors = [0, 100, 200, 255]
-            meshes.append(body)
+            builder.capsule(radius=0.6, height=1.5, translation=[0, 1.2, 0], color=[0, 100, 200, 255])
             
             # Arms
             for x in [-0.8, 0.8]:
-                arm = trimesh.creation.capsule(radius=0.25, height=1.2)
-                arm.apply_transform(trimesh.transformations.rotation_matrix(np.pi/6 * (-1 if x < 0 else 1), [0, 0, 1]))
-                arm.apply_translation([x, 1.2, 0])
-                arm.visual.vertex_colors = [255, 220, 177, 255]
-                meshes.append(arm)
+                builder.capsule(radius=0.25, height=1.2, transform=trimesh.transformations.rotation_matrix(np.pi/6 * (-1 if x < 0 else 1), [0, 0, 1]), translation=[x, 1.2, 0], color=[255, 220, 177, 255])
             
             # Legs
             for x in [-0.3, 0.3]:
-                leg = trimesh.creation.capsule(radius=0.3, height=1.5)
-                leg.apply_translation([x, 0.3, 0])
-                leg.visual.vertex_colors = [0, 100, 200, 255]
-                meshes.append(leg)
+                builder.capsule(radius=0.3, height=1.5, translation=[x, 0.3, 0], color=[0, 100, 200, 255])
         
         elif character_type == 'villain':
             # Angular features
-            head = trimesh.creation.box(extents=[1.5, 1.5, 1.5])
-            head.apply_translation([0, 2.5, 0])
-            head.visual.vertex_colors = [150, 150, 150, 255]
-            meshes.append(head)
+            builder.box(extents=[1.5, 1.5, 1.5], translation=[0, 2.5, 0], color=[150, 150, 150, 255])
             
             # Red eyes
             for x in [-0.4, 0.4]:
-                eye = trimesh.creation.icosphere(subdivisions=2, radius=0.2)
-                eye.apply_translation([x, 2.6, 0.7])
-                eye.visual.vertex_colors = [255, 0, 0, 255]
-                meshes.append(eye)
+                builder.icosphere(subdivisions=2, radius=0.2, translation=[x, 2.6, 0.7], color=[255, 0, 0, 255])
             
             # Dark body
-            body = trimesh.creation.box(extents=[1.2, 2, 0.8])
-            body.apply_translation([0, 1, 0])
-            body.visual.vertex_colors = [50, 0, 50, 255]
-            meshes.append(body)
+            builder.box(extents=[1.2, 2, 0.8], translation=[0, 1, 0], color=[50, 0, 50, 255])
         
-        character = trimesh.util.concatenate(meshes)
-        return CartoonEngine.cartoonify_mesh(character, 'toon')
+        return CartoonEngine.cartoonify_mesh(builder.build(), 'toon')
     
     @staticmethod
-    def generate_cartoon_environment(env_type: str = 'city') -> List[trimesh.Trimesh]:
+    def generate_cartoon_environment(env_type: str = 'city', seed: SeedLike = None) -> List[trimesh.Trimesh]:
         """Generate cartoon environment"""
+        rng = np.random.default_rng(seed)
         meshes = []
         
         if env_type == 'city':
             # Stylized buildings
             for i in range(20):
-                x = np.random.uniform(-50, 50)
-                z = np.random.uniform(-50, 50)
-                height = np.random.uniform(10, 40)
-                width = np.random.uniform(5, 15)
+                x = rng.uniform(-50, 50)
+                z = rng.uniform(-50, 50)
+                height = rng.uniform(10, 40)
+                width = rng.uniform(5, 15)
                 
                 building = trimesh.creation.box(extents=[width, height, width])
                 building.apply_translation([x, height/2, z])
                 
                 # Bright colors
-                color = [
-                    np.random.randint(100, 255),
-                    np.random.randint(100, 255),
-                    np.random.randint(100, 255),
-                    255
-                ]
+                color = [*rng.integers(100, 255, 3), 255]
                 building.visual.vertex_colors = color
                 
                 cartoon_building = CartoonEngine.cartoonify_mesh(building, 'toon')
@@ -239,8 +208,8 @@ class CartoonEngine:
         elif env_type == 'forest':
             # Stylized trees
             for i in range(50):
-                x = np.random.uniform(-50, 50)
-                z = np.random.uniform(-50, 50)
+                x = rng.uniform(-50, 50)
+                z = rng.uniform(-50, 50)
                 
                 trunk = trimesh.creation.cylinder(radius=0.5, height=8, sections=6)
                 trunk.apply_translation([x, 4, z])
@@ -279,15 +248,17 @@ class CartoonEngine:
         return blur_meshes
     
     @staticmethod
-    def generate_cartoon_effects(effect_type: str, position: np.ndarray = np.array([0, 0, 0])) -> trimesh.Trimesh:
+    def generate_cartoon_effects(effect_type: str, position: np.ndarray = np.array([0, 0, 0]),
+                                 seed: SeedLike = None) -> trimesh.Trimesh:
         """Generate cartoon effects (explosions, speed lines, etc)"""
+        rng = np.random.default_rng(seed)
         
         if effect_type == 'explosion':
             particles = []
             for i in range(50):
-                angle_h = np.random.uniform(0, 2*np.pi)
-                angle_v = np.random.uniform(-np.pi/4, np.pi/4)
-                distance = np.random.uniform(1, 5)
+                angle_h = rng.uniform(0, 2*np.pi)
+                angle_v = rng.uniform(-np.pi/4, np.pi/4)
+                distance = rng.uniform(1, 5)
                 
                 x = position[0] + distance * np.cos(angle_h) * np.cos(angle_v)
                 y = position[1] + distance * np.sin(angle_v)
@@ -297,7 +268,7 @@ class CartoonEngine:
                 particle.apply_translation([x, y, z])
                 
                 # Fire colors
-                color = [255, np.random.randint(100, 200), 0, 255]
+                color = [255, rng.integers(100, 200), 0, 255]
                 particle.visual.vertex_colors = color
                 particles.append(particle)
             
@@ -4,12 +4,21 @@ from typing import Dict, List, Any, Optional, Callable
 from ..generators.text_to_3d import TextTo3DGenerator
 from ..generators.image_to_3d import ImageTo3DGenerator
 from ..rendering.renderer import AdvancedRenderer
+from ..rendering.lod import MIN_LOD_FACES, simplify_chain
 from ..core.physics_engine import PhysicsEngine, Collision
-from ..core.nlp_processor import ObjectDescription
+from ..core.nlp_processor import ObjectDescription, ShapeType
+from ..core.session_journal import SessionJournal
+from ..core.scene_format import write_scene, read_scene, PHYSICS_STATE_SIZE
 import trimesh
 import time
 import threading
+import queue
+import hashlib
 import json
+import uuid
+import re
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
 import os
 
 class GameObject:
@@ -19,6 +28,8 @@ class GameObject:
         self.description = description
         self.transform = np.eye(4)
         self.physics_body_id = None
+        self.prototype_key = None
+        self.material_overrides = {}
         self.components = {}
         self.active = True
         self.tags = set()
@@ -39,7 +50,17 @@ class GameObject:
         return tag in self.tags
 
 class GameEngine:
-    def __init__(self, width: int = 1024, height: int = 768, enable_physics: bool = True):
+    # Material used for bounding-box proxies while a generation job is in flight
+    PLACEHOLDER_MATERIAL = {
+        'albedo': [0.5, 0.5, 0.5],
+        'metallic': 0.0,
+        'roughness': 1.0,
+        'ao': 1.0
+    }
+    
+    def __init__(self, width: int = 1024, height: int = 768, enable_physics: bool = True,
+                 generation_workers: int = 2, session_id: str = None, gpu_memory_budget_mb: float = None,
+                 target_fps: float = None):
         # Initialize display
         pygame.init()
         self.width = width
@@ -53,6 +74,10 @@ class GameEngine:
         
         # Core systems
         self.renderer = AdvancedRenderer(width, height)
+        if gpu_memory_budget_mb is not None:
+            self.renderer.gpu_memory_budget = int(gpu_memory_budget_mb * 1024 * 1024)
+        if target_fps:
+            self.renderer.target_frame_time = 1000.0 / target_fps
         self.physics = PhysicsEngine() if enable_physics else None
         
         # Generators
@@ -81,12 +106,24 @@ class GameEngine:
         self.asset_directory = "assets"
         os.makedirs(self.asset_directory, exist_ok=True)
         
+        # Append-only journal of object creation/mutation for this session
+        self.session_id = session_id or uuid.uuid4().hex
+        self.journal = SessionJournal(
+            os.path.join(self.asset_directory, "journals", f"{self.session_id}.jsonl")
+        )
+        
         # Performance monitoring
         self.performance_stats = {
             'fps': 0,
             'frame_time': 0,
             'objects_rendered': 0,
-            'physics_bodies': 0
+            'physics_bodies': 0,
+            'pending_generations': 0,
+            'objects_drawn': 0,
+            'objects_culled': 0,
+            'gpu_memory_bytes': 0,
+            'gpu_time_ms': 0.0,
+            'resolution_scale': 1.0
         }
         
         # Event system
@@ -96,6 +133,25 @@ class GameEngine:
         self.update_thread = None
         self.thread_running = False
         
+        # Background generation (results are integrated on the render thread)
+        self.generation_executor = ThreadPoolExecutor(max_workers=generation_workers)
+        self.pending_generations = {}
+        self.completed_generations = queue.Queue()
+        self.max_integrations_per_frame = 4
+        self._placeholder_mesh = None
+        
+        # Shared geometry/material/inertia for identical objects, keyed by
+        # normalized description or mesh content hash
+        self.prototypes: Dict[str, Dict] = {}
+        self.prototype_lock = threading.Lock()
+        
+        # Simplified meshes built per prototype for distance-based LOD in the renderer. Chains are
+        # decimated on the generation pool after a prototype is first drawn, only for meshes with at
+        # least lod_min_faces faces, and attached on the render thread when ready
+        self.generate_lods = True
+        self.lod_min_faces = MIN_LOD_FACES
+        self.pending_lods: Dict[str, Any] = {}
+        
         # Setup physics callbacks
         if self.physics:
             self.physics.add_collision_callback(self._on_collision)
@@ -114,52 +170,16 @@ class GameEngine:
     def add_object_from_text(self, description: str, 
                            position: tuple = (0, 0, 0),
                            enable_physics: bool = True,
-                           physics_properties: Dict = None) -> str:
+                           physics_properties: Dict = None,
+                           material_override: Dict = None,
+                           quality: Optional[str] = None,
+                           budget_ms: Optional[float] = None) -> str:
         """Add 3D object generated from text with full functionality"""
-        mesh = self.text_generator.generate_from_text(description)
-        obj_desc = self.text_generator.nlp.parse_description(description)
-        
         obj_id = f"text_object_{self.object_counter}"
         self.object_counter += 1
         
-        # Create game object
-        game_obj = GameObject(obj_id, mesh, obj_desc)
-        
-        # Set initial transform
-        transform = np.eye(4)
-        transform[:3, 3] = position
-        game_obj.transform = transform
-        
-        # Add to renderer
-        material = {
-            'albedo': obj_desc.color,
-            'metallic': 0.1 if obj_desc.material == 'metallic' else 0.0,
-            'roughness': 0.2 if obj_desc.material == 'smooth' else 0.8,
-            'ao': 1.0
-        }
-        self.renderer.add_mesh(obj_id, mesh, material)
-        
-        # Add physics if enabled
-        if enable_physics and self.physics:
-            physics_props = physics_properties or {}
-            mass = physics_props.get('mass', obj_desc.properties.get('mass', 1.0))
-            restitution = physics_props.get('restitution', 0.5)
-            friction = physics_props.get('friction', 0.7)
-            is_static = physics_props.get('is_static', False)
-            
-            physics_body_id = self.physics.add_rigid_body(
-                obj_id, mesh, np.array(position), mass=mass,
-                restitution=restitution, friction=friction, is_static=is_static
-            )
-            game_obj.physics_body_id = physics_body_id
-        
-        # Add animation component if specified
-        if 'animate' in obj_desc.properties:
-            self._add_animation_component(game_obj, obj_desc.properties['animate'])
-        
-        # Store object
-        self.objects[obj_id] = game_obj
-        self.scenes[self.current_scene].add(obj_id)
+        result = self._generate_text_object(description, enable_physics, physics_properties, quality, budget_ms)
+        self._attach_generated_object(obj_id, result, position, material_override=material_override)
         
         # Save to cache
         self._cache_object(obj_id, description, 'text')
@@ -170,52 +190,371 @@ class GameEngine:
                             position: tuple = (0, 0, 0),
                             generation_method: str = 'advanced',
                             enable_physics: bool = True,
-                            physics_properties: Dict = None) -> str:
+                            physics_properties: Dict = None,
+                            quality: Optional[str] = None,
+                            budget_ms: Optional[float] = None) -> str:
         """Add 3D object generated from image with advanced options"""
-        mesh = self.image_generator.generate_from_image(image_path, generation_method)
+        obj_id = f"image_object_{self.object_counter}"
+        self.object_counter += 1
         
+        result = self._generate_image_object(image_path, generation_method, enable_physics, physics_properties,
+                                             quality, budget_ms)
+        self._attach_generated_object(obj_id, result, position)
+        
+        # Save to cache
+        self._cache_object(obj_id, image_path, 'image')
+        
+        return obj_id
+    
+    def add_object_from_text_async(self, description: str,
+                                 position: tuple = (0, 0, 0),
+                                 enable_physics: bool = True,
+                                 physics_properties: Dict = None,
+                                 material_override: Dict = None,
+                                 quality: Optional[str] = None,
+                                 budget_ms: Optional[float] = None) -> str:
+        """Queue text generation on the worker pool and return the object ID immediately.
+        
+        A bounding-box placeholder is shown until the mesh is ready; the real mesh
+        and physics body are swapped in on the render thread, which then emits
+        an ``object_ready`` event.
+        """
+        obj_id = f"text_object_{self.object_counter}"
+        self.object_counter += 1
+        
+        # Known descriptions are instanced straight from their prototype
+        if self._get_prototype(self._text_prototype_key(description, quality, budget_ms)) is not None:
+            result = self._generate_text_object(description, enable_physics, physics_properties, quality, budget_ms)
+            self._attach_generated_object(obj_id, result, position, material_override=material_override)
+            self._cache_object(obj_id, description, 'text')
+            self._emit_object_ready(obj_id, result, description, 'text', 0.0)
+            return obj_id
+        
+        self._add_placeholder_object(obj_id, position)
+        self._submit_generation(
+            obj_id, position, description, 'text', material_override,
+            self._generate_text_object, description, enable_physics, physics_properties, quality, budget_ms
+        )
+        
+        return obj_id
+    
+    def add_object_from_image_async(self, image_path: str,
+                                  position: tuple = (0, 0, 0),
+                                  generation_method: str = 'advanced',
+                                  enable_physics: bool = True,
+                                  physics_properties: Dict = None,
+                                  quality: Optional[str] = None,
+                                  budget_ms: Optional[float] = None) -> str:
+        """Queue image generation on the worker pool and return the object ID immediately"""
         obj_id = f"image_object_{self.object_counter}"
         self.object_counter += 1
         
-        # Create game object
-        game_obj = GameObject(obj_id, mesh)
+        self._add_placeholder_object(obj_id, position)
+        self._submit_generation(
+            obj_id, position, image_path, 'image', None,
+            self._generate_image_object, image_path, generation_method, enable_physics, physics_properties,
+            quality, budget_ms
+        )
         
-        # Set initial transform
-        transform = np.eye(4)
-        transform[:3, 3] = position
-        game_obj.transform = transform
+        return obj_id
+    
+    def is_object_ready(self, obj_id: str) -> bool:
+        """Check whether an object has its final mesh (not a generation placeholder)"""
+        return obj_id in self.objects and obj_id not in self.pending_generations
+    
+    def _text_prototype_key(self, description: str, quality: Optional[str] = None,
+                            budget_ms: Optional[float] = None) -> str:
+        """Normalize a description so equivalent prompts at the same quality share one prototype"""
+        key = 'text:' + ' '.join(description.lower().strip(' .!?').split())
+        if quality is not None or budget_ms is not None:
+            key += f'|{quality}|{budget_ms}'
+        return key
+    
+    def _mesh_prototype_key(self, mesh: trimesh.Trimesh) -> str:
+        """Key a prototype by mesh content for sources without a stable description"""
+        digest = hashlib.sha1()
+        digest.update(np.ascontiguousarray(mesh.vertices, dtype=np.float64).tobytes())
+        digest.update(np.ascontiguousarray(mesh.faces, dtype=np.int64).tobytes())
+        return 'mesh:' + digest.hexdigest()
+    
+    def _get_prototype(self, key: str) -> Optional[Dict]:
+        with self.prototype_lock:
+            return self.prototypes.get(key)
+    
+    def _create_prototype(self, key: str, mesh: trimesh.Trimesh, description: Optional[ObjectDescription],
+                          material: Dict, animation: Optional[str]) -> Dict:
+        """Build shared per-shape data: geometry, LOD chain, base material and unit-mass inertia"""
+        unit_inertia = None
+        if self.physics and mesh is not None:
+            # Inertia scales linearly with mass, so instances only rescale this
+            unit_inertia = self.physics._calculate_inertia_tensor(mesh, 1.0)
         
-        # Add to renderer with texture from original image
-        material = {
-            'albedo': [1.0, 1.0, 1.0],  # White base for textured objects
-            'metallic': 0.0,
-            'roughness': 0.6,
-            'ao': 1.0
+        return {
+            'key': key,
+            'mesh': mesh,
+            'lods': None,
+            'description': description,
+            'material': material,
+            'animation': animation,
+            'unit_inertia': unit_inertia,
+            'instances': 0
         }
-        self.renderer.add_mesh(obj_id, mesh, material)
+    
+    def _instance_physics(self, prototype: Dict, enable_physics: bool,
+                          physics_properties: Optional[Dict], defaults: Dict) -> Optional[Dict]:
+        """Resolve per-instance physics settings against the prototype's shape data"""
+        if not (enable_physics and self.physics):
+            return None
         
-        # Add physics if enabled
-        if enable_physics and self.physics:
-            physics_props = physics_properties or {}
-            mass = physics_props.get('mass', 1.0)
-            restitution = physics_props.get('restitution', 0.3)
-            friction = physics_props.get('friction', 0.8)
-            is_static = physics_props.get('is_static', False)
+        physics_props = physics_properties or {}
+        physics = {name: physics_props.get(name, default) for name, default in defaults.items()}
+        
+        if physics['is_static'] or prototype['unit_inertia'] is None:
+            physics['inertia_tensor'] = None
+        else:
+            physics['inertia_tensor'] = prototype['unit_inertia'] * physics['mass']
+        
+        return physics
+    
+    def _generate_text_object(self, description: str, enable_physics: bool,
+                              physics_properties: Optional[Dict], quality: Optional[str] = None,
+                              budget_ms: Optional[float] = None) -> Dict:
+        """Run text generation and physics precomputation (safe to call off the render thread)"""
+        key = self._text_prototype_key(description, quality, budget_ms)
+        prototype = self._get_prototype(key)
+        
+        if prototype is None:
+            mesh, obj_desc = self.text_generator.generate_with_description(description, quality=quality,
+                                                                           budget_ms=budget_ms)
             
+            material = {
+                'albedo': obj_desc.color,
+                'metallic': 0.1 if obj_desc.material == 'metallic' else 0.0,
+                'roughness': 0.2 if obj_desc.material == 'smooth' else 0.8,
+                'ao': 1.0
+            }
+            prototype = self._create_prototype(key, mesh, obj_desc, material, obj_desc.properties.get('animate'))
+        
+        description = prototype['description']
+        physics = self._instance_physics(prototype, enable_physics, physics_properties, {
+            'mass': description.properties.get('mass', 1.0) if description else 1.0,
+            'restitution': 0.5,
+            'friction': 0.7,
+            'is_static': False
+        })
+        
+        return {'prototype': prototype, 'physics': physics}
+    
+    def _generate_image_object(self, image_path: str, generation_method: str, enable_physics: bool,
+                               physics_properties: Optional[Dict], quality: Optional[str] = None,
+                               budget_ms: Optional[float] = None) -> Dict:
+        """Run image generation and physics precomputation (safe to call off the render thread)"""
+        mesh = self.image_generator.generate_from_image(image_path, generation_method, quality, budget_ms)
+        
+        key = self._mesh_prototype_key(mesh)
+        prototype = self._get_prototype(key)
+        
+        if prototype is None:
+            # White base for textured objects
+            material = {
+                'albedo': [1.0, 1.0, 1.0],
+                'metallic': 0.0,
+                'roughness': 0.6,
+                'ao': 1.0
+            }
+            prototype = self._create_prototype(key, mesh, None, material, None)
+        
+        physics = self._instance_physics(prototype, enable_physics, physics_properties, {
+            'mass': 1.0,
+            'restitution': 0.3,
+            'friction': 0.8,
+            'is_static': False
+        })
+        
+        return {'prototype': prototype, 'physics': physics}
+    
+    def _attach_generated_object(self, obj_id: str, result: Dict, position: tuple,
+                                 game_obj: GameObject = None,
+                                 material_override: Dict = None,
+                                 vertex_data: np.ndarray = None) -> GameObject:
+        """Register a generated instance with the renderer, physics and scene (render thread only)"""
+        # The first registered prototype wins, so concurrent duplicates collapse onto one
+        with self.prototype_lock:
+            prototype = self.prototypes.setdefault(result['prototype']['key'], result['prototype'])
+            prototype['instances'] += 1
+        mesh = prototype['mesh']
+        
+        if game_obj is None:
+            # Create game object
+            game_obj = GameObject(obj_id, mesh, prototype['description'])
+            
+            # Set initial transform
+            transform = np.eye(4)
+            transform[:3, 3] = position
+            game_obj.transform = transform
+        else:
+            game_obj.mesh = mesh
+            game_obj.description = prototype['description']
+            game_obj.tags.discard('placeholder')
+        
+        game_obj.prototype_key = prototype['key']
+        game_obj.material_overrides = dict(material_override or {})
+        
+        # Instances without overrides share the prototype's material dict
+        material = prototype['material']
+        if game_obj.material_overrides:
+            material = {**material, **game_obj.material_overrides}
+        
+        # Add to renderer (shares the prototype's buffers and replaces any placeholder)
+        self.renderer.add_mesh(obj_id, mesh, material, prototype_key=prototype['key'],
+                               vertex_data=vertex_data, lods=prototype.get('lods'))
+        self._request_lods(prototype)
+        self.renderer.update_object_transform(obj_id, game_obj.transform)
+        
+        # Add physics if enabled
+        physics = result['physics']
+        if physics and self.physics:
             physics_body_id = self.physics.add_rigid_body(
-                obj_id, mesh, np.array(position), mass=mass,
-                restitution=restitution, friction=friction, is_static=is_static
+                obj_id, mesh, game_obj.transform[:3, 3].copy(), mass=physics['mass'],
+                restitution=physics['restitution'], friction=physics['friction'],
+                is_static=physics['is_static'], inertia_tensor=physics['inertia_tensor']
             )
             game_obj.physics_body_id = physics_body_id
         
+        # Add animation component if specified
+        if prototype['animation']:
+            self._add_animation_component(game_obj, prototype['animation'])
+        
         # Store object
         self.objects[obj_id] = game_obj
         self.scenes[self.current_scene].add(obj_id)
         
-        # Save to cache
-        self._cache_object(obj_id, image_path, 'image')
+        return game_obj
+    
+    def _release_prototype(self, key: str):
+        """Drop one instance reference; unused prototypes are forgotten"""
+        with self.prototype_lock:
+            prototype = self.prototypes.get(key)
+            if prototype is None:
+                return
+            prototype['instances'] -= 1
+            if prototype['instances'] <= 0:
+                del self.prototypes[key]
+    
+    def _add_placeholder_object(self, obj_id: str, position: tuple):
+        """Show a unit bounding-box proxy while generation runs"""
+        if self._placeholder_mesh is None:
+            self._placeholder_mesh = trimesh.creation.box(extents=[1.0, 1.0, 1.0])
         
-        return obj_id
+        game_obj = GameObject(obj_id, self._placeholder_mesh)
+        transform = np.eye(4)
+        transform[:3, 3] = position
+        game_obj.transform = transform
+        game_obj.add_tag('placeholder')
+        
+        self.renderer.add_mesh(obj_id, self._placeholder_mesh, self.PLACEHOLDER_MATERIAL,
+                               prototype_key='placeholder')
+        self.renderer.update_object_transform(obj_id, transform)
+        
+        self.objects[obj_id] = game_obj
+        self.scenes[self.current_scene].add(obj_id)
+    
+    def _submit_generation(self, obj_id: str, position: tuple, source: str, source_type: str,
+                           material_override: Optional[Dict], generate: Callable, *args):
+        """Run a generation function on the worker pool and queue its result"""
+        def on_done(future):
+            self.completed_generations.put((obj_id, future))
+        
+        future = self.generation_executor.submit(generate, *args)
+        self.pending_generations[obj_id] = {
+            'future': future,
+            'position': position,
+            'source': source,
+            'type': source_type,
+            'material_override': material_override,
+            'submitted_at': time.time()
+        }
+        future.add_done_callback(on_done)
+    
+    def _emit_object_ready(self, obj_id: str, result: Dict, source: str, source_type: str,
+                           generation_time: float):
+        mesh = result['prototype']['mesh']
+        self.emit_event('object_ready', {
+            'object_id': obj_id,
+            'source': source,
+            'type': source_type,
+            'vertices': len(mesh.vertices),
+            'faces': len(mesh.faces),
+            'quality': mesh.metadata.get('quality'),
+            'generation_time': generation_time
+        })
+    
+    def process_completed_generations(self, max_items: int = None) -> int:
+        """Swap finished generation results into the scene without blocking.
+        
+        Must be called from the thread that owns the GL context; the main loop
+        calls it once per frame. Returns the number of results handled.
+        """
+        if max_items is None:
+            max_items = self.max_integrations_per_frame
+        
+        self._attach_finished_lods()
+        
+        handled = 0
+        while handled < max_items:
+            try:
+                obj_id, future = self.completed_generations.get_nowait()
+            except queue.Empty:
+                break
+            handled += 1
+            
+            pending = self.pending_generations.pop(obj_id, None)
+            game_obj = self.objects.get(obj_id)
+            if pending is None or future.cancelled() or game_obj is None:
+                # Object was removed while generating
+                continue
+            
+            error = future.exception()
+            if error is not None:
+                # Drop the placeholder so failed requests don't leave boxes in the scene
+                self.remove_object(obj_id)
+                self.emit_event('object_failed', {
+                    'object_id': obj_id,
+                    'source': pending['source'],
+                    'error': str(error)
+                })
+                continue
+            
+            result = future.result()
+            self._attach_generated_object(obj_id, result, pending['position'], game_obj,
+                                          material_override=pending['material_override'])
+            self._cache_object(obj_id, pending['source'], pending['type'])
+            
+            self._emit_object_ready(obj_id, result, pending['source'], pending['type'],
+                                    time.time() - pending['submitted_at'])
+        
+        return handled
+    
+    def _request_lods(self, prototype: Dict):
+        """Start simplifying a prototype's LOD chain in the background, once, if it is worth having"""
+        mesh = prototype['mesh']
+        if (not self.generate_lods or mesh is None or prototype.get('lods') is not None
+                or prototype['key'] in self.pending_lods or len(mesh.faces) < self.lod_min_faces):
+            return
+        self.pending_lods[prototype['key']] = self.generation_executor.submit(simplify_chain, mesh)
+    
+    def _attach_finished_lods(self):
+        """Hand finished LOD chains to the renderer (render thread only)"""
+        for key, future in list(self.pending_lods.items()):
+            if not future.done():
+                continue
+            del self.pending_lods[key]
+            
+            prototype = self._get_prototype(key)
+            if prototype is None or future.cancelled() or future.exception() is not None:
+                continue
+            prototype['lods'] = future.result()
+            self.renderer.add_lods(key, prototype['lods'])
     
     def _add_animation_component(self, game_obj: GameObject, animation_type: str):
         """Add animation component to game object"""
@@ -266,6 +605,15 @@ class GameEngine:
         
         obj.transform = transform
         self.renderer.update_object_transform(obj_id, transform)
+        
+        changes = {}
+        if position:
+            changes['position'] = [float(v) for v in position]
+        if rotation:
+            changes['rotation'] = [float(v) for v in rotation]
+        if scale:
+            changes['scale'] = [float(v) for v in scale]
+        self.journal.record_update(obj_id, **changes)
     
     def apply_force(self, obj_id: str, force: np.ndarray, point: np.ndarray = None):
         """Apply force to object"""
@@ -288,12 +636,22 @@ class GameEngine:
         
         obj = self.objects[obj_id]
         
+        # Drop any in-flight generation; its result is discarded on completion
+        pending = self.pending_generations.pop(obj_id, None)
+        if pending is not None:
+            pending['future'].cancel()
+        
         # Remove from physics
         if obj.physics_body_id and self.physics:
             self.physics.remove_body(obj.physics_body_id)
         
-        # Remove from renderer (would need to implement in renderer)
-        # self.renderer.remove_mesh(obj_id)
+        if obj.prototype_key:
+            self._release_prototype(obj.prototype_key)
+        
+        # Release its render object (and its geometry, once no other object shares it)
+        self.renderer.remove_mesh(obj_id)
+        
+        self.journal.record_remove(obj_id)
         
         # Remove from scene
         if obj_id in self.scenes[self.current_scene]:
@@ -353,6 +711,9 @@ class GameEngine:
                 # Handle events
                 self._handle_events()
                 
+                # Swap in finished background generations (never waits on workers)
+                self.process_completed_generations()
+                
                 if not self.paused:
                     # Update animations
                     self._update_animations(dt)
@@ -498,6 +859,10 @@ class GameEngine:
         
         for obj in self.objects.values():
             if obj.physics_body_id:
+                # Static bodies never move on their own; skipping them keeps their render state clean
+                body = self.physics.bodies.get(obj.physics_body_id)
+                if body is not None and body.is_static:
+                    continue
                 transform = self.physics.get_transform_matrix(obj.physics_body_id)
                 obj.transform = transform
                 self.renderer.update_object_transform(obj.id, transform)
@@ -509,6 +874,8 @@ class GameEngine:
         
         # Update performance stats
         self.performance_stats['objects_rendered'] = len(self.objects)
+        self.performance_stats.update(self.renderer.render_stats)
+        self.performance_stats['pending_generations'] = len(self.pending_generations)
         if self.physics:
             self.performance_stats['physics_bodies'] = len(self.physics.bodies)
     
@@ -527,30 +894,273 @@ class GameEngine:
         )
     
     def _cache_object(self, obj_id: str, source: str, source_type: str):
-        """Cache object data for quick loading"""
-        cache_data = {
-            'id': obj_id,
-            'source': source,
-            'type': source_type,
-            'timestamp': time.time()
+        """Record object creation in the session journal (buffered, written in the background)"""
+        obj = self.objects.get(obj_id)
+        if obj is None:
+            self.journal.record_create(obj_id, source, source_type)
+            return
+        
+        self.journal.record_create(
+            obj_id, source, source_type,
+            position=[float(v) for v in obj.transform[:3, 3]],
+            prototype=obj.prototype_key,
+            material_overrides=obj.material_overrides
+        )
+    
+    def save_scene(self, path: str) -> Dict:
+        """Save all ready objects to a chunked binary scene file.
+        
+        Geometry is written once per prototype as raw float32/uint32 blocks,
+        alongside a transform table, deduplicated materials and physics state.
+        """
+        journal_state = self.get_journal_objects()
+        
+        geometries, geometry_blocks, geometry_index = [], [], {}
+        materials, material_index = [], {}
+        objects, transforms = [], []
+        physics_state = []
+        
+        for obj_id, obj in self.objects.items():
+            if obj.has_tag('placeholder'):
+                continue
+            
+            key = obj.prototype_key or self._mesh_prototype_key(obj.mesh)
+            if key not in geometry_index:
+                prototype = self._get_prototype(key)
+                base_material = prototype['material'] if prototype else self.renderer.render_objects[obj_id]['material']
+                material_key = json.dumps(self._serializable_material(base_material), sort_keys=True)
+                if material_key not in material_index:
+                    material_index[material_key] = len(materials)
+                    materials.append(json.loads(material_key))
+                
+                unit_inertia = prototype['unit_inertia'] if prototype else None
+                geometry_index[key] = len(geometries)
+                geometries.append({
+                    'key': key,
+                    'material': material_index[material_key],
+                    'animation': prototype['animation'] if prototype else None,
+                    'unit_inertia': unit_inertia.tolist() if unit_inertia is not None else None,
+                    'description': self._serializable_description(prototype['description'] if prototype else None)
+                })
+                geometry_blocks.append((self.renderer.interleave_vertex_data(obj.mesh), obj.mesh.faces))
+            
+            row = np.zeros(PHYSICS_STATE_SIZE)
+            body = self.physics.bodies.get(obj.physics_body_id) if (self.physics and obj.physics_body_id) else None
+            if body is not None:
+                row[0:3] = body.position
+                row[3:6] = body.velocity
+                row[6:10] = body.rotation
+                row[10:13] = body.angular_velocity
+                row[13:17] = [body.mass, body.restitution, body.friction, float(body.is_static)]
+                row[17:26] = np.asarray(body.inertia_tensor).ravel()
+            
+            source = journal_state.get(obj_id, {})
+            objects.append({
+                'id': obj_id,
+                'geometry': geometry_index[key],
+                'material_overrides': self._serializable_material(obj.material_overrides),
+                'source': source.get('source'),
+                'type': source.get('type'),
+                'tags': sorted(obj.tags),
+                'physics': body is not None
+            })
+            transforms.append(obj.transform)
+            physics_state.append(row)
+        
+        metadata = {
+            'session_id': self.session_id,
+            'saved_at': time.time(),
+            'geometries': geometries,
+            'materials': materials,
+            'objects': objects,
+            'camera': {
+                name: np.asarray(self.camera_controller[name]).tolist()
+                for name in ('position', 'target', 'up', 'yaw', 'pitch')
+            }
         }
         
-        cache_file = os.path.join(self.asset_directory, f"{obj_id}_cache.json")
-        with open(cache_file, 'w') as f:
-            json.dump(cache_data, f)
+        write_scene(
+            path, metadata, geometry_blocks,
+            np.array(transforms).reshape(-1, 4, 4),
+            np.array(physics_state).reshape(-1, PHYSICS_STATE_SIZE)
+        )
+        
+        return {'path': path, 'objects': len(objects), 'geometries': len(geometries)}
+    
+    def load_scene(self, path: str, clear: bool = True, journal: bool = True) -> List[str]:
+        """Load a scene saved with ``save_scene``.
+        
+        The file is memory-mapped; vertex blocks are uploaded to the GPU straight
+        from the mapped pages and instances share prototypes as when saved.
+        Pass ``journal=False`` when restoring this session's own snapshot, whose
+        objects the journal already records.
+        """
+        scene = read_scene(path)
+        metadata = scene.metadata
+        
+        if clear:
+            for obj_id in list(self.objects.keys()):
+                self.remove_object(obj_id)
+        
+        # Rebuild (or reuse) one prototype per stored geometry block
+        prototypes = []
+        for index, geometry in enumerate(metadata['geometries']):
+            prototype = self._get_prototype(geometry['key'])
+            vertex_data = None
+            if prototype is None:
+                vertex_data, faces = scene.geometry_block(index)
+                mesh = trimesh.Trimesh(
+                    vertices=vertex_data[:, :3], faces=faces,
+                    vertex_normals=vertex_data[:, 3:6], process=False
+                )
+                unit_inertia = geometry['unit_inertia']
+                prototype = {
+                    'key': geometry['key'],
+                    'mesh': mesh,
+                    'description': self._restore_description(geometry.get('description')),
+                    'material': metadata['materials'][geometry['material']],
+                    'animation': geometry['animation'],
+                    'unit_inertia': np.array(unit_inertia) if unit_inertia is not None else None,
+                    'instances': 0
+                }
+            prototypes.append((prototype, vertex_data))
+        
+        # Keep newly generated IDs from colliding with loaded ones
+        for entry in metadata['objects']:
+            match = re.search(r'_(\d+)$', entry['id'])
+            if match:
+                self.object_counter = max(self.object_counter, int(match.group(1)) + 1)
+        
+        loaded = []
+        for i, entry in enumerate(metadata['objects']):
+            prototype, vertex_data = prototypes[entry['geometry']]
+            row = scene.physics[i]
+            
+            physics = None
+            if entry['physics'] and self.physics:
+                physics = {
+                    'mass': float(row[13]),
+                    'restitution': float(row[14]),
+                    'friction': float(row[15]),
+                    'is_static': bool(row[16]),
+                    'inertia_tensor': np.array(row[17:26]).reshape(3, 3)
+                }
+            
+            obj_id = entry['id']
+            prefix = re.sub(r'_\d+$', '', obj_id)
+            while obj_id in self.objects:
+                # Loading into a live scene: give the saved object a fresh ID instead of replacing one
+                obj_id = f"{prefix}_{self.object_counter}"
+                self.object_counter += 1
+            game_obj = GameObject(obj_id, prototype['mesh'])
+            game_obj.transform = np.array(scene.transforms[i], dtype=np.float64)
+            for tag in entry['tags']:
+                game_obj.add_tag(tag)
+            
+            self._attach_generated_object(
+                obj_id, {'prototype': prototype, 'physics': physics}, None, game_obj,
+                material_override=entry['material_overrides'], vertex_data=vertex_data
+            )
+            
+            if physics:
+                body = self.physics.bodies[obj_id]
+                with self.physics.lock:
+                    body.position = np.array(row[0:3])
+                    body.velocity = np.array(row[3:6])
+                    body.rotation = np.array(row[6:10])
+                    body.angular_velocity = np.array(row[10:13])
+            
+            if journal:
+                self._cache_object(obj_id, entry['source'], entry['type'] or 'scene')
+            loaded.append(obj_id)
+        
+        camera = metadata.get('camera')
+        if camera:
+            for name in ('yaw', 'pitch'):
+                self.camera_controller[name] = camera[name]
+            self.set_camera(np.array(camera['position']), np.array(camera['target']), np.array(camera['up']))
+        
+        return loaded
+    
+    def _serializable_description(self, description: Optional[ObjectDescription]) -> Optional[Dict]:
+        """Convert a parsed description to plain JSON types for the scene metadata"""
+        if description is None:
+            return None
+        data = dataclasses.asdict(description)
+        data['shape'] = description.shape.value
+        return json.loads(json.dumps(data, default=str))
+    
+    def _restore_description(self, data: Optional[Dict]) -> Optional[ObjectDescription]:
+        """Inverse of ``_serializable_description`` (None for scenes saved without one)"""
+        if data is None:
+            return None
+        return ObjectDescription(**{
+            **data,
+            'shape': ShapeType(data['shape']),
+            'color': tuple(data['color']),
+            'position': tuple(data['position']),
+            'rotation': tuple(data['rotation']),
+            'scale': tuple(data['scale'])
+        })
+    
+    def _serializable_material(self, material: Dict) -> Dict:
+        """Convert material values (tuples, numpy scalars) to plain JSON types"""
+        result = {}
+        for name, value in material.items():
+            if isinstance(value, (list, tuple, np.ndarray)):
+                result[name] = [float(v) for v in value]
+            elif isinstance(value, (int, float, np.number)):
+                result[name] = float(value)
+            else:
+                result[name] = value
+        return result
+    
+    def get_journal_objects(self) -> Dict[str, Dict]:
+        """Reconstruct this session's object list (source, type, latest transform) from the journal"""
+        self.journal.flush()
+        return self.journal.replay()
+    
+    def compact_journal(self):
+        """Rewrite the session journal as one record per live object"""
+        self.journal.compact()
+    
+    def build_static_batches(self, cell_size: float = 100.0) -> int:
+        """Merge static objects into per-material render batches
+        
+        Objects count as static when tagged ``'static'`` or backed by a static
+        physics body. Call once the scene is built; returns the batch count.
+        """
+        static_ids = []
+        for obj in self.objects.values():
+            body = self.physics.bodies.get(obj.physics_body_id) if self.physics and obj.physics_body_id else None
+            if obj.has_tag('static') or (body is not None and body.is_static):
+                static_ids.append(obj.id)
+        
+        return self.renderer.build_static_batches(static_ids, cell_size=cell_size)
     
     def get_performance_stats(self) -> Dict:
         """Get current performance statistics"""
         return self.performance_stats.copy()
     
-    def _cleanup(self):
-        """Cleanup resources"""
+    def release(self):
+        """Release this engine's threads and GPU resources
+        
+        Leaves pygame and the process-wide display alone, so the server can
+        drop one session's engine while the others keep running.
+        """
         self.thread_running = False
         if self.update_thread:
             self.update_thread.join()
         
+        self.generation_executor.shutdown(wait=False, cancel_futures=True)
+        self.journal.close()
+        
         if self.physics:
             self.physics.stop_simulation()
         
         self.renderer.cleanup()
+    
+    def _cleanup(self):
+        """Cleanup resources"""
+        self.release()
         pygame.quit()
\ No newline at end of file
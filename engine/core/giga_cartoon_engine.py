@@ -3,6 +3,8 @@ import trimesh
 from typing import List, Dict
 import cv2
 from concurrent.futures import ThreadPoolExecutor
+from ..procedural.mesh_builder import MeshBuilder
+from ..procedural.seeding import SeedLike
 
 class GigaCartoonEngine:
     """Advanced cartoon generation with Disney/Pixar quality"""
@@ -72,8 +74,10 @@ class GigaCartoonEngine:
         return outline
     
     @staticmethod
-    def generate_cartoon_movie_scene(duration_seconds: int = 60, fps: int = 60, style: str = 'pixar') -> List[Dict]:
+    def generate_cartoon_movie_scene(duration_seconds: int = 60, fps: int = 60, style: str = 'pixar',
+                                     seed: SeedLike = None) -> List[Dict]:
         """Generate complete animated movie scene"""
+        rng = np.random.default_rng(seed)
         frames = []
         total_frames = duration_seconds * fps
         
@@ -81,15 +85,15 @@ class GigaCartoonEngine:
         from engine.generators.giga_world_generator import GigaWorldGenerator
         
         # Characters
-        hero = GigaWorldGenerator.generate_person('civilian', 'adult', 'average', 'standing')
+        hero = GigaWorldGenerator.generate_person('civilian', 'adult', 'average', 'standing', seed=rng)
         hero = GigaCartoonEngine.cartoonify_advanced(hero, style)
         
-        villain = GigaWorldGenerator.generate_person('civilian', 'adult', 'muscular', 'standing')
+        villain = GigaWorldGenerator.generate_person('civilian', 'adult', 'muscular', 'standing', seed=rng)
         villain = GigaCartoonEngine.cartoonify_advanced(villain, style)
         
         # Environment
         from engine.core.cartoon_engine import CartoonEngine
-        environment = CartoonEngine.generate_cartoon_environment('city')
+        environment = CartoonEngine.generate_cartoon_environment('city', seed=rng)
         
         # Animate
         for frame in range(total_frames):
@@ -116,111 +120,66 @@ class GigaCartoonEngine:
     @staticmethod
     def generate_cartoon_character_advanced(character_type: str = 'hero', style: str = 'disney') -> trimesh.Trimesh:
         """Generate advanced cartoon character"""
-        meshes = []
+        builder = MeshBuilder()
         
         if character_type == 'hero':
             # Large expressive head (cartoon proportions 1:3)
-            head = trimesh.creation.icosphere(subdivisions=4, radius=1.5)
-            head.apply_translation([0, 0, 3.5])
-            meshes.append(head)
+            builder.icosphere(subdivisions=4, radius=1.5, translation=[0, 0, 3.5])
             
             # Large eyes
             for x in [-0.5, 0.5]:
-                eye_white = trimesh.creation.icosphere(subdivisions=3, radius=0.4)
-                eye_white.apply_translation([x, 0.8, 3.7])
-                eye_white.visual.vertex_colors = [255, 255, 255, 255]
-                meshes.append(eye_white)
+                builder.icosphere(subdivisions=3, radius=0.4, translation=[x, 0.8, 3.7], color=[255, 255, 255, 255])
                 
-                pupil = trimesh.creation.icosphere(subdivisions=2, radius=0.2)
-                pupil.apply_translation([x, 0.95, 3.8])
-                pupil.visual.vertex_colors = [0, 0, 0, 255]
-                meshes.append(pupil)
+                builder.icosphere(subdivisions=2, radius=0.2, translation=[x, 0.95, 3.8], color=[0, 0, 0, 255])
                 
                 # Highlight
-                highlight = trimesh.creation.icosphere(subdivisions=1, radius=0.08)
-                highlight.apply_translation([x + 0.1, 1.0, 3.9])
-                highlight.visual.vertex_colors = [255, 255, 255, 255]
-                meshes.append(highlight)
+                builder.icosphere(subdivisions=1, radius=0.08, translation=[x + 0.1, 1.0, 3.9], color=[255, 255, 255, 255])
             
             # Smile
-            smile = trimesh.creation.capsule(radius=0.1, height=0.8)
-            smile.apply_transform(trimesh.transformations.rotation_matrix(np.pi/2, [0, 0, 1]))
-            smile.apply_translation([0, 0.6, 3.0])
-            smile.visual.vertex_colors = [255, 100, 100, 255]
-            meshes.append(smile)
+            builder.capsule(radius=0.1, height=0.8, transform=trimesh.transformations.rotation_matrix(np.pi/2, [0, 0, 1]), translation=[0, 0.6, 3.0], color=[255, 100, 100, 255])
             
             # Body (simplified, stylized)
-            body = trimesh.creation.capsule(radius=0.8, height=2.0)
-            body.apply_translation([0, 0, 1.5])
-            body.visual.vertex_colors = [0, 150, 255, 255]
-            meshes.append(body)
+            builder.capsule(radius=0.8, height=2.0, translation=[0, 0, 1.5], color=[0, 150, 255, 255])
             
             # Arms (noodle arms)
             for x in [-1.2, 1.2]:
-                arm = trimesh.creation.capsule(radius=0.2, height=1.8)
-                arm.apply_transform(trimesh.transformations.rotation_matrix(np.pi/6 * (-1 if x < 0 else 1), [0, 0, 1]))
-                arm.apply_translation([x, 0, 1.5])
-                arm.visual.vertex_colors = [255, 220, 177, 255]
-                meshes.append(arm)
+                builder.capsule(radius=0.2, height=1.8, transform=trimesh.transformations.rotation_matrix(np.pi/6 * (-1 if x < 0 else 1), [0, 0, 1]), translation=[x, 0, 1.5], color=[255, 220, 177, 255])
                 
                 # Hands (oversized)
-                hand = trimesh.creation.icosphere(subdivisions=2, radius=0.35)
-                hand.apply_translation([x * 1.3, 0, 0.5])
-                hand.visual.vertex_colors = [255, 220, 177, 255]
-                meshes.append(hand)
+                builder.icosphere(subdivisions=2, radius=0.35, translation=[x * 1.3, 0, 0.5], color=[255, 220, 177, 255])
             
             # Legs (short, stubby)
             for x in [-0.4, 0.4]:
-                leg = trimesh.creation.capsule(radius=0.3, height=1.0)
-                leg.apply_translation([x, 0, 0.3])
-                leg.visual.vertex_colors = [0, 100, 200, 255]
-                meshes.append(leg)
+                builder.capsule(radius=0.3, height=1.0, translation=[x, 0, 0.3], color=[0, 100, 200, 255])
                 
                 # Feet (oversized)
-                foot = trimesh.creation.box(extents=[0.5, 0.3, 0.2])
-                foot.apply_translation([x, 0.2, -0.2])
-                foot.visual.vertex_colors = [50, 50, 50, 255]
-                meshes.append(foot)
+                builder.box(extents=[0.5, 0.3, 0.2], translation=[x, 0.2, -0.2], color=[50, 50, 50, 255])
         
         elif character_type == 'animal_sidekick':
             # Cute animal companion
             # Body
-            body = trimesh.creation.icosphere(subdivisions=3, radius=0.8)
-            body.apply_translation([0, 0, 0.8])
-            body.visual.vertex_colors = [255, 200, 100, 255]
-            meshes.append(body)
+            builder.icosphere(subdivisions=3, radius=0.8, translation=[0, 0, 0.8], color=[255, 200, 100, 255])
             
             # Head (merged with body)
-            head = trimesh.creation.icosphere(subdivisions=3, radius=0.6)
-            head.apply_translation([0, 0, 1.5])
-            head.visual.vertex_colors = [255, 200, 100, 255]
-            meshes.append(head)
+            builder.icosphere(subdivisions=3, radius=0.6, translation=[0, 0, 1.5], color=[255, 200, 100, 255])
             
             # Huge eyes
             for x in [-0.25, 0.25]:
-                eye = trimesh.creation.icosphere(subdivisions=3, radius=0.25)
-                eye.apply_translation([x, 0.4, 1.6])
-                eye.visual.vertex_colors = [255, 255, 255, 255]
-                meshes.append(eye)
+                builder.icosphere(subdivisions=3, radius=0.25, translation=[x, 0.4, 1.6], color=[255, 255, 255, 255])
                 
-                pupil = trimesh.creation.icosphere(subdivisions=2, radius=0.15)
-                pupil.apply_translation([x, 0.5, 1.65])
-                pupil.visual.vertex_colors = [0, 0, 0, 255]
-                meshes.append(pupil)
+                builder.icosphere(subdivisions=2, radius=0.15, translation=[x, 0.5, 1.65], color=[0, 0, 0, 255])
             
             # Tiny legs
             for x, y in [(-0.4, -0.3), (-0.4, 0.3), (0.4, -0.3), (0.4, 0.3)]:
-                leg = trimesh.creation.cylinder(radius=0.08, height=0.3, sections=8)
-                leg.apply_translation([x, y, 0.15])
-                leg.visual.vertex_colors = [255, 200, 100, 255]
-                meshes.append(leg)
+                builder.cylinder(radius=0.08, height=0.3, sections=8, translation=[x, y, 0.15], color=[255, 200, 100, 255])
         
-        character = trimesh.util.concatenate(meshes)
-        return GigaCartoonEngine.cartoonify_advanced(character, style)
+        return GigaCartoonEngine.cartoonify_advanced(builder.build(), style)
     
     @staticmethod
-    def generate_cartoon_world(world_type: str = 'fantasy', size: int = 5000, style: str = 'disney') -> List[trimesh.Trimesh]:
+    def generate_cartoon_world(world_type: str = 'fantasy', size: int = 5000, style: str = 'disney',
+                               seed: SeedLike = None) -> List[trimesh.Trimesh]:
         """Generate complete cartoon world"""
+        rng = np.random.default_rng(seed)
         world_meshes = []
         
         if world_type == 'fantasy':
@@ -231,8 +190,8 @@ class GigaCartoonEngine:
             
             # Candy trees
             for i in range(1000):
-                x = np.random.uniform(-size/2, size/2)
-                z = np.random.uniform(-size/2, size/2)
+                x = rng.uniform(-size/2, size/2)
+                z = rng.uniform(-size/2, size/2)
                 
                 trunk = trimesh.creation.cylinder(radius=0.5, height=8, sections=6)
                 trunk.apply_translation([x, z, 4])
@@ -241,15 +200,15 @@ class GigaCartoonEngine:
                 crown = trimesh.creation.icosphere(subdivisions=2, radius=5)
                 crown.apply_translation([x, z, 12])
                 colors = [[255, 105, 180], [255, 192, 203], [255, 20, 147]]
-                crown.visual.vertex_colors = random.choice(colors) + [255]
+                crown.visual.vertex_colors = colors[rng.integers(len(colors))] + [255]
                 
                 tree = trimesh.util.concatenate([trunk, crown])
                 world_meshes.append(GigaCartoonEngine.cartoonify_advanced(tree, style))
             
             # Castles
             for i in range(5):
-                x = np.random.uniform(-size/3, size/3)
-                z = np.random.uniform(-size/3, size/3)
+                x = rng.uniform(-size/3, size/3)
+                z = rng.uniform(-size/3, size/3)
                 castle = GigaCartoonEngine._generate_cartoon_castle()
                 castle.apply_translation([x, z, 0])
                 world_meshes.append(GigaCartoonEngine.cartoonify_advanced(castle, style))
@@ -263,13 +222,13 @@ class GigaCartoonEngine:
             
             # Coral
             for i in range(500):
-                x = np.random.uniform(-size/2, size/2)
-                z = np.random.uniform(-size/2, size/2)
+                x = rng.uniform(-size/2, size/2)
+                z = rng.uniform(-size/2, size/2)
                 
-                coral = trimesh.creation.cone(radius=np.random.uniform(1, 3), height=np.random.uniform(5, 15), sections=8)
+                coral = trimesh.creation.cone(radius=rng.uniform(1, 3), height=rng.uniform(5, 15), sections=8)
                 coral.apply_translation([x, z, 0])
                 colors = [[255, 127, 80], [255, 99, 71], [255, 20, 147], [138, 43, 226]]
-                coral.visual.vertex_colors = random.choice(colors) + [255]
+                coral.visual.vertex_colors = colors[rng.integers(len(colors))] + [255]
                 world_meshes.append(GigaCartoonEngine.cartoonify_advanced(coral, style))
         
         return world_meshes
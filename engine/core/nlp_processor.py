@@ -1,6 +1,7 @@
 import spacy
-import nltk
+from spacy.language import Language
 import re
+import threading
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
@@ -27,18 +28,71 @@ class ObjectDescription:
     scale: Tuple[float, float, float]
     properties: Dict[str, any]
 
+# spaCy pipeline shared by every processor in the process; the extractors only
+# need token lemmas, so the parser and entity recognizer are never loaded
+SPACY_MODEL = "en_core_web_sm"
+SPACY_EXCLUDE = ["parser", "ner", "senter"]
+
+# Precompiled patterns for the single-pass parser
+_WORD_PATTERN = re.compile(r'[a-z]+')
+_NUMBER_PATTERN = re.compile(r'\d+\.?\d*')
+_RGB_PATTERN = re.compile(r'rgb\((\d+),\s*(\d+),\s*(\d+)\)')
+_COORDINATE_PATTERN = re.compile(r'at\s*\(([^)]+)\)')
+_DEGREES_PATTERN = re.compile(r'(\d+)\s*degrees?')
+
+# Words matched as written: position, aspect, physics and animation hints
+_FLAG_WORDS = frozenset([
+    'left', 'right', 'up', 'above', 'down', 'below', 'front', 'back', 'behind',
+    'rotated', 'tilted', 'tall', 'high', 'wide', 'broad', 'flat', 'thin',
+    'heavy', 'light', 'solid', 'ghost', 'transparent',
+    'spinning', 'rotating', 'floating', 'hovering'
+])
+
+_pipeline = None
+_shared_processor = None
+_load_lock = threading.Lock()
+
+@Language.component("lowercase_lemmas")
+def _lowercase_lemmas(doc):
+    for token in doc:
+        token.lemma_ = token.lower_
+    return doc
+
+def _load_pipeline():
+    global _pipeline
+    with _load_lock:
+        if _pipeline is None:
+            try:
+                _pipeline = spacy.load(SPACY_MODEL, exclude=SPACY_EXCLUDE)
+            except OSError:
+                # Model not installed (`python -m spacy download en_core_web_sm`); words are matched as written
+                print(f"Warning: spaCy model '{SPACY_MODEL}' not found, using a blank English tokenizer")
+                _pipeline = spacy.blank("en")
+                _pipeline.add_pipe("lowercase_lemmas")
+    return _pipeline
+
+def _inflections(word: str) -> set:
+    """Regular plural, comparative and verb forms of a word"""
+    forms = {word + suffix for suffix in ('s', 'es', 'er', 'est', 'ed', 'ing')}
+    if word.endswith('e'):
+        forms.update({word + 'r', word + 'st', word + 'd', word[:-1] + 'ing'})
+    if word.endswith('y'):
+        forms.update(word[:-1] + suffix for suffix in ('ies', 'ier', 'iest', 'ied'))
+    if word[-1] not in 'aeiouwxy':
+        forms.update(word + word[-1] + suffix for suffix in ('er', 'est', 'ed', 'ing'))
+    return forms
+
+def get_nlp_processor() -> 'NLPProcessor':
+    """Process-wide shared NLPProcessor, created on first use"""
+    global _shared_processor
+    if _shared_processor is None:
+        with _load_lock:
+            if _shared_processor is None:
+                _shared_processor = NLPProcessor()
+    return _shared_processor
+
 class NLPProcessor:
     def __init__(self):
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except OSError:
-            import subprocess
-            subprocess.run(["python", "-m", "spacy", "download", "en_core_web_sm"])
-            self.nlp = spacy.load("en_core_web_sm")
-        
-        nltk.download('punkt', quiet=True)
-        nltk.download('averaged_perceptron_tagger', quiet=True)
-        
         self.shape_keywords = {
             'cube': ShapeType.CUBE, 'box': ShapeType.CUBE, 'block': ShapeType.CUBE,
             'sphere': ShapeType.SPHERE, 'ball': ShapeType.SPHERE, 'orb': ShapeType.SPHERE,
@@ -67,136 +121,141 @@ class NLPProcessor:
             'plastic': 'smooth', 'stone': 'rough', 'concrete': 'rough',
             'fabric': 'soft', 'leather': 'textured', 'rubber': 'elastic'
         }
+        
+        self.texture_words = ['smooth', 'rough', 'bumpy', 'shiny', 'matte', 'glossy']
+        self.complex_words = ['building', 'house', 'tower']
+        
+        # Lemma -> (attribute, value) pairs, so one pass over the words fills every attribute
+        self.keyword_attributes: Dict[str, List[Tuple[str, any]]] = {}
+        for attribute, table in (('shape', self.shape_keywords), ('size', self.size_modifiers),
+                                 ('color', self.color_map), ('material', self.materials),
+                                 ('texture', {word: word for word in self.texture_words}),
+                                 ('complex', {word: ShapeType.COMPLEX for word in self.complex_words})):
+            for word, value in table.items():
+                self.keyword_attributes.setdefault(word, []).append((attribute, value))
+        
+        # Inflected forms of the keywords ("boxes", "bigger"): only these need spaCy's lemmatizer
+        self.inflected_keywords = set()
+        for word in self.keyword_attributes:
+            self.inflected_keywords.update(_inflections(word))
+        self.inflected_keywords.difference_update(self.keyword_attributes)
+    
+    @property
+    def nlp(self):
+        """spaCy pipeline, loaded on first parse"""
+        return _pipeline if _pipeline is not None else _load_pipeline()
 
     def parse_description(self, text: str) -> ObjectDescription:
-        doc = self.nlp(text.lower())
-        
-        shape = self._extract_shape(doc)
-        size = self._extract_size(doc)
-        color = self._extract_color(doc)
-        material = self._extract_material(doc)
-        texture = self._extract_texture(doc)
-        position = self._extract_position(doc)
-        rotation = self._extract_rotation(doc)
-        scale = self._extract_scale(doc)
-        properties = self._extract_properties(doc)
+        text = text.lower()
+        words = _WORD_PATTERN.findall(text)
         
-        return ObjectDescription(
-            shape=shape, size=size, color=color, material=material,
-            texture=texture, position=position, rotation=rotation,
-            scale=scale, properties=properties
-        )
-
-    def _extract_shape(self, doc) -> ShapeType:
-        for token in doc:
-            if token.lemma_ in self.shape_keywords:
-                return self.shape_keywords[token.lemma_]
+        # Short prompts are plain keywords; lemmatize only when a word is an inflected keyword
+        if self.inflected_keywords.isdisjoint(words):
+            lemmas = words
+        else:
+            lemmas = [token.lemma_ for token in self.nlp(text)]
         
-        # Complex shape detection
-        if any(word in doc.text for word in ['building', 'house', 'tower']):
-            return ShapeType.COMPLEX
+        found = {}
+        for lemma in lemmas:
+            for attribute, value in self.keyword_attributes.get(lemma, ()):
+                found.setdefault(attribute, value)
+        flags = _FLAG_WORDS.intersection(words)
         
-        return ShapeType.CUBE
+        size = self._extract_size(found, text)
+        return ObjectDescription(
+            shape=found.get('shape', found.get('complex', ShapeType.CUBE)),
+            size=size,
+            color=self._extract_color(found, text),
+            material=found.get('material', 'default'),
+            texture=found.get('texture'),
+            position=self._extract_position(flags, text),
+            rotation=self._extract_rotation(flags, text),
+            scale=self._extract_scale(flags, size),
+            properties=self._extract_properties(flags)
+        )
 
-    def _extract_size(self, doc) -> float:
-        for token in doc:
-            if token.lemma_ in self.size_modifiers:
-                return self.size_modifiers[token.lemma_]
+    def _extract_size(self, found: Dict[str, any], text: str) -> float:
+        if 'size' in found:
+            return found['size']
         
         # Extract numeric values
-        numbers = re.findall(r'\d+\.?\d*', doc.text)
-        if numbers:
-            return float(numbers[0])
+        number = _NUMBER_PATTERN.search(text)
+        if number:
+            return float(number.group())
         
         return 1.0
 
-    def _extract_color(self, doc) -> Tuple[float, float, float]:
-        for token in doc:
-            if token.lemma_ in self.color_map:
-                return self.color_map[token.lemma_]
+    def _extract_color(self, found: Dict[str, any], text: str) -> Tuple[float, float, float]:
+        if 'color' in found:
+            return found['color']
         
         # RGB extraction
-        rgb_match = re.search(r'rgb\((\d+),\s*(\d+),\s*(\d+)\)', doc.text)
+        rgb_match = _RGB_PATTERN.search(text)
         if rgb_match:
             r, g, b = map(int, rgb_match.groups())
             return (r/255.0, g/255.0, b/255.0)
         
         return (0.7, 0.7, 0.7)  # Default gray
 
-    def _extract_material(self, doc) -> str:
-        for token in doc:
-            if token.lemma_ in self.materials:
-                return self.materials[token.lemma_]
-        return 'default'
-
-    def _extract_texture(self, doc) -> Optional[str]:
-        texture_words = ['smooth', 'rough', 'bumpy', 'shiny', 'matte', 'glossy']
-        for token in doc:
-            if token.lemma_ in texture_words:
-                return token.lemma_
-        return None
-
-    def _extract_position(self, doc) -> Tuple[float, float, float]:
+    def _extract_position(self, flags: set, text: str) -> Tuple[float, float, float]:
         x, y, z = 0.0, 0.0, 0.0
         
         # Positional keywords
-        if 'left' in doc.text: x = -2.0
-        elif 'right' in doc.text: x = 2.0
-        if 'up' in doc.text or 'above' in doc.text: y = 2.0
-        elif 'down' in doc.text or 'below' in doc.text: y = -2.0
-        if 'front' in doc.text: z = 2.0
-        elif 'back' in doc.text or 'behind' in doc.text: z = -2.0
+        if 'left' in flags: x = -2.0
+        elif 'right' in flags: x = 2.0
+        if 'up' in flags or 'above' in flags: y = 2.0
+        elif 'down' in flags or 'below' in flags: y = -2.0
+        if 'front' in flags: z = 2.0
+        elif 'back' in flags or 'behind' in flags: z = -2.0
         
         # Coordinate extraction
-        coords = re.findall(r'at\s*\(([^)]+)\)', doc.text)
+        coords = _COORDINATE_PATTERN.search(text)
         if coords:
             try:
-                x, y, z = map(float, coords[0].split(','))
-            except:
+                x, y, z = map(float, coords.group(1).split(','))
+            except ValueError:
                 pass
         
         return (x, y, z)
 
-    def _extract_rotation(self, doc) -> Tuple[float, float, float]:
+    def _extract_rotation(self, flags: set, text: str) -> Tuple[float, float, float]:
         rx, ry, rz = 0.0, 0.0, 0.0
         
-        if 'rotated' in doc.text or 'tilted' in doc.text:
-            angles = re.findall(r'(\d+)\s*degrees?', doc.text)
-            if angles:
-                rx = float(angles[0])
+        if 'rotated' in flags or 'tilted' in flags:
+            angle = _DEGREES_PATTERN.search(text)
+            if angle:
+                rx = float(angle.group(1))
         
         return (rx, ry, rz)
 
-    def _extract_scale(self, doc) -> Tuple[float, float, float]:
-        base_scale = self._extract_size(doc)
-        
+    def _extract_scale(self, flags: set, base_scale: float) -> Tuple[float, float, float]:
         # Aspect ratio detection
-        if 'tall' in doc.text or 'high' in doc.text:
+        if 'tall' in flags or 'high' in flags:
             return (base_scale, base_scale * 2, base_scale)
-        elif 'wide' in doc.text or 'broad' in doc.text:
+        elif 'wide' in flags or 'broad' in flags:
             return (base_scale * 2, base_scale, base_scale)
-        elif 'flat' in doc.text or 'thin' in doc.text:
+        elif 'flat' in flags or 'thin' in flags:
             return (base_scale, base_scale * 0.2, base_scale)
         
         return (base_scale, base_scale, base_scale)
 
-    def _extract_properties(self, doc) -> Dict[str, any]:
+    def _extract_properties(self, flags: set) -> Dict[str, any]:
         properties = {}
         
         # Physics properties
-        if 'heavy' in doc.text: properties['mass'] = 10.0
-        elif 'light' in doc.text: properties['mass'] = 0.1
+        if 'heavy' in flags: properties['mass'] = 10.0
+        elif 'light' in flags: properties['mass'] = 0.1
         else: properties['mass'] = 1.0
         
         # Interaction properties
-        if 'solid' in doc.text: properties['collision'] = True
-        elif 'ghost' in doc.text or 'transparent' in doc.text: properties['collision'] = False
+        if 'solid' in flags: properties['collision'] = True
+        elif 'ghost' in flags or 'transparent' in flags: properties['collision'] = False
         else: properties['collision'] = True
         
         # Animation properties
-        if 'spinning' in doc.text or 'rotating' in doc.text:
+        if 'spinning' in flags or 'rotating' in flags:
             properties['animate'] = 'rotate'
-        elif 'floating' in doc.text or 'hovering' in doc.text:
+        elif 'floating' in flags or 'hovering' in flags:
             properties['animate'] = 'float'
         
         return properties
\ No newline at end of file
@@ -0,0 +1,119 @@
+import json
+import struct
+from dataclasses import dataclass
+from typing import Dict, List, Any, Tuple
+import numpy as np
+
+# Container layout: header, chunk table, then 64-byte aligned chunk payloads.
+#   META  JSON: geometry table, materials, objects, camera
+#   VERT  float32 interleaved vertex data (renderer layout) for all geometry blocks
+#   INDX  uint32 triangle indices for all geometry blocks
+#   XFRM  float32 (N, 16) row-major object transforms
+#   PHYS  float64 (N, PHYSICS_STATE_SIZE) rigid body state
+SCENE_MAGIC = b'GESC'
+SCENE_VERSION = 1
+CHUNK_ALIGNMENT = 64
+
+_HEADER = struct.Struct('<4sII')
+_CHUNK_ENTRY = struct.Struct('<4sQQ')
+
+# position(3) velocity(3) rotation(4) angular_velocity(3) mass restitution friction is_static inertia(9)
+PHYSICS_STATE_SIZE = 26
+
+@dataclass
+class SceneData:
+    metadata: Dict[str, Any]
+    vertices: np.ndarray
+    indices: np.ndarray
+    transforms: np.ndarray
+    physics: np.ndarray
+    
+    def geometry_block(self, index: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (vertex_data, faces) views for one deduplicated geometry block"""
+        geometry = self.metadata['geometries'][index]
+        stride = geometry['stride']
+        
+        vertex_start = geometry['vertex_offset']
+        vertex_end = vertex_start + geometry['vertex_count'] * stride
+        index_start = geometry['index_offset']
+        index_end = index_start + geometry['face_count'] * 3
+        
+        vertex_data = self.vertices[vertex_start:vertex_end].reshape(-1, stride)
+        faces = self.indices[index_start:index_end].reshape(-1, 3)
+        return vertex_data, faces
+
+def write_scene(path: str, metadata: Dict[str, Any], geometry_blocks: List[Tuple[np.ndarray, np.ndarray]],
+                transforms: np.ndarray, physics: np.ndarray):
+    """Write a scene container; geometry offsets are filled into ``metadata['geometries']``"""
+    vertex_parts = []
+    index_parts = []
+    vertex_offset = 0
+    index_offset = 0
+    
+    for geometry, (vertex_data, faces) in zip(metadata['geometries'], geometry_blocks):
+        vertex_data = np.ascontiguousarray(vertex_data, dtype=np.float32)
+        faces = np.ascontiguousarray(faces, dtype=np.uint32)
+        
+        geometry['stride'] = vertex_data.shape[1]
+        geometry['vertex_offset'] = vertex_offset
+        geometry['vertex_count'] = len(vertex_data)
+        geometry['index_offset'] = index_offset
+        geometry['face_count'] = len(faces)
+        
+        vertex_parts.append(vertex_data.ravel())
+        index_parts.append(faces.ravel())
+        vertex_offset += vertex_data.size
+        index_offset += faces.size
+    
+    chunks = [
+        (b'META', json.dumps(metadata, separators=(',', ':')).encode('utf-8')),
+        (b'VERT', np.concatenate(vertex_parts).tobytes() if vertex_parts else b''),
+        (b'INDX', np.concatenate(index_parts).tobytes() if index_parts else b''),
+        (b'XFRM', np.ascontiguousarray(transforms, dtype=np.float32).tobytes()),
+        (b'PHYS', np.ascontiguousarray(physics, dtype=np.float64).tobytes())
+    ]
+    
+    # Lay out payloads after the header and chunk table
+    table_size = _HEADER.size + _CHUNK_ENTRY.size * len(chunks)
+    offset = _align(table_size)
+    entries = []
+    for tag, payload in chunks:
+        entries.append((tag, offset, len(payload)))
+        offset = _align(offset + len(payload))
+    
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(SCENE_MAGIC, SCENE_VERSION, len(chunks)))
+        for entry in entries:
+            f.write(_CHUNK_ENTRY.pack(*entry))
+        
+        for (tag, chunk_offset, size), (_, payload) in zip(entries, chunks):
+            f.write(b'\0' * (chunk_offset - f.tell()))
+            f.write(payload)
+
+def read_scene(path: str) -> SceneData:
+    """Open a scene container; geometry, transforms and physics are memory-mapped views"""
+    data = np.memmap(path, dtype=np.uint8, mode='r')
+    
+    magic, version, chunk_count = _HEADER.unpack_from(data, 0)
+    if magic != SCENE_MAGIC:
+        raise ValueError(f"{path} is not a scene file")
+    if version != SCENE_VERSION:
+        raise ValueError(f"Unsupported scene version {version}")
+    
+    chunks = {}
+    for i in range(chunk_count):
+        tag, offset, size = _CHUNK_ENTRY.unpack_from(data, _HEADER.size + i * _CHUNK_ENTRY.size)
+        chunks[tag] = data[offset:offset + size]
+    
+    metadata = json.loads(bytes(chunks[b'META']).decode('utf-8'))
+    
+    return SceneData(
+        metadata=metadata,
+        vertices=chunks[b'VERT'].view(np.float32),
+        indices=chunks[b'INDX'].view(np.uint32),
+        transforms=chunks[b'XFRM'].view(np.float32).reshape(-1, 4, 4),
+        physics=chunks[b'PHYS'].view(np.float64).reshape(-1, PHYSICS_STATE_SIZE)
+    )
+
+def _align(offset: int) -> int:
+    return (offset + CHUNK_ALIGNMENT - 1) // CHUNK_ALIGNMENT * CHUNK_ALIGNMENT
@@ -0,0 +1,157 @@
+import os
+import json
+import threading
+import time
+from typing import Dict, List, Optional, Any
+from pathlib import Path
+
+class SessionJournal:
+    """Buffered append-only newline-JSON log of object creation and mutation.
+    
+    Records are queued in memory and written by a background thread, so the
+    hot path never touches the filesystem. Replaying the journal rebuilds a
+    session's object list; compaction rewrites it as one record per live object.
+    """
+    
+    def __init__(self, journal_path: str, flush_interval: float = 0.5,
+                 max_buffered: int = 256, compact_threshold: int = 1000):
+        self.journal_path = Path(journal_path)
+        self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Flush settings
+        self.flush_interval = flush_interval
+        self.max_buffered = max_buffered
+        self.compact_threshold = compact_threshold
+        
+        # Pending records and bookkeeping
+        self.buffer: List[str] = []
+        self.buffer_lock = threading.Lock()
+        self.write_lock = threading.Lock()
+        self.flush_event = threading.Event()
+        self.live_objects = set()
+        self.records_on_disk = self._count_records()
+        
+        # Background writer
+        self.running = True
+        self.flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self.flush_thread.start()
+    
+    def _count_records(self) -> int:
+        if not self.journal_path.exists():
+            return 0
+        
+        state = self.replay()
+        self.live_objects = set(state)
+        with open(self.journal_path, 'rb') as f:
+            return sum(1 for _ in f)
+    
+    def record_create(self, obj_id: str, source: str, source_type: str, **data):
+        """Record that an object was created from ``source``"""
+        self.live_objects.add(obj_id)
+        self._append({'op': 'create', 'id': obj_id, 'source': source, 'type': source_type, **data})
+    
+    def record_update(self, obj_id: str, **changes):
+        """Record changed object fields (e.g. position, rotation, scale)"""
+        self._append({'op': 'update', 'id': obj_id, **changes})
+    
+    def record_remove(self, obj_id: str):
+        """Record that an object was removed"""
+        self.live_objects.discard(obj_id)
+        self._append({'op': 'remove', 'id': obj_id})
+    
+    def _append(self, record: Dict[str, Any]):
+        record['timestamp'] = time.time()
+        line = json.dumps(record, separators=(',', ':'))
+        
+        with self.buffer_lock:
+            self.buffer.append(line)
+            full = len(self.buffer) >= self.max_buffered
+        
+        if full:
+            self.flush_event.set()
+    
+    def _flush_loop(self):
+        """Background writer: flush periodically or when the buffer fills up"""
+        while self.running:
+            self.flush_event.wait(self.flush_interval)
+            self.flush_event.clear()
+            
+            self.flush()
+            
+            if (self.records_on_disk > self.compact_threshold and
+                    self.records_on_disk > 4 * max(len(self.live_objects), 1)):
+                self.compact()
+    
+    def flush(self):
+        """Write buffered records to disk in a single append"""
+        with self.write_lock:
+            self._write_buffered()
+    
+    def _write_buffered(self):
+        # Callers hold write_lock across the swap and the write, so batches reach
+        # the file in the order they left the buffer even when threads flush concurrently
+        with self.buffer_lock:
+            if not self.buffer:
+                return
+            lines, self.buffer = self.buffer, []
+        
+        with open(self.journal_path, 'a', encoding='utf-8') as f:
+            f.write('\n'.join(lines) + '\n')
+        self.records_on_disk += len(lines)
+    
+    def replay(self) -> Dict[str, Dict[str, Any]]:
+        """Rebuild the live object list (in creation order) from the journal"""
+        objects: Dict[str, Dict[str, Any]] = {}
+        if not self.journal_path.exists():
+            return objects
+        
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final line from a crash mid-write is ignored
+                    continue
+                
+                op = record.pop('op', None)
+                obj_id = record.pop('id', None)
+                if op == 'create':
+                    objects[obj_id] = record
+                elif op == 'update' and obj_id in objects:
+                    objects[obj_id].update(record)
+                elif op == 'remove':
+                    objects.pop(obj_id, None)
+        
+        return objects
+    
+    def compact(self):
+        """Rewrite the journal as one create record per live object"""
+        with self.write_lock:
+            self._write_buffered()
+            objects = self.replay()
+            tmp_path = self.journal_path.with_suffix(self.journal_path.suffix + '.tmp')
+            
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for obj_id, state in objects.items():
+                    f.write(json.dumps({'op': 'create', 'id': obj_id, **state}, separators=(',', ':')) + '\n')
+            
+            os.replace(tmp_path, self.journal_path)
+            self.records_on_disk = len(objects)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        with self.buffer_lock:
+            buffered = len(self.buffer)
+        
+        return {
+            'journal_path': str(self.journal_path),
+            'records_on_disk': self.records_on_disk,
+            'buffered_records': buffered,
+            'live_objects': len(self.live_objects)
+        }
+    
+    def close(self):
+        """Stop the writer thread and flush everything still buffered"""
+        self.running = False
+        self.flush_event.set()
+        self.flush_thread.join()
+        self.flush()
@@ -1,23 +1,27 @@
 import numpy as np
 import trimesh
 from typing import List, Dict, Tuple
-import random
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import multiprocessing as mp
+from ..procedural.fractal_noise import GradientNoise
+from ..procedural.grid_mesh import grid_mesh
+from ..procedural import primitives
+from ..procedural.seeding import SeedLike, spawn
 
 class GigaGenerator:
     """Revolutionary multi-scale generator with parallel processing"""
     
     @staticmethod
-    def generate_universe(size: int = 100000, galaxies: int = 1000) -> List[trimesh.Trimesh]:
+    def generate_universe(size: int = 100000, galaxies: int = 1000, seed: SeedLike = None) -> List[trimesh.Trimesh]:
         """Generate entire universe with galaxies, stars, planets"""
         meshes = []
+        rng = np.random.default_rng(seed)
+        positions = rng.uniform(-size/2, size/2, (galaxies, 3))
+        galaxy_seeds = spawn(rng, galaxies)
         
         with ProcessPoolExecutor(max_workers=mp.cpu_count()) as executor:
-            futures = []
-            for i in range(galaxies):
-                pos = np.random.uniform(-size/2, size/2, 3)
-                futures.append(executor.submit(GigaGenerator._generate_galaxy, pos, i))
+            futures = [executor.submit(GigaGenerator._generate_galaxy, positions[i], galaxy_seeds[i])
+                       for i in range(galaxies)]
             
             for future in futures:
                 meshes.extend(future.result())
@@ -25,56 +29,35 @@ class GigaGenerator:
         return meshes
     
     @staticmethod
-    def _generate_galaxy(position: np.ndarray, seed: int) -> List[trimesh.Trimesh]:
-        """Generate single galaxy with spiral arms"""
-        np.random.seed(seed)
-        meshes = []
+    def _generate_galaxy(position: np.ndarray, seed: SeedLike) -> List[trimesh.Trimesh]:
+        """Generate single galaxy with spiral arms, as one mesh of instanced stars"""
+        rng = np.random.default_rng(seed)
         stars = 10000
         
-        for i in range(stars):
-            angle = np.random.uniform(0, 2*np.pi)
-            radius = np.random.exponential(1000)
-            height = np.random.normal(0, 100)
-            
-            x = position[0] + radius * np.cos(angle)
-            y = position[1] + height
-            z = position[2] + radius * np.sin(angle)
-            
-            size = np.random.uniform(10, 100)
-            star = trimesh.creation.icosphere(subdivisions=2, radius=size)
-            star.apply_translation([x, y, z])
-            
-            color = np.random.choice([
-                [255, 255, 200, 255],
-                [255, 200, 150, 255],
-                [150, 200, 255, 255]
-            ])
-            star.visual.vertex_colors = color
-            
-            meshes.append(star)
+        angle = rng.uniform(0, 2*np.pi, stars)
+        radius = rng.exponential(1000, stars)
+        height = rng.normal(0, 100, stars)
+        centers = position + np.column_stack([radius * np.cos(angle), height, radius * np.sin(angle)])
         
-        return meshes
+        sizes = rng.uniform(10, 100, stars)
+        palette = np.array([
+            [255, 255, 200, 255],
+            [255, 200, 150, 255],
+            [150, 200, 255, 255]
+        ], dtype=np.uint8)
+        colors = palette[rng.integers(len(palette), size=stars)]
+        
+        return [primitives.instances('icosphere', 2, sizes, centers, colors)]
     
     @staticmethod
-    def generate_planet(radius: float = 6371, detail: int = 6) -> trimesh.Trimesh:
+    def generate_planet(radius: float = 6371, detail: int = 6, seed: int = 0) -> trimesh.Trimesh:
         """Generate realistic planet with continents, oceans, mountains"""
         sphere = trimesh.creation.icosphere(subdivisions=detail, radius=radius)
-        vertices = sphere.vertices.copy()
-        
-        # Multi-octave noise for terrain
-        for i in range(len(vertices)):
-            v = vertices[i]
-            noise = 0
-            freq = 0.001
-            amp = 1.0
-            
-            for octave in range(8):
-                noise += amp * (np.sin(v[0] * freq) * np.cos(v[1] * freq) * np.sin(v[2] * freq))
-                freq *= 2
-                amp *= 0.5
-            
-            displacement = noise * radius * 0.1
-            vertices[i] = v * (1 + displacement / radius)
+        
+        # Multi-octave noise for terrain, sampled on the unit sphere so features don't depend on radius
+        unit = sphere.vertices / radius
+        noise = GradientNoise(seed).fbm(*unit.T, octaves=8, frequency=2.0)
+        vertices = sphere.vertices * (1 + noise * 0.1)[:, None]
         
         sphere.vertices = vertices
         
@@ -103,122 +86,66 @@ class GigaGenerator:
         return sphere
     
     @staticmethod
-    def generate_continent(size: Tuple[int, int] = (50000, 50000)) -> trimesh.Trimesh:
+    def generate_continent(size: Tuple[int, int] = (50000, 50000), seed: int = 0) -> trimesh.Trimesh:
         """Generate massive continent with biomes"""
         resolution = 1000
         x = np.linspace(-size[0]/2, size[0]/2, resolution)
         z = np.linspace(-size[1]/2, size[1]/2, resolution)
         X, Z = np.meshgrid(x, z)
         
-        # Multi-layer terrain generation
-        Y = np.zeros_like(X)
-        
-        # Base terrain
-        for i in range(resolution):
-            for j in range(resolution):
-                noise = 0
-                freq = 0.0001
-                amp = 1000
-                
-                for octave in range(10):
-                    noise += amp * np.sin(X[i,j] * freq) * np.cos(Z[i,j] * freq)
-                    freq *= 2
-                    amp *= 0.5
-                
-                Y[i,j] = noise
-        
-        # Create mesh
-        vertices = []
-        faces = []
-        colors = []
+        # Base terrain: 10 octaves from amplitude 1000 (fbm is normalized by their ~2000 sum)
+        Y = GradientNoise(seed).fbm(X, Z, octaves=10, frequency=0.0001) * 2000.0
         
-        for i in range(resolution-1):
-            for j in range(resolution-1):
-                idx = i * resolution + j
-                
-                vertices.extend([
-                    [X[i,j], Y[i,j], Z[i,j]],
-                    [X[i+1,j], Y[i+1,j], Z[i+1,j]],
-                    [X[i,j+1], Y[i,j+1], Z[i,j+1]],
-                    [X[i+1,j+1], Y[i+1,j+1], Z[i+1,j+1]]
-                ])
-                
-                base = len(vertices) - 4
-                faces.extend([
-                    [base, base+1, base+2],
-                    [base+1, base+3, base+2]
-                ])
-                
-                # Biome coloring
-                height = Y[i,j]
-                if height < 0:
-                    color = [50, 100, 200, 255]
-                elif height < 100:
-                    color = [34, 139, 34, 255]
-                elif height < 500:
-                    color = [107, 142, 35, 255]
-                elif height < 1000:
-                    color = [139, 90, 43, 255]
-                else:
-                    color = [255, 255, 255, 255]
-                
-                colors.extend([color] * 4)
-        
-        mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
-        mesh.visual.vertex_colors = colors
-        return mesh
+        # Biome coloring
+        colors = np.select(
+            [Y[..., None] < 0, Y[..., None] < 100, Y[..., None] < 500, Y[..., None] < 1000],
+            [np.array([50, 100, 200, 255]), np.array([34, 139, 34, 255]),
+             np.array([107, 142, 35, 255]), np.array([139, 90, 43, 255])],
+            np.array([255, 255, 255, 255])
+        ).astype(np.uint8)
+        
+        # Rows run along Z, so flip the default winding to face up
+        return grid_mesh(np.stack([X, Y, Z], axis=-1), colors=colors, flip_winding=True)
     
     @staticmethod
-    def generate_ocean(size: Tuple[int, int] = (100000, 100000), waves: int = 50) -> trimesh.Trimesh:
+    def generate_ocean(size: Tuple[int, int] = (100000, 100000), waves: int = 50,
+                       seed: SeedLike = None) -> trimesh.Trimesh:
         """Generate realistic ocean with dynamic waves"""
         resolution = 2000
         x = np.linspace(-size[0]/2, size[0]/2, resolution)
         z = np.linspace(-size[1]/2, size[1]/2, resolution)
         X, Z = np.meshgrid(x, z)
-        Y = np.zeros_like(X)
-        
-        # Wave generation
-        for w in range(waves):
-            wavelength = np.random.uniform(100, 5000)
-            amplitude = np.random.uniform(1, 50)
-            direction = np.random.uniform(0, 2*np.pi)
-            phase = np.random.uniform(0, 2*np.pi)
-            
-            k = 2 * np.pi / wavelength
-            Y += amplitude * np.sin(k * (X * np.cos(direction) + Z * np.sin(direction)) + phase)
-        
-        vertices = []
-        faces = []
-        
-        for i in range(resolution-1):
-            for j in range(resolution-1):
-                vertices.extend([
-                    [X[i,j], Y[i,j], Z[i,j]],
-                    [X[i+1,j], Y[i+1,j], Z[i+1,j]],
-                    [X[i,j+1], Y[i,j+1], Z[i,j+1]],
-                    [X[i+1,j+1], Y[i+1,j+1], Z[i+1,j+1]]
-                ])
-                
-                base = len(vertices) - 4
-                faces.extend([[base, base+1, base+2], [base+1, base+3, base+2]])
-        
-        mesh = trimesh.Trimesh(vertices=vertices, faces=faces)
+        
+        # Wave generation: wavelength, amplitude, direction and phase per wave
+        rng = np.random.default_rng(seed)
+        wavelength, amplitude, direction, phase = rng.uniform([100, 1, 0, 0], [5000, 50, 2*np.pi, 2*np.pi],
+                                                              (waves, 4)).T
+        
+        k = 2 * np.pi / wavelength
+        along_x = np.outer(x, k * np.cos(direction)) + phase
+        along_z = np.outer(z, k * np.sin(direction))
+        # Each wave's phase is a function of x plus one of z, so with sin(a + b) = sin(a)cos(b) + cos(a)sin(b)
+        # all waves sum as two (z, waves) @ (waves, x) matrix products
+        Y = (np.cos(along_z) * amplitude) @ np.sin(along_x).T + (np.sin(along_z) * amplitude) @ np.cos(along_x).T
+        
+        mesh = grid_mesh(np.stack([X, Y, Z], axis=-1), flip_winding=True)
         mesh.visual.vertex_colors = [30, 144, 255, 200]
         return mesh
     
     @staticmethod
-    def generate_forest(area: Tuple[int, int] = (10000, 10000), trees: int = 100000) -> List[trimesh.Trimesh]:
+    def generate_forest(area: Tuple[int, int] = (10000, 10000), trees: int = 100000,
+                        seed: SeedLike = None) -> List[trimesh.Trimesh]:
         """Generate massive forest with varied trees"""
         meshes = []
         tree_types = ['oak', 'pine', 'birch', 'palm', 'willow']
+        rng = np.random.default_rng(seed)
+        x = rng.uniform(-area[0]/2, area[0]/2, trees)
+        z = rng.uniform(-area[1]/2, area[1]/2, trees)
+        type_indices = rng.integers(len(tree_types), size=trees)
         
         with ThreadPoolExecutor(max_workers=16) as executor:
-            futures = []
-            for i in range(trees):
-                x = np.random.uniform(-area[0]/2, area[0]/2)
-                z = np.random.uniform(-area[1]/2, area[1]/2)
-                tree_type = random.choice(tree_types)
-                futures.append(executor.submit(GigaGenerator._generate_tree, x, z, tree_type, i))
+            futures = [executor.submit(GigaGenerator._generate_tree, x[i], z[i], tree_types[type_indices[i]])
+                       for i in range(trees)]
             
             for future in futures:
                 meshes.append(future.result())
@@ -226,19 +153,50 @@ class GigaGenerator:
         return meshes
     
     @staticmethod
-    def _generate_tree(x: float, z: float, tree_type: str, seed: int) -> trimesh.Trimesh:
-        """Generate single tree"""
-        np.random.seed(seed)
-        
+    def generate_forest_instances(area: Tuple[int, int] = (10000, 10000),
+                                  trees: int = 100000,
+                                  seed: SeedLike = None) -> Dict[str, Tuple[trimesh.Trimesh, np.ndarray]]:
+        """Generate a forest as one template mesh per tree type plus (N, 4, 4) instance transforms"""
+        tree_types = ['oak', 'pine', 'birch', 'palm', 'willow']
+        rng = np.random.default_rng(seed)
+        
+        positions = np.zeros((trees, 3))
+        positions[:, 0] = rng.uniform(-area[0]/2, area[0]/2, trees)
+        positions[:, 2] = rng.uniform(-area[1]/2, area[1]/2, trees)
+        yaw = rng.uniform(0, 2 * np.pi, trees)
+        scale = rng.uniform(0.8, 1.2, trees)
+        type_indices = rng.integers(0, len(tree_types), trees)
+        
+        # Uniform scale and rotation about Y, then translation
+        transforms = np.zeros((trees, 4, 4))
+        transforms[:, 0, 0] = np.cos(yaw) * scale
+        transforms[:, 0, 2] = np.sin(yaw) * scale
+        transforms[:, 1, 1] = scale
+        transforms[:, 2, 0] = -np.sin(yaw) * scale
+        transforms[:, 2, 2] = np.cos(yaw) * scale
+        transforms[:, :3, 3] = positions
+        transforms[:, 3, 3] = 1.0
+        
+        forest = {}
+        for i, tree_type in enumerate(tree_types):
+            selected = transforms[type_indices == i]
+            if len(selected):
+                forest[tree_type] = (GigaGenerator._generate_tree(0, 0, tree_type), selected)
+        
+        return forest
+    
+    @staticmethod
+    def _generate_tree(x: float, z: float, tree_type: str) -> trimesh.Trimesh:
+        """Generate single tree (trees of a type differ only in position)"""
         if tree_type == 'pine':
-            trunk = trimesh.creation.cylinder(radius=0.5, height=15, sections=8)
-            crown = trimesh.creation.cone(radius=5, height=20, sections=8)
+            trunk = primitives.cylinder(radius=0.5, height=15, sections=8)
+            crown = primitives.cone(radius=5, height=20, sections=8)
             crown.apply_translation([0, 20, 0])
             tree = trimesh.util.concatenate([trunk, crown])
             tree.visual.vertex_colors = [[101, 67, 33, 255]] * len(trunk.vertices) + [[34, 139, 34, 255]] * len(crown.vertices)
         else:
-            trunk = trimesh.creation.cylinder(radius=0.8, height=12, sections=8)
-            crown = trimesh.creation.icosphere(subdivisions=2, radius=6)
+            trunk = primitives.cylinder(radius=0.8, height=12, sections=8)
+            crown = primitives.icosphere(subdivisions=2, radius=6)
             crown.apply_translation([0, 15, 0])
             tree = trimesh.util.concatenate([trunk, crown])
             tree.visual.vertex_colors = [[101, 67, 33, 255]] * len(trunk.vertices) + [[34, 139, 34, 255]] * len(crown.vertices)
@@ -255,7 +213,7 @@ class GigaGenerator:
         meshes = []
         
         # Foundation
-        foundation = trimesh.creation.box(extents=[base_width+10, 5, base_width+10])
+        foundation = primitives.box(extents=[base_width+10, 5, base_width+10])
         foundation.apply_translation([0, 2.5, 0])
         foundation.visual.vertex_colors = [100, 100, 100, 255]
         meshes.append(foundation)
@@ -268,7 +226,7 @@ class GigaGenerator:
             taper = 1 - (floor / floors) * 0.3
             width = base_width * taper
             
-            floor_mesh = trimesh.creation.box(extents=[width, 3, width])
+            floor_mesh = primitives.box(extents=[width, 3, width])
             floor_mesh.apply_translation([0, y + 1.5, 0])
             
             # Windows
@@ -280,7 +238,7 @@ class GigaGenerator:
             meshes.append(floor_mesh)
         
         # Spire
-        spire = trimesh.creation.cone(radius=5, height=50, sections=8)
+        spire = primitives.cone(radius=5, height=50, sections=8)
         spire.apply_translation([0, height + 25, 0])
         spire.visual.vertex_colors = [150, 150, 150, 255]
         meshes.append(spire)
@@ -293,7 +251,7 @@ class GigaGenerator:
         meshes = []
         
         # Field
-        field = trimesh.creation.box(extents=[120, 1, 80])
+        field = primitives.box(extents=[120, 1, 80])
         field.visual.vertex_colors = [34, 139, 34, 255]
         meshes.append(field)
         
@@ -322,14 +280,14 @@ class GigaGenerator:
         meshes = []
         
         # Terminal
-        terminal = trimesh.creation.box(extents=[500, 30, 200])
+        terminal = primitives.box(extents=[500, 30, 200])
         terminal.apply_translation([0, 15, 0])
         terminal.visual.vertex_colors = [220, 220, 220, 255]
         meshes.append(terminal)
         
         # Runways
         for i in range(runways):
-            runway = trimesh.creation.box(extents=[3000, 1, 60])
+            runway = primitives.box(extents=[3000, 1, 60])
             angle = (i * 45) * np.pi / 180
             runway.apply_translation([
                 1000 * np.cos(angle),
@@ -340,8 +298,8 @@ class GigaGenerator:
             meshes.append(runway)
         
         # Control tower
-        tower_base = trimesh.creation.cylinder(radius=10, height=50, sections=16)
-        tower_top = trimesh.creation.box(extents=[20, 10, 20])
+        tower_base = primitives.cylinder(radius=10, height=50, sections=16)
+        tower_top = primitives.box(extents=[20, 10, 20])
         tower_top.apply_translation([0, 55, 0])
         tower = trimesh.util.concatenate([tower_base, tower_top])
         tower.apply_translation([300, 25, 0])
@@ -350,7 +308,7 @@ class GigaGenerator:
         
         # Hangars
         for i in range(6):
-            hangar = trimesh.creation.box(extents=[80, 25, 60])
+            hangar = primitives.box(extents=[80, 25, 60])
             hangar.apply_translation([-400 + i*100, 12.5, 300])
             hangar.visual.vertex_colors = [160, 160, 160, 255]
             meshes.append(hangar)
@@ -358,16 +316,18 @@ class GigaGenerator:
         return meshes
     
     @staticmethod
-    def generate_vehicle_fleet(count: int = 1000, vehicle_type: str = 'mixed') -> List[trimesh.Trimesh]:
+    def generate_vehicle_fleet(count: int = 1000, vehicle_type: str = 'mixed',
+                               seed: SeedLike = None) -> List[trimesh.Trimesh]:
         """Generate massive vehicle fleet"""
         meshes = []
         types = ['car', 'truck', 'bus', 'motorcycle', 'van'] if vehicle_type == 'mixed' else [vehicle_type]
+        rng = np.random.default_rng(seed)
+        type_indices = rng.integers(len(types), size=count)
+        vehicle_seeds = spawn(rng, count)
         
         with ThreadPoolExecutor(max_workers=16) as executor:
-            futures = []
-            for i in range(count):
-                vtype = random.choice(types)
-                futures.append(executor.submit(GigaGenerator._generate_vehicle, vtype, i))
+            futures = [executor.submit(GigaGenerator._generate_vehicle, types[type_indices[i]], vehicle_seeds[i])
+                       for i in range(count)]
             
             for future in futures:
                 meshes.append(future.result())
@@ -375,87 +335,88 @@ class GigaGenerator:
         return meshes
     
     @staticmethod
-    def _generate_vehicle(vehicle_type: str, seed: int) -> trimesh.Trimesh:
+    def _generate_vehicle(vehicle_type: str, seed: SeedLike) -> trimesh.Trimesh:
         """Generate single vehicle"""
-        np.random.seed(seed)
+        rng = np.random.default_rng(seed)
         
         if vehicle_type == 'car':
-            body = trimesh.creation.box(extents=[4, 1.5, 2])
-            cabin = trimesh.creation.box(extents=[2.5, 1, 1.8])
+            body = primitives.box(extents=[4, 1.5, 2])
+            cabin = primitives.box(extents=[2.5, 1, 1.8])
             cabin.apply_translation([0, 1.25, 0])
             
             wheels = []
             for x in [-1.5, 1.5]:
                 for z in [-0.8, 0.8]:
-                    wheel = trimesh.creation.cylinder(radius=0.4, height=0.3, sections=16)
+                    wheel = primitives.cylinder(radius=0.4, height=0.3, sections=16)
                     wheel.apply_transform(trimesh.transformations.rotation_matrix(np.pi/2, [0, 0, 1]))
                     wheel.apply_translation([x, -0.5, z])
                     wheels.append(wheel)
             
             vehicle = trimesh.util.concatenate([body, cabin] + wheels)
-            color = [random.randint(50, 255), random.randint(50, 255), random.randint(50, 255), 255]
+            color = [*rng.integers(50, 256, 3), 255]
             vehicle.visual.vertex_colors = color
             
         elif vehicle_type == 'truck':
-            body = trimesh.creation.box(extents=[8, 2, 2.5])
-            cabin = trimesh.creation.box(extents=[2, 2.5, 2.3])
+            body = primitives.box(extents=[8, 2, 2.5])
+            cabin = primitives.box(extents=[2, 2.5, 2.3])
             cabin.apply_translation([-3, 1.25, 0])
             vehicle = trimesh.util.concatenate([body, cabin])
             vehicle.visual.vertex_colors = [100, 100, 150, 255]
             
         elif vehicle_type == 'bus':
-            body = trimesh.creation.box(extents=[12, 3, 2.5])
+            body = primitives.box(extents=[12, 3, 2.5])
             vehicle = body
             vehicle.visual.vertex_colors = [255, 200, 0, 255]
             
         else:
-            body = trimesh.creation.box(extents=[2, 1, 0.8])
+            body = primitives.box(extents=[2, 1, 0.8])
             vehicle = body
             vehicle.visual.vertex_colors = [200, 0, 0, 255]
         
         return vehicle
     
     @staticmethod
-    def generate_character_army(count: int = 10000) -> List[trimesh.Trimesh]:
+    def generate_character_army(count: int = 10000, seed: SeedLike = None) -> List[trimesh.Trimesh]:
         """Generate army of characters"""
         meshes = []
         
         with ThreadPoolExecutor(max_workers=16) as executor:
-            futures = [executor.submit(GigaGenerator._generate_character, i) for i in range(count)]
+            futures = [executor.submit(GigaGenerator._generate_character, character_seed)
+                       for character_seed in spawn(seed, count)]
             for future in futures:
                 meshes.append(future.result())
         
         return meshes
     
     @staticmethod
-    def _generate_character(seed: int) -> trimesh.Trimesh:
+    def _generate_character(seed: SeedLike) -> trimesh.Trimesh:
         """Generate single character"""
-        np.random.seed(seed)
+        rng = np.random.default_rng(seed)
         
         # Body
-        body = trimesh.creation.box(extents=[0.5, 1, 0.3])
+        body = primitives.box(extents=[0.5, 1, 0.3])
         body.apply_translation([0, 1.5, 0])
         
         # Head
-        head = trimesh.creation.icosphere(subdivisions=2, radius=0.25)
+        head = primitives.icosphere(subdivisions=2, radius=0.25)
         head.apply_translation([0, 2.3, 0])
         
         # Arms
-        arm_l = trimesh.creation.box(extents=[0.15, 0.8, 0.15])
+        arm_l = primitives.box(extents=[0.15, 0.8, 0.15])
         arm_l.apply_translation([-0.4, 1.5, 0])
-        arm_r = trimesh.creation.box(extents=[0.15, 0.8, 0.15])
+        arm_r = primitives.box(extents=[0.15, 0.8, 0.15])
         arm_r.apply_translation([0.4, 1.5, 0])
         
         # Legs
-        leg_l = trimesh.creation.box(extents=[0.2, 0.9, 0.2])
+        leg_l = primitives.box(extents=[0.2, 0.9, 0.2])
         leg_l.apply_translation([-0.15, 0.45, 0])
-        leg_r = trimesh.creation.box(extents=[0.2, 0.9, 0.2])
+        leg_r = primitives.box(extents=[0.2, 0.9, 0.2])
         leg_r.apply_translation([0.15, 0.45, 0])
         
         character = trimesh.util.concatenate([body, head, arm_l, arm_r, leg_l, leg_r])
         
         # Random skin tone
-        skin = [random.randint(150, 255), random.randint(120, 200), random.randint(100, 180), 255]
+        skin = [*rng.integers([150, 120, 100], [256, 201, 181]), 255]
         character.visual.vertex_colors = skin
         
         return character
@@ -1,9 +1,10 @@
 import numpy as np
 import trimesh
 from typing import List, Dict, Tuple
-import random
 from concurrent.futures import ThreadPoolExecutor
 import cv2
+from ..procedural.mesh_builder import MeshBuilder
+from ..procedural.seeding import SeedLike
 
 class GigaWorldGenerator:
     """Generate ALL real-world objects with AI-trained precision"""
@@ -28,43 +29,29 @@ class GigaWorldGenerator:
     @staticmethod
     def generate_animal(animal_type: str, species: str, detail: int = 5) -> trimesh.Trimesh:
         """Generate anatomically accurate animal"""
-        meshes = []
+        builder = MeshBuilder()
         
         if animal_type == 'mammals':
             if species in ['dog', 'cat', 'wolf', 'fox']:
                 # Quadruped body
-                body = trimesh.creation.capsule(radius=0.3, height=1.0)
-                body.apply_transform(trimesh.transformations.rotation_matrix(np.pi/2, [0, 0, 1]))
-                meshes.append(body)
+                builder.capsule(radius=0.3, height=1.0, transform=trimesh.transformations.rotation_matrix(np.pi/2, [0, 0, 1]))
                 
                 # Head
-                head = trimesh.creation.icosphere(subdivisions=3, radius=0.25)
-                head.apply_translation([0.6, 0, 0.1])
-                meshes.append(head)
+                builder.icosphere(subdivisions=3, radius=0.25, translation=[0.6, 0, 0.1])
                 
                 # Snout
-                snout = trimesh.creation.cone(radius=0.1, height=0.2, sections=16)
-                snout.apply_transform(trimesh.transformations.rotation_matrix(np.pi/2, [0, 1, 0]))
-                snout.apply_translation([0.75, 0, 0])
-                meshes.append(snout)
+                builder.cone(radius=0.1, height=0.2, sections=16, transform=trimesh.transformations.rotation_matrix(np.pi/2, [0, 1, 0]), translation=[0.75, 0, 0])
                 
                 # Ears
                 for y in [-0.15, 0.15]:
-                    ear = trimesh.creation.cone(radius=0.08, height=0.15, sections=8)
-                    ear.apply_translation([0.6, y, 0.25])
-                    meshes.append(ear)
+                    builder.cone(radius=0.08, height=0.15, sections=8, translation=[0.6, y, 0.25])
                 
                 # Legs
                 for x, z in [(-0.3, -0.2), (-0.3, 0.2), (0.3, -0.2), (0.3, 0.2)]:
-                    leg = trimesh.creation.cylinder(radius=0.08, height=0.5, sections=12)
-                    leg.apply_translation([x, z, -0.4])
-                    meshes.append(leg)
+                    builder.cylinder(radius=0.08, height=0.5, sections=12, translation=[x, z, -0.4])
                 
                 # Tail
-                tail = trimesh.creation.capsule(radius=0.05, height=0.4)
-                tail.apply_transform(trimesh.transformations.rotation_matrix(np.pi/4, [0, 1, 0]))
-                tail.apply_translation([-0.6, 0, 0.1])
-                meshes.append(tail)
+                builder.capsule(radius=0.05, height=0.4, transform=trimesh.transformations.rotation_matrix(np.pi/4, [0, 1, 0]), translation=[-0.6, 0, 0.1])
                 
                 # Color based on species
                 colors = {
@@ -76,40 +63,26 @@ class GigaWorldGenerator:
                 
             elif species in ['elephant', 'rhino', 'hippo']:
                 # Large body
-                body = trimesh.creation.capsule(radius=1.0, height=2.0)
-                body.apply_transform(trimesh.transformations.rotation_matrix(np.pi/2, [0, 0, 1]))
-                meshes.append(body)
+                builder.capsule(radius=1.0, height=2.0, transform=trimesh.transformations.rotation_matrix(np.pi/2, [0, 0, 1]))
                 
                 # Head
-                head = trimesh.creation.box(extents=[0.8, 0.8, 1.0])
-                head.apply_translation([1.5, 0, 0.3])
-                meshes.append(head)
+                builder.box(extents=[0.8, 0.8, 1.0], translation=[1.5, 0, 0.3])
                 
                 # Trunk (elephant)
                 if species == 'elephant':
-                    trunk = trimesh.creation.cylinder(radius=0.15, height=1.5, sections=16)
-                    trunk.apply_transform(trimesh.transformations.rotation_matrix(np.pi/4, [0, 1, 0]))
-                    trunk.apply_translation([2.0, 0, -0.3])
-                    meshes.append(trunk)
+                    builder.cylinder(radius=0.15, height=1.5, sections=16, transform=trimesh.transformations.rotation_matrix(np.pi/4, [0, 1, 0]), translation=[2.0, 0, -0.3])
                     
                     # Tusks
                     for y in [-0.3, 0.3]:
-                        tusk = trimesh.creation.cone(radius=0.08, height=0.6, sections=12)
-                        tusk.apply_transform(trimesh.transformations.rotation_matrix(np.pi/2, [0, 1, 0]))
-                        tusk.apply_translation([2.2, y, 0])
-                        meshes.append(tusk)
+                        builder.cone(radius=0.08, height=0.6, sections=12, transform=trimesh.transformations.rotation_matrix(np.pi/2, [0, 1, 0]), translation=[2.2, y, 0])
                     
                     # Ears
                     for y in [-0.8, 0.8]:
-                        ear = trimesh.creation.box(extents=[0.1, 0.8, 1.0])
-                        ear.apply_translation([1.5, y, 0.5])
-                        meshes.append(ear)
+                        builder.box(extents=[0.1, 0.8, 1.0], translation=[1.5, y, 0.5])
                 
                 # Legs
                 for x, z in [(-0.8, -0.6), (-0.8, 0.6), (0.8, -0.6), (0.8, 0.6)]:
-                    leg = trimesh.creation.cylinder(radius=0.25, height=1.5, sections=16)
-                    leg.apply_translation([x, z, -1.2])
-                    meshes.append(leg)
+                    builder.cylinder(radius=0.25, height=1.5, sections=16, translation=[x, z, -1.2])
                 
                 colors = {
                     'elephant': [169, 169, 169, 255],
@@ -119,27 +92,18 @@ class GigaWorldGenerator:
             
             elif species in ['horse', 'deer', 'giraffe', 'zebra']:
                 # Slender body
-                body = trimesh.creation.capsule(radius=0.4, height=1.5)
-                body.apply_transform(trimesh.transformations.rotation_matrix(np.pi/2, [0, 0, 1]))
-                meshes.append(body)
+                builder.capsule(radius=0.4, height=1.5, transform=trimesh.transformations.rotation_matrix(np.pi/2, [0, 0, 1]))
                 
                 # Neck
                 neck_height = 1.5 if species == 'giraffe' else 0.8
-                neck = trimesh.creation.cylinder(radius=0.2, height=neck_height, sections=16)
-                neck.apply_transform(trimesh.transformations.rotation_matrix(np.pi/6, [0, 1, 0]))
-                neck.apply_translation([0.8, 0, neck_height/2])
-                meshes.append(neck)
+                builder.cylinder(radius=0.2, height=neck_height, sections=16, transform=trimesh.transformations.rotation_matrix(np.pi/6, [0, 1, 0]), translation=[0.8, 0, neck_height/2])
                 
                 # Head
-                head = trimesh.creation.box(extents=[0.3, 0.25, 0.4])
-                head.apply_translation([1.0, 0, neck_height + 0.3])
-                meshes.append(head)
+                builder.box(extents=[0.3, 0.25, 0.4], translation=[1.0, 0, neck_height + 0.3])
                 
                 # Legs
                 for x, z in [(-0.6, -0.3), (-0.6, 0.3), (0.6, -0.3), (0.6, 0.3)]:
-                    leg = trimesh.creation.cylinder(radius=0.08, height=1.2, sections=12)
-                    leg.apply_translation([x, z, -0.8])
-                    meshes.append(leg)
+                    builder.cylinder(radius=0.08, height=1.2, sections=12, translation=[x, z, -0.8])
                 
                 colors = {
                     'horse': [139, 69, 19, 255],
@@ -150,36 +114,24 @@ class GigaWorldGenerator:
         
         elif animal_type == 'birds':
             # Body
-            body = trimesh.creation.capsule(radius=0.15, height=0.4)
-            meshes.append(body)
+            builder.capsule(radius=0.15, height=0.4)
             
             # Head
-            head = trimesh.creation.icosphere(subdivisions=2, radius=0.12)
-            head.apply_translation([0, 0, 0.35])
-            meshes.append(head)
+            builder.icosphere(subdivisions=2, radius=0.12, translation=[0, 0, 0.35])
             
             # Beak
-            beak = trimesh.creation.cone(radius=0.04, height=0.15, sections=8)
-            beak.apply_transform(trimesh.transformations.rotation_matrix(np.pi/2, [0, 1, 0]))
-            beak.apply_translation([0, 0, 0.42])
-            meshes.append(beak)
+            builder.cone(radius=0.04, height=0.15, sections=8, transform=trimesh.transformations.rotation_matrix(np.pi/2, [0, 1, 0]), translation=[0, 0, 0.42])
             
             # Wings
             for y in [-0.25, 0.25]:
-                wing = trimesh.creation.box(extents=[0.05, 0.6, 0.3])
-                wing.apply_translation([0, y, 0.1])
-                meshes.append(wing)
+                builder.box(extents=[0.05, 0.6, 0.3], translation=[0, y, 0.1])
             
             # Tail
-            tail = trimesh.creation.box(extents=[0.05, 0.3, 0.4])
-            tail.apply_translation([0, 0, -0.4])
-            meshes.append(tail)
+            builder.box(extents=[0.05, 0.3, 0.4], translation=[0, 0, -0.4])
             
             # Legs
             for y in [-0.08, 0.08]:
-                leg = trimesh.creation.cylinder(radius=0.02, height=0.2, sections=8)
-                leg.apply_translation([0, y, -0.3])
-                meshes.append(leg)
+                builder.cylinder(radius=0.02, height=0.2, sections=8, translation=[0, y, -0.3])
             
             colors = {
                 'eagle': [101, 67, 33, 255],
@@ -188,18 +140,15 @@ class GigaWorldGenerator:
                 'dove': [255, 255, 255, 255]
             }
         
-        animal = trimesh.util.concatenate(meshes)
         color = colors.get(species, [139, 90, 43, 255])
-        animal.visual.vertex_colors = color
-        
-        return animal
+        return builder.build(color)
     
     @staticmethod
     def generate_person(profession: str = 'civilian', age: str = 'adult', 
                        body_type: str = 'average', pose: str = 'standing', 
-                       gender: str = 'male', detail: int = 5) -> trimesh.Trimesh:
+                       gender: str = 'male', detail: int = 5, seed: SeedLike = None) -> trimesh.Trimesh:
         """Generate anatomically accurate human"""
-        meshes = []
+        builder = MeshBuilder()
         
         # Body proportions based on age
         heights = {'baby': 0.5, 'toddler': 0.8, 'child': 1.2, 'teenager': 1.5, 
@@ -212,21 +161,16 @@ class GigaWorldGenerator:
         
         # Head
         head_size = 0.12 * height
-        head = trimesh.creation.icosphere(subdivisions=3, radius=head_size)
-        head.apply_translation([0, 0, height - head_size])
-        meshes.append(head)
+        builder.icosphere(subdivisions=3, radius=head_size, translation=[0, 0, height - head_size])
         
         # Neck
-        neck = trimesh.creation.cylinder(radius=head_size*0.4, height=head_size*0.8, sections=16)
-        neck.apply_translation([0, 0, height - head_size*2])
-        meshes.append(neck)
+        builder.cylinder(radius=head_size*0.4, height=head_size*0.8, sections=16, translation=[0, 0, height - head_size*2])
         
         # Torso
         torso_height = height * 0.4
         torso_width = head_size * 1.5 * body_scale
-        torso = trimesh.creation.box(extents=[torso_width*2, torso_width, torso_height])
-        torso.apply_translation([0, 0, height - head_size*2.5 - torso_height/2])
-        meshes.append(torso)
+        builder.box(extents=[torso_width*2, torso_width, torso_height],
+                    translation=[0, 0, height - head_size*2.5 - torso_height/2])
         
         # Arms
         arm_length = height * 0.35
@@ -240,18 +184,16 @@ class GigaWorldGenerator:
             angles = [(0, -1), (0, 1)]
         
         for angle, side in angles:
-            arm = trimesh.creation.capsule(radius=arm_radius, height=arm_length)
-            arm.apply_transform(trimesh.transformations.rotation_matrix(angle, [0, 1, 0]))
-            arm.apply_translation([0, side * (torso_width + arm_radius), height - head_size*2.5 - torso_height/3])
-            meshes.append(arm)
+            builder.capsule(radius=arm_radius, height=arm_length,
+                            transform=trimesh.transformations.rotation_matrix(angle, [0, 1, 0]),
+                            translation=[0, side * (torso_width + arm_radius), height - head_size*2.5 - torso_height/3])
             
             # Hand
-            hand = trimesh.creation.icosphere(subdivisions=2, radius=arm_radius*1.2)
             if pose == 'waving' and side == 1:
-                hand.apply_translation([0, side * (torso_width + arm_radius + arm_length/2), height - head_size*2])
+                hand_position = [0, side * (torso_width + arm_radius + arm_length/2), height - head_size*2]
             else:
-                hand.apply_translation([0, side * (torso_width + arm_radius), height - head_size*2.5 - torso_height - arm_length/2])
-            meshes.append(hand)
+                hand_position = [0, side * (torso_width + arm_radius), height - head_size*2.5 - torso_height - arm_length/2]
+            builder.icosphere(subdivisions=2, radius=arm_radius*1.2, translation=hand_position)
         
         # Legs
         leg_length = height * 0.45
@@ -267,37 +209,25 @@ class GigaWorldGenerator:
             leg_angles = [(0, -1), (0, 1)]
         
         for angle, side in leg_angles:
-            leg = trimesh.creation.capsule(radius=leg_radius, height=leg_length)
-            leg.apply_transform(trimesh.transformations.rotation_matrix(angle, [0, 1, 0]))
-            leg.apply_translation([0, side * torso_width/3, height - head_size*2.5 - torso_height - leg_length/2])
-            meshes.append(leg)
+            builder.capsule(radius=leg_radius, height=leg_length,
+                            transform=trimesh.transformations.rotation_matrix(angle, [0, 1, 0]),
+                            translation=[0, side * torso_width/3, height - head_size*2.5 - torso_height - leg_length/2])
             
             # Foot
-            foot = trimesh.creation.box(extents=[leg_radius*2.5, leg_radius*1.5, leg_radius])
-            if pose == 'sitting':
-                foot.apply_translation([leg_length/2, side * torso_width/3, height - head_size*2.5 - torso_height - leg_length])
-            else:
-                foot.apply_translation([0, side * torso_width/3, height - head_size*2.5 - torso_height - leg_length])
-            meshes.append(foot)
+            foot_x = leg_length/2 if pose == 'sitting' else 0
+            builder.box(extents=[leg_radius*2.5, leg_radius*1.5, leg_radius],
+                        translation=[foot_x, side * torso_width/3, height - head_size*2.5 - torso_height - leg_length])
         
         # Profession-specific additions
         if profession == 'police':
             # Hat
-            hat = trimesh.creation.cylinder(radius=head_size*1.1, height=head_size*0.3, sections=16)
-            hat.apply_translation([0, 0, height - head_size*0.3])
-            meshes.append(hat)
+            builder.cylinder(radius=head_size*1.1, height=head_size*0.3, sections=16, translation=[0, 0, height - head_size*0.3])
         elif profession == 'chef':
             # Chef hat
-            hat = trimesh.creation.cylinder(radius=head_size*0.8, height=head_size*1.5, sections=16)
-            hat.apply_translation([0, 0, height])
-            meshes.append(hat)
+            builder.cylinder(radius=head_size*0.8, height=head_size*1.5, sections=16, translation=[0, 0, height])
         elif profession == 'soldier':
             # Helmet
-            helmet = trimesh.creation.icosphere(subdivisions=2, radius=head_size*1.1)
-            helmet.apply_translation([0, 0, height - head_size])
-            meshes.append(helmet)
-        
-        person = trimesh.util.concatenate(meshes)
+            builder.icosphere(subdivisions=2, radius=head_size*1.1, translation=[0, 0, height - head_size])
         
         # Skin tones
         skin_tones = {
@@ -306,9 +236,8 @@ class GigaWorldGenerator:
             'tan': [198, 134, 66, 255],
             'dark': [141, 85, 36, 255]
         }
-        person.visual.vertex_colors = random.choice(list(skin_tones.values()))
-        
-        return person
+        tones = list(skin_tones.values())
+        return builder.build(tones[np.random.default_rng(seed).integers(len(tones))])
     
     @staticmethod
     def generate_all_world_objects(category: str, object_type: str, detail: int = 5) -> trimesh.Trimesh:
@@ -329,38 +258,28 @@ class GigaWorldGenerator:
         
         # Generate based on category and type
         if object_type == 'chair':
-            seat = trimesh.creation.box(extents=[0.5, 0.5, 0.05])
-            seat.apply_translation([0, 0, 0.5])
-            back = trimesh.creation.box(extents=[0.5, 0.05, 0.5])
-            back.apply_translation([0, -0.225, 0.75])
-            legs = []
+            builder = MeshBuilder()
+            builder.box(extents=[0.5, 0.5, 0.05], translation=[0, 0, 0.5])
+            builder.box(extents=[0.5, 0.05, 0.5], translation=[0, -0.225, 0.75])
             for x, y in [(-0.2, -0.2), (-0.2, 0.2), (0.2, -0.2), (0.2, 0.2)]:
-                leg = trimesh.creation.cylinder(radius=0.02, height=0.5, sections=8)
-                leg.apply_translation([x, y, 0.25])
-                legs.append(leg)
-            return trimesh.util.concatenate([seat, back] + legs)
+                builder.cylinder(radius=0.02, height=0.5, sections=8, translation=[x, y, 0.25])
+            return builder.build()
         
         elif object_type == 'table':
-            top = trimesh.creation.box(extents=[1.5, 1.0, 0.05])
-            top.apply_translation([0, 0, 0.75])
-            legs = []
+            builder = MeshBuilder()
+            builder.box(extents=[1.5, 1.0, 0.05], translation=[0, 0, 0.75])
             for x, y in [(-0.7, -0.45), (-0.7, 0.45), (0.7, -0.45), (0.7, 0.45)]:
-                leg = trimesh.creation.cylinder(radius=0.04, height=0.75, sections=8)
-                leg.apply_translation([x, y, 0.375])
-                legs.append(leg)
-            return trimesh.util.concatenate([top] + legs)
+                builder.cylinder(radius=0.04, height=0.75, sections=8, translation=[x, y, 0.375])
+            return builder.build()
         
         elif object_type == 'car':
-            body = trimesh.creation.box(extents=[4, 1.8, 1.2])
-            cabin = trimesh.creation.box(extents=[2, 1.6, 0.8])
-            cabin.apply_translation([0, 0, 1])
-            wheels = []
+            builder = MeshBuilder()
+            builder.box(extents=[4, 1.8, 1.2])
+            builder.box(extents=[2, 1.6, 0.8], translation=[0, 0, 1])
             for x, y in [(-1.3, -0.9), (-1.3, 0.9), (1.3, -0.9), (1.3, 0.9)]:
-                wheel = trimesh.creation.cylinder(radius=0.35, height=0.2, sections=16)
-                wheel.apply_transform(trimesh.transformations.rotation_matrix(np.pi/2, [0, 1, 0]))
-                wheel.apply_translation([x, y, 0])
-                wheels.append(wheel)
-            return trimesh.util.concatenate([body, cabin] + wheels)
+                builder.cylinder(radius=0.35, height=0.2, sections=16,
+                                 transform=trimesh.transformations.rotation_matrix(np.pi/2, [0, 1, 0]), translation=[x, y, 0])
+            return builder.build()
         
         # Default: simple box
         return trimesh.creation.box(extents=[1, 1, 1])
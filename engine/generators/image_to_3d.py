@@ -2,17 +2,55 @@ import cv2
 import numpy as np
 import trimesh
 from PIL import Image, ImageFilter, ImageEnhance
-from typing import Optional, Tuple, List
+from typing import Dict, Optional, Tuple, List
+from dataclasses import dataclass, field
+from contextlib import contextmanager
 import torch
 import torchvision.transforms as transforms
 from sklearn.cluster import KMeans
 from scipy import ndimage
 from skimage import measure, morphology, segmentation
 import open3d as o3d
+import time
+from ..procedural.grid_mesh import grid_mesh
+from .quality import CostModel, select_quality
+
+# Pyramid levels for multi-scale depth: full working resolution, then half and quarter size
+PYRAMID_LEVELS = 3
+# Segmentation clusters a copy of at most this many pixels, fit on a random sample of them
+SEGMENTATION_MAX_PIXELS = 256 * 256
+SEGMENTATION_SAMPLES = 10000
+
+# cv2.imread flags that let the JPEG decoder shrink by a power of two while decoding
+_REDUCED_READ_FLAGS = {8: cv2.IMREAD_REDUCED_COLOR_8, 4: cv2.IMREAD_REDUCED_COLOR_4, 2: cv2.IMREAD_REDUCED_COLOR_2}
+
+@contextmanager
+def _timed(timings: Dict[str, float], step: str):
+    """Add the wall time of the block to ``timings[step]``, in ms"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = (time.perf_counter() - start) * 1000.0
+        timings[step] = round(timings.get(step, 0.0) + elapsed, 2)
+
+@dataclass
+class PreparedImage:
+    """An image at working resolution plus the planes every generation step shares
+    
+    ``pyramid`` holds the grayscale image followed by successively halved
+    (Gaussian ``pyrDown``) levels. ``timings`` collects milliseconds per
+    step of preprocessing and generation.
+    """
+    image: np.ndarray
+    gray: np.ndarray
+    pyramid: List[np.ndarray]
+    timings: Dict[str, float] = field(default_factory=dict)
 
 class ImageTo3DGenerator:
     def __init__(self):
         self.depth_scale = 0.2
+        self.cost_models: Dict[str, CostModel] = {}
         self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
         self.transform = transforms.Compose([
             transforms.Resize((512, 512)),
@@ -20,58 +58,167 @@ class ImageTo3DGenerator:
             transforms.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225])
         ])
     
-    def generate_from_image(self, image_path: str, method: str = 'advanced') -> trimesh.Trimesh:
-        """Generate 3D model from image using advanced depth estimation"""
-        image = cv2.imread(image_path)
+    def generate_from_image(self, image_path: str, method: str = 'advanced',
+                            quality: Optional[str] = None, budget_ms: Optional[float] = None) -> trimesh.Trimesh:
+        """Generate 3D model from image using advanced depth estimation
+        
+        The image is decoded straight to the pixel budget of the ``quality``
+        tier (default "high"), or of the most detailed tier the method's cost
+        model predicts will finish within ``budget_ms``. The tier used is
+        reported in ``mesh.metadata['quality']`` and the time spent per step
+        in ``mesh.metadata['timings']``.
+        """
+        start = time.perf_counter()
+        h, w = self._image_size(image_path)
+        
+        model = self.cost_models.setdefault(method, CostModel())
+        if budget_ms is not None and not model.calibrated:
+            self.calibrate(method)
+        
+        level, report = select_quality(model, lambda level: self._fit_pixels(h * w, level.max_pixels),
+                                       quality, budget_ms)
+        
+        # Decoding is part of what a budget has to cover, so the model sees it too
+        build_start = time.perf_counter()
+        timings = {}
+        with _timed(timings, 'decode'):
+            image = self._decode(image_path, h * w, level.max_pixels)
+        
+        prepared = self._prepare(image, level.max_pixels, timings)
+        mesh = self._generate(prepared, method)
+        pixels = prepared.image.shape[0] * prepared.image.shape[1]
+        model.observe(pixels, (time.perf_counter() - build_start) * 1000.0)
+        
+        mesh.metadata['quality'] = {**report, 'pixels': pixels,
+                                    'elapsed_ms': round((time.perf_counter() - start) * 1000.0, 2)}
+        mesh.metadata['timings'] = prepared.timings
+        return mesh
+    
+    def _generate(self, prepared: PreparedImage, method: str) -> trimesh.Trimesh:
+        if method == 'advanced':
+            return self._advanced_generation(prepared)
+        
+        with _timed(prepared.timings, method):
+            if method == 'photogrammetry':
+                return self._photogrammetry_style(prepared)
+            elif method == 'volumetric':
+                return self._volumetric_reconstruction(prepared)
+            else:
+                return self._basic_generation(prepared)
+    
+    def calibrate(self, method: str = 'advanced'):
+        """Fit a method's cost model by timing synthetic JPEGs of a few sizes, decode included"""
+        rng = np.random.default_rng(0)
+        workloads = [32 * 32, 64 * 64, 96 * 96]
+        encoded = {}
+        for pixels in workloads:
+            side = max(int(np.sqrt(pixels)), 8)
+            ramp = np.linspace(0, 255, side)
+            image = (ramp[:, None, None] + ramp[None, :, None]) / 2 + rng.normal(0, 20, (side, side, 3))
+            encoded[pixels] = cv2.imencode('.jpg', np.clip(image, 0, 255).astype(np.uint8))[1]
+        
+        def run(pixels: int):
+            self._generate(self._prepare(cv2.imdecode(encoded[pixels], cv2.IMREAD_COLOR)), method)
+        
+        self.cost_models.setdefault(method, CostModel()).calibrate(run, workloads)
+    
+    @staticmethod
+    def _fit_pixels(pixels: int, max_pixels: Optional[int]) -> int:
+        return pixels if max_pixels is None else min(pixels, max_pixels)
+    
+    @staticmethod
+    def _image_size(image_path: str) -> Tuple[int, int]:
+        """``(height, width)`` from the image header, without decoding pixels"""
+        try:
+            with Image.open(image_path) as header:
+                width, height = header.size
+        except (OSError, ValueError):
+            raise ValueError(f"Could not load image: {image_path}")
+        return height, width
+    
+    @staticmethod
+    def _decode(image_path: str, pixels: int, max_pixels: Optional[int]) -> np.ndarray:
+        """Decode at the largest power-of-two reduction (up to 8x) that keeps ``max_pixels``
+        
+        JPEGs are then scaled down while decoding instead of being fully
+        decoded first; ``_prepare`` area-resizes the rest of the way.
+        """
+        flags = cv2.IMREAD_COLOR
+        if max_pixels is not None:
+            for factor, reduced in _REDUCED_READ_FLAGS.items():
+                if pixels / (factor * factor) >= max_pixels:
+                    flags = reduced
+                    break
+        
+        image = cv2.imread(image_path, flags)
         if image is None:
             raise ValueError(f"Could not load image: {image_path}")
-        
-        if method == 'advanced':
-            return self._advanced_generation(image)
-        elif method == 'photogrammetry':
-            return self._photogrammetry_style(image)
-        elif method == 'volumetric':
-            return self._volumetric_reconstruction(image)
-        else:
-            return self._basic_generation(image)
+        return image
     
-    def _advanced_generation(self, image: np.ndarray) -> trimesh.Trimesh:
+    @staticmethod
+    def _downscale_to(image: np.ndarray, max_pixels: Optional[int]) -> np.ndarray:
+        """Area-downscale an image to at most ``max_pixels``, keeping its aspect ratio"""
+        h, w = image.shape[:2]
+        if max_pixels is None or h * w <= max_pixels:
+            return image
+        scale = np.sqrt(max_pixels / (h * w))
+        size = (max(int(w * scale), 1), max(int(h * scale), 1))
+        return cv2.resize(image, size, interpolation=cv2.INTER_AREA)
+    
+    def _prepare(self, image: np.ndarray, max_pixels: Optional[int] = None,
+                 timings: Optional[Dict[str, float]] = None) -> PreparedImage:
+        """Fit an image to ``max_pixels`` and build its grayscale pyramid once for all steps"""
+        timings = {} if timings is None else timings
+        with _timed(timings, 'resize'):
+            image = self._downscale_to(image, max_pixels)
+        
+        with _timed(timings, 'pyramid'):
+            gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+            pyramid = [gray]
+            for _ in range(PYRAMID_LEVELS - 1):
+                if min(pyramid[-1].shape) < 2:
+                    break
+                pyramid.append(cv2.pyrDown(pyramid[-1]))
+        
+        return PreparedImage(image, gray, pyramid, timings)
+    
+    def _advanced_generation(self, prepared: PreparedImage) -> trimesh.Trimesh:
         """Advanced 3D generation with multiple techniques"""
+        timings = prepared.timings
+        
         # Multi-scale depth estimation
-        depth_maps = self._multi_scale_depth(image)
+        with _timed(timings, 'depth'):
+            depth_maps = self._multi_scale_depth(prepared)
         
         # Edge-aware depth refinement
-        refined_depth = self._refine_depth_edges(depth_maps, image)
+        with _timed(timings, 'refine'):
+            refined_depth = self._refine_depth_edges(depth_maps, prepared)
         
         # Semantic segmentation for better structure
-        segments = self._semantic_segmentation(image)
+        with _timed(timings, 'segmentation'):
+            segments = self._semantic_segmentation(prepared)
         
         # Generate mesh with improved topology
-        mesh = self._advanced_mesh_generation(refined_depth, image, segments)
+        with _timed(timings, 'mesh'):
+            mesh = self._advanced_mesh_generation(refined_depth, prepared.image, segments)
         
         # Post-processing
-        mesh = self._mesh_post_processing(mesh)
+        with _timed(timings, 'post_process'):
+            mesh = self._mesh_post_processing(mesh)
         
         return mesh
     
-    def _multi_scale_depth(self, image: np.ndarray) -> List[np.ndarray]:
-        """Generate depth maps at multiple scales"""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    def _multi_scale_depth(self, prepared: PreparedImage) -> List[np.ndarray]:
+        """Generate depth maps at each pyramid level, upsampled to full size"""
+        h, w = prepared.gray.shape
         depth_maps = []
         
-        scales = [1.0, 0.5, 0.25]
-        for scale in scales:
-            if scale != 1.0:
-                h, w = gray.shape
-                scaled = cv2.resize(gray, (int(w*scale), int(h*scale)))
-            else:
-                scaled = gray
-            
+        for level in prepared.pyramid:
             # Enhanced depth estimation
-            depth = self._enhanced_depth_estimation(scaled)
+            depth = self._enhanced_depth_estimation(level)
             
-            if scale != 1.0:
-                depth = cv2.resize(depth, (gray.shape[1], gray.shape[0]))
+            if level.shape != (h, w):
+                depth = cv2.resize(depth, (w, h))
             
             depth_maps.append(depth)
         
@@ -103,11 +250,10 @@ class ImageTo3DGenerator:
         
         return combined_depth * self.depth_scale
     
-    def _refine_depth_edges(self, depth_maps: List[np.ndarray], image: np.ndarray) -> np.ndarray:
+    def _refine_depth_edges(self, depth_maps: List[np.ndarray], prepared: PreparedImage) -> np.ndarray:
         """Refine depth using edge information"""
         # Detect edges in original image
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        edges = cv2.Canny(gray, 50, 150)
+        edges = cv2.Canny(prepared.gray, 50, 150)
         
         # Combine multi-scale depth maps
         base_depth = depth_maps[0]
@@ -125,89 +271,67 @@ class ImageTo3DGenerator:
         
         return refined_depth
     
-    def _semantic_segmentation(self, image: np.ndarray) -> np.ndarray:
-        """Basic semantic segmentation for structure understanding"""
+    def _semantic_segmentation(self, prepared: PreparedImage) -> np.ndarray:
+        """Basic semantic segmentation for structure understanding
+        
+        Regions are found on a copy of at most ``SEGMENTATION_MAX_PIXELS``:
+        k-means is fit on a fixed random sample of its pixels, every pixel
+        is assigned to the nearest center, and the cleaned-up labels are
+        upsampled to full size with nearest-neighbour interpolation.
+        """
+        h, w = prepared.gray.shape
+        small = self._downscale_to(prepared.image, SEGMENTATION_MAX_PIXELS)
+        
         # Convert to LAB color space for better segmentation
-        lab = cv2.cvtColor(image, cv2.COLOR_BGR2LAB)
+        lab = cv2.cvtColor(small, cv2.COLOR_BGR2LAB)
         
         # K-means clustering for region segmentation
-        data = lab.reshape((-1, 3))
-        kmeans = KMeans(n_clusters=8, random_state=42, n_init=10)
-        labels = kmeans.fit_predict(data)
+        data = lab.reshape((-1, 3)).astype(np.float32)
+        sample = data
+        if len(data) > SEGMENTATION_SAMPLES:
+            sample = data[np.random.default_rng(42).choice(len(data), SEGMENTATION_SAMPLES, replace=False)]
+        kmeans = KMeans(n_clusters=8, random_state=42, n_init=10).fit(sample)
         
-        segmented = labels.reshape(image.shape[:2])
+        segmented = kmeans.predict(data).reshape(small.shape[:2]).astype(np.uint8)
         
-        # Morphological operations to clean up segments
-        segmented = morphology.closing(segmented, morphology.disk(3))
-        segmented = morphology.opening(segmented, morphology.disk(2))
+        # Morphological operations to clean up segments, with radii scaled to the reduced size
+        scale = small.shape[0] / h
+        segmented = morphology.closing(segmented, morphology.disk(max(int(round(3 * scale)), 1)))
+        segmented = morphology.opening(segmented, morphology.disk(max(int(round(2 * scale)), 1)))
         
+        if segmented.shape != (h, w):
+            segmented = cv2.resize(segmented, (w, h), interpolation=cv2.INTER_NEAREST)
         return segmented
     
     def _advanced_mesh_generation(self, depth_map: np.ndarray, image: np.ndarray, segments: np.ndarray) -> trimesh.Trimesh:
         """Generate mesh with improved topology"""
         h, w = depth_map.shape
         
-        # Adaptive resolution based on depth variation
-        depth_variance = ndimage.generic_filter(depth_map, np.var, size=5)
+        # Adaptive resolution based on depth variation: 5x5 variance as E[d^2] - E[d]^2 from box filters
+        depth = depth_map.astype(np.float64)
+        local_mean = ndimage.uniform_filter(depth, size=5)
+        depth_variance = np.maximum(ndimage.uniform_filter(depth * depth, size=5) - local_mean * local_mean, 0.0)
         high_detail_mask = depth_variance > np.percentile(depth_variance, 75)
         
-        vertices = []
-        faces = []
-        colors = []
-        
-        # Generate vertices with adaptive sampling
-        vertex_map = np.full((h, w), -1, dtype=int)
-        vertex_count = 0
-        
-        for i in range(0, h, 1):
-            for j in range(0, w, 1):
-                # Skip vertices in low-detail areas (subsample)
-                if not high_detail_mask[i, j] and (i % 2 != 0 or j % 2 != 0):
-                    continue
-                
-                x = (j / w - 0.5) * 2
-                y = (i / h - 0.5) * 2
-                z = depth_map[i, j]
-                
-                vertices.append([x, -y, z])  # Flip Y for correct orientation
-                colors.append(image[i, j] / 255.0)
-                vertex_map[i, j] = vertex_count
-                vertex_count += 1
-        
-        # Generate faces with better triangulation
-        for i in range(h - 1):
-            for j in range(w - 1):
-                # Get vertex indices
-                v1 = vertex_map[i, j]
-                v2 = vertex_map[i, j + 1]
-                v3 = vertex_map[i + 1, j]
-                v4 = vertex_map[i + 1, j + 1]
-                
-                # Skip if any vertex is missing
-                if v1 == -1 or v2 == -1 or v3 == -1 or v4 == -1:
-                    continue
-                
-                # Create triangles with better aspect ratios
-                depth_diff1 = abs(depth_map[i, j] - depth_map[i + 1, j + 1])
-                depth_diff2 = abs(depth_map[i, j + 1] - depth_map[i + 1, j])
-                
-                if depth_diff1 < depth_diff2:
-                    faces.extend([[v1, v2, v4], [v1, v4, v3]])
-                else:
-                    faces.extend([[v1, v2, v3], [v2, v4, v3]])
-        
-        mesh = trimesh.Trimesh(vertices=np.array(vertices), faces=np.array(faces))
-        
-        # Add vertex colors
-        if colors:
-            mesh.visual.vertex_colors = np.array(colors)
+        # Keep every vertex in high-detail areas and every other row/column elsewhere (subsample)
+        rows, cols = np.mgrid[0:h, 0:w]
+        vertex_mask = high_detail_mask | ((rows % 2 == 0) & (cols % 2 == 0))
         
-        return mesh
+        x = (cols / w - 0.5) * 2
+        y = (rows / h - 0.5) * 2
+        points = np.stack([x, -y, depth_map], axis=-1)  # Flip Y for correct orientation
+        
+        # Split each cell along its diagonal with the smaller depth change, for better aspect ratios
+        depth_diff1 = np.abs(depth_map[:-1, :-1] - depth_map[1:, 1:])
+        depth_diff2 = np.abs(depth_map[:-1, 1:] - depth_map[1:, :-1])
+        
+        return grid_mesh(points, colors=image / 255.0, vertex_mask=vertex_mask,
+                         alternate_diagonal=depth_diff1 < depth_diff2)
     
-    def _photogrammetry_style(self, image: np.ndarray) -> trimesh.Trimesh:
+    def _photogrammetry_style(self, prepared: PreparedImage) -> trimesh.Trimesh:
         """Generate 3D model using photogrammetry-inspired techniques"""
         # Feature detection and matching (simulated)
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = prepared.gray
         
         # SIFT features for key points
         sift = cv2.SIFT_create()
@@ -227,12 +351,12 @@ class ImageTo3DGenerator:
         intensity_depth = gray.astype(np.float32) / 255.0
         combined_depth = 0.6 * intensity_depth + 0.4 * (feature_map / feature_map.max())
         
-        return self._depth_to_mesh(combined_depth * self.depth_scale, image)
+        return self._depth_to_mesh(combined_depth * self.depth_scale, prepared.image)
     
-    def _volumetric_reconstruction(self, image: np.ndarray) -> trimesh.Trimesh:
+    def _volumetric_reconstruction(self, prepared: PreparedImage) -> trimesh.Trimesh:
         """Volumetric reconstruction approach"""
         # Create voxel grid from image
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        gray = prepared.gray
         
         # Threshold for solid voxels
         threshold = np.mean(gray)
@@ -259,13 +383,12 @@ class ImageTo3DGenerator:
             return trimesh.Trimesh(vertices=vertices, faces=faces)
         except:
             # Fallback to basic method
-            return self._basic_generation(image)
+            return self._basic_generation(prepared)
     
-    def _basic_generation(self, image: np.ndarray) -> trimesh.Trimesh:
+    def _basic_generation(self, prepared: PreparedImage) -> trimesh.Trimesh:
         """Basic depth-based generation (fallback)"""
-        gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
-        depth_map = self._create_depth_map(gray)
-        return self._depth_to_mesh(depth_map, image)
+        depth_map = self._create_depth_map(prepared.gray)
+        return self._depth_to_mesh(depth_map, prepared.image)
     
     def _create_depth_map(self, image: np.ndarray) -> np.ndarray:
         """Create enhanced depth map from grayscale image"""
@@ -283,29 +406,15 @@ class ImageTo3DGenerator:
         
         # Create vertex grid
         x, y = np.meshgrid(np.linspace(-1, 1, w), np.linspace(-1, 1, h))
-        vertices = np.column_stack([x.flatten(), -y.flatten(), depth_map.flatten()])
+        points = np.stack([x, -y, depth_map], axis=-1)
         
         # Extract colors
         if len(image.shape) == 3:
-            colors = image.reshape(-1, 3) / 255.0
+            colors = image / 255.0
         else:
-            colors = np.tile(image.reshape(-1, 1) / 255.0, (1, 3))
-        
-        # Create faces
-        faces = []
-        for i in range(h - 1):
-            for j in range(w - 1):
-                v1 = i * w + j
-                v2 = i * w + (j + 1)
-                v3 = (i + 1) * w + j
-                v4 = (i + 1) * w + (j + 1)
-                
-                faces.extend([[v1, v2, v3], [v2, v4, v3]])
-        
-        mesh = trimesh.Trimesh(vertices=vertices, faces=np.array(faces))
-        mesh.visual.vertex_colors = colors
+            colors = np.repeat(image[..., None] / 255.0, 3, axis=-1)
         
-        return mesh
+        return grid_mesh(points, colors=colors)
     
     def _mesh_post_processing(self, mesh: trimesh.Trimesh) -> trimesh.Trimesh:
         """Post-process mesh for better quality"""
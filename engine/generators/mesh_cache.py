@@ -0,0 +1,96 @@
+import dataclasses
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+import numpy as np
+import trimesh
+from ..core.nlp_processor import ObjectDescription
+
+class MeshCache:
+    """Bounded LRU of generated meshes with their parsed descriptions.
+    
+    Entries hold read-only copies of the mesh arrays and are accounted by
+    their byte size. ``get`` and ``put`` both return a new mesh sharing those
+    arrays, so hits and misses hand out the same kind of mesh and a hit costs
+    no copy: trimesh operations replace arrays rather than writing into them,
+    and writing into a cached array in place raises instead of corrupting the
+    cache.
+    """
+    
+    def __init__(self, max_bytes: int = 256 << 20, max_entries: int = 1024):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        
+        self.entries: OrderedDict = OrderedDict()
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0}
+    
+    @staticmethod
+    def normalize(description: str) -> str:
+        return ' '.join(description.lower().split())
+    
+    def get(self, key: Hashable) -> Optional[Tuple[trimesh.Trimesh, ObjectDescription]]:
+        """Return ``(mesh, description)`` for a key, or None"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.stats['misses'] += 1
+                return None
+            self.entries.move_to_end(key)
+            self.stats['hits'] += 1
+        
+        arrays, description, _ = entry
+        return self._view(arrays), dataclasses.replace(description, properties=dict(description.properties))
+    
+    @staticmethod
+    def _view(arrays: Dict[str, np.ndarray]) -> trimesh.Trimesh:
+        return trimesh.Trimesh(vertices=arrays['vertices'], faces=arrays['faces'],
+                               vertex_colors=arrays.get('vertex_colors'), process=False)
+    
+    def put(self, key: Hashable, mesh: trimesh.Trimesh, description: ObjectDescription) -> trimesh.Trimesh:
+        """Store a read-only copy of ``mesh`` and return a mesh over it, as ``get`` would"""
+        arrays = {'vertices': np.array(mesh.vertices), 'faces': np.array(mesh.faces)}
+        if mesh.visual.kind == 'vertex':
+            arrays['vertex_colors'] = np.array(mesh.visual.vertex_colors)
+        for array in arrays.values():
+            array.flags.writeable = False
+        nbytes = sum(array.nbytes for array in arrays.values())
+        if nbytes > self.max_bytes:
+            return self._view(arrays)
+        
+        with self.lock:
+            previous = self.entries.pop(key, None)
+            if previous is not None:
+                self.total_bytes -= previous[2]
+            self.entries[key] = (arrays, dataclasses.replace(description, properties=dict(description.properties)), nbytes)
+            self.total_bytes += nbytes
+            
+            while self.total_bytes > self.max_bytes or len(self.entries) > self.max_entries:
+                _, (_, _, evicted_bytes) = self.entries.popitem(last=False)
+                self.total_bytes -= evicted_bytes
+                self.stats['evictions'] += 1
+        
+        return self._view(arrays)
+    
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.total_bytes = 0
+    
+    def get_stats(self) -> Dict:
+        with self.lock:
+            return {**self.stats, 'entries': len(self.entries), 'bytes': self.total_bytes,
+                    'max_bytes': self.max_bytes}
+
+_shared_cache = None
+_shared_lock = threading.Lock()
+
+def get_mesh_cache() -> MeshCache:
+    """Process-wide cache shared by every TextTo3DGenerator"""
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_lock:
+            if _shared_cache is None:
+                _shared_cache = MeshCache()
+    return _shared_cache
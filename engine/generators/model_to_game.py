@@ -96,7 +96,7 @@ class ModelToGameConverter:
                 target_faces = max(target_faces, 4)  # Minimum faces
                 
                 try:
-                    lod_mesh = mesh.simplify_quadric_decimation(target_faces)
+                    lod_mesh = mesh.simplify_quadric_decimation(face_count=target_faces)
                     lods.append(lod_mesh)
                 except:
                     lods.append(mesh.copy())
@@ -123,7 +123,7 @@ class ModelToGameConverter:
         # Simplified mesh collision
         target_faces = max(int(len(mesh.faces) * self.collision_simplification), 8)
         try:
-            collision_meshes['mesh'] = mesh.simplify_quadric_decimation(target_faces)
+            collision_meshes['mesh'] = mesh.simplify_quadric_decimation(face_count=target_faces)
         except:
             collision_meshes['mesh'] = collision_meshes['convex']
         
@@ -186,7 +186,7 @@ class ModelToGameConverter:
             
             # Simplify heavily for pathfinding
             target_faces = max(len(mesh.faces) // 10, 10)
-            navmesh = navmesh.simplify_quadric_decimation(target_faces)
+            navmesh = navmesh.simplify_quadric_decimation(face_count=target_faces)
             
             return navmesh
         except:
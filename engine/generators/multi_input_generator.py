@@ -1,8 +1,9 @@
 import numpy as np
 import trimesh
 import cv2
-from typing import List, Tuple, Union
+from typing import List, Optional, Tuple, Union
 from PIL import Image
+from ..procedural.seeding import SeedLike
 
 class MultiInputGenerator:
     """Generate 3 advanced objects from any combination of inputs"""
@@ -12,46 +13,51 @@ class MultiInputGenerator:
         text: str = None,
         images: List[str] = None,
         reference_3d: str = None,
-        style: str = 'realistic'
+        style: str = 'realistic',
+        seed: SeedLike = None
     ) -> List[trimesh.Trimesh]:
         """Generate 3 unique advanced objects from combined inputs"""
+        rng = np.random.default_rng(seed)
+        # The text generator caches by integer seed; unseeded requests stay unseeded so random shapes aren't cached
+        text_seeds = [None, None] if seed is None else [int(s) for s in rng.integers(2**32, size=2)]
         
         objects = []
         
         # Object 1: Primary from text
         if text:
-            obj1 = MultiInputGenerator._generate_from_text_advanced(text, style)
+            obj1 = MultiInputGenerator._generate_from_text_advanced(text, style, text_seeds[0], rng)
             objects.append(obj1)
         
         # Object 2: From images
         if images and len(images) > 0:
-            obj2 = MultiInputGenerator._generate_from_images_fusion(images, style)
+            obj2 = MultiInputGenerator._generate_from_images_fusion(images, style, rng)
             objects.append(obj2)
         
         # Object 3: Hybrid combination
         if text and images:
-            obj3 = MultiInputGenerator._generate_hybrid(text, images, style)
+            obj3 = MultiInputGenerator._generate_hybrid(text, images, style, text_seeds[1])
             objects.append(obj3)
         elif reference_3d:
-            obj3 = MultiInputGenerator._generate_variation(reference_3d, style)
+            obj3 = MultiInputGenerator._generate_variation(reference_3d, style, rng)
             objects.append(obj3)
         
         # Ensure we have 3 objects
         while len(objects) < 3:
-            objects.append(MultiInputGenerator._generate_procedural(style))
+            objects.append(MultiInputGenerator._generate_procedural(style, rng))
         
         return objects[:3]
     
     @staticmethod
-    def _generate_from_text_advanced(text: str, style: str) -> trimesh.Trimesh:
+    def _generate_from_text_advanced(text: str, style: str, text_seed: Optional[int],
+                                     rng: np.random.Generator) -> trimesh.Trimesh:
         """Advanced text-to-3D with style"""
         from ..generators.text_to_3d import TextTo3DGenerator
         
         gen = TextTo3DGenerator()
-        mesh = gen.generate_from_text(text)
+        mesh = gen.generate_from_text(text, seed=text_seed)
         
         if style == 'cartoon':
-            mesh = MultiInputGenerator._apply_cartoon_style(mesh)
+            mesh = MultiInputGenerator._apply_cartoon_style(mesh, rng)
         elif style == 'lowpoly':
             mesh = MultiInputGenerator._apply_lowpoly_style(mesh)
         elif style == 'detailed':
@@ -60,7 +66,7 @@ class MultiInputGenerator:
         return mesh
     
     @staticmethod
-    def _generate_from_images_fusion(images: List[str], style: str) -> trimesh.Trimesh:
+    def _generate_from_images_fusion(images: List[str], style: str, rng: np.random.Generator) -> trimesh.Trimesh:
         """Fuse multiple images into single 3D object"""
         from ..generators.image_to_3d import ImageTo3DGenerator
         
@@ -75,7 +81,7 @@ class MultiInputGenerator:
                 pass
         
         if not meshes:
-            return MultiInputGenerator._generate_procedural(style)
+            return MultiInputGenerator._generate_procedural(style, rng)
         
         # Combine meshes
         if len(meshes) == 1:
@@ -90,7 +96,7 @@ class MultiInputGenerator:
         return combined
     
     @staticmethod
-    def _generate_hybrid(text: str, images: List[str], style: str) -> trimesh.Trimesh:
+    def _generate_hybrid(text: str, images: List[str], style: str, text_seed: Optional[int]) -> trimesh.Trimesh:
         """Generate hybrid object from text and images"""
         from ..generators.text_to_3d import TextTo3DGenerator
         from ..generators.image_to_3d import ImageTo3DGenerator
@@ -99,7 +105,7 @@ class MultiInputGenerator:
         image_gen = ImageTo3DGenerator()
         
         # Base from text
-        base_mesh = text_gen.generate_from_text(text)
+        base_mesh = text_gen.generate_from_text(text, seed=text_seed)
         
         # Texture/detail from image
         if images and len(images) > 0:
@@ -121,7 +127,7 @@ class MultiInputGenerator:
         return base_mesh
     
     @staticmethod
-    def _generate_variation(reference_path: str, style: str) -> trimesh.Trimesh:
+    def _generate_variation(reference_path: str, style: str, rng: np.random.Generator) -> trimesh.Trimesh:
         """Generate variation of reference 3D model"""
         try:
             ref_mesh = trimesh.load(reference_path)
@@ -130,35 +136,35 @@ class MultiInputGenerator:
             varied = ref_mesh.copy()
             
             # Apply random transformations
-            scale_factor = np.random.uniform(0.8, 1.2, 3)
+            scale_factor = rng.uniform(0.8, 1.2, 3)
             varied.apply_scale(scale_factor)
             
             # Add noise to vertices
-            noise = np.random.normal(0, 0.02, varied.vertices.shape)
+            noise = rng.normal(0, 0.02, varied.vertices.shape)
             varied.vertices += noise
             
             # Change colors
             if hasattr(varied.visual, 'vertex_colors'):
-                color_shift = np.random.randint(-30, 30, 3)
+                color_shift = rng.integers(-30, 30, 3)
                 colors = varied.visual.vertex_colors[:, :3].astype(int)
                 colors = np.clip(colors + color_shift, 0, 255).astype(np.uint8)
                 varied.visual.vertex_colors[:, :3] = colors
             
             return varied
         except:
-            return MultiInputGenerator._generate_procedural(style)
+            return MultiInputGenerator._generate_procedural(style, rng)
     
     @staticmethod
-    def _generate_procedural(style: str) -> trimesh.Trimesh:
+    def _generate_procedural(style: str, rng: np.random.Generator) -> trimesh.Trimesh:
         """Generate procedural object"""
-        shape_type = np.random.choice(['complex', 'organic', 'geometric'])
+        shape_type = rng.choice(['complex', 'organic', 'geometric'])
         
         if shape_type == 'complex':
             # Multi-part object
             parts = []
-            for _ in range(np.random.randint(3, 7)):
-                part = trimesh.creation.icosphere(radius=np.random.uniform(0.5, 2), subdivisions=2)
-                offset = np.random.uniform(-3, 3, 3)
+            for _ in range(rng.integers(3, 7)):
+                part = trimesh.creation.icosphere(radius=rng.uniform(0.5, 2), subdivisions=2)
+                offset = rng.uniform(-3, 3, 3)
                 part.apply_translation(offset)
                 parts.append(part)
             mesh = trimesh.util.concatenate(parts)
@@ -168,22 +174,22 @@ class MultiInputGenerator:
             mesh = trimesh.creation.icosphere(radius=2, subdivisions=3)
             vertices = mesh.vertices.copy()
             for i in range(len(vertices)):
-                noise_val = np.random.normal(0, 0.3)
+                noise_val = rng.normal(0, 0.3)
                 vertices[i] += mesh.vertex_normals[i] * noise_val
             mesh.vertices = vertices
         
         else:
             # Geometric
-            mesh = trimesh.creation.box(extents=np.random.uniform(1, 3, 3))
+            mesh = trimesh.creation.box(extents=rng.uniform(1, 3, 3))
         
         # Apply style
         if style == 'cartoon':
-            mesh = MultiInputGenerator._apply_cartoon_style(mesh)
+            mesh = MultiInputGenerator._apply_cartoon_style(mesh, rng)
         
         return mesh
     
     @staticmethod
-    def _apply_cartoon_style(mesh: trimesh.Trimesh) -> trimesh.Trimesh:
+    def _apply_cartoon_style(mesh: trimesh.Trimesh, rng: np.random.Generator) -> trimesh.Trimesh:
         """Apply cartoon styling"""
         # Simplify
         target_faces = max(len(mesh.faces) // 3, 100)
@@ -198,7 +204,7 @@ class MultiInputGenerator:
             colors = np.clip(colors * 1.3, 0, 255).astype(np.uint8)
             mesh.visual.vertex_colors[:, :3] = colors
         else:
-            color = np.random.randint(100, 255, 3)
+            color = rng.integers(100, 255, 3)
             mesh.visual.vertex_colors = np.tile([*color, 255], (len(mesh.vertices), 1))
         
         return mesh
@@ -229,10 +235,11 @@ class MultiInputGenerator:
         text_prompts: List[str] = None,
         image_paths: List[str] = None,
         count: int = 10,
-        style: str = 'realistic'
+        style: str = 'realistic',
+        seed: SeedLike = None
     ) -> List[trimesh.Trimesh]:
         """Generate batch of objects"""
-        
+        rng = np.random.default_rng(seed)
         objects = []
         
         for i in range(count):
@@ -242,7 +249,8 @@ class MultiInputGenerator:
             batch_objects = MultiInputGenerator.generate_from_multi_input(
                 text=text,
                 images=images,
-                style=style
+                style=style,
+                seed=None if seed is None else rng
             )
             
             objects.extend(batch_objects)
@@ -0,0 +1,117 @@
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Tuple
+import numpy as np
+
+@dataclass(frozen=True)
+class QualityLevel:
+    """Resolution parameters for one quality tier
+    
+    Text generators refine these by description: smooth materials get one
+    more sphere subdivision and twice the sections, detailed planes five
+    times the resolution. ``max_pixels`` caps the image area fed to image
+    generation (None keeps full resolution).
+    """
+    name: str
+    subdivisions: int
+    sections: int
+    torus_sections: Tuple[int, int]
+    plane_resolution: int
+    max_pixels: Optional[int]
+
+# Ordered cheapest first; "high" reproduces the fixed parameters used before tiers existed
+QUALITY_LEVELS = [
+    QualityLevel('preview', 0, 6, (12, 6), 4, 128 * 128),
+    QualityLevel('low', 1, 8, (16, 8), 6, 256 * 256),
+    QualityLevel('medium', 1, 12, (24, 12), 8, 512 * 512),
+    QualityLevel('high', 2, 16, (32, 16), 10, 1024 * 1024),
+    QualityLevel('ultra', 3, 32, (64, 32), 20, None),
+]
+LEVELS_BY_NAME = {level.name: level for level in QUALITY_LEVELS}
+DEFAULT_QUALITY = 'high'
+
+def get_quality_level(name: Optional[str]) -> QualityLevel:
+    if name is None:
+        return LEVELS_BY_NAME[DEFAULT_QUALITY]
+    if name not in LEVELS_BY_NAME:
+        raise ValueError(f"Unknown quality '{name}', expected one of {list(LEVELS_BY_NAME)}")
+    return LEVELS_BY_NAME[name]
+
+class CostModel:
+    """Linear latency model, ``ms = fixed + per_unit * work``, fit on this machine
+    
+    ``work`` is whatever drives a generator's cost (vertices for text, pixels
+    for images). Calibration samples seed the fit and every timed generation
+    is added afterwards, so the model follows the actual load. Only the most
+    recent ``max_samples`` are kept.
+    """
+    
+    def __init__(self, max_samples: int = 64):
+        self.samples = deque(maxlen=max_samples)
+        self.fixed_ms = 0.0
+        self.per_unit_ms = 0.0
+        self.lock = threading.Lock()
+    
+    @property
+    def calibrated(self) -> bool:
+        return len(self.samples) >= 2
+    
+    def calibrate(self, run: Callable[[int], None], workloads: Iterable[int]):
+        """Time ``run(work)`` for each workload (after one warm-up run) and refit"""
+        workloads = list(workloads)
+        run(workloads[0])
+        for work in workloads:
+            start = time.perf_counter()
+            run(work)
+            self.observe(work, (time.perf_counter() - start) * 1000.0)
+    
+    def observe(self, work: int, elapsed_ms: float):
+        with self.lock:
+            self.samples.append((float(work), float(elapsed_ms)))
+            if len(self.samples) < 2:
+                return
+            work_values, times = np.array(self.samples).T
+            if np.ptp(work_values) == 0:
+                self.fixed_ms, self.per_unit_ms = 0.0, float(times.mean() / max(work_values[0], 1.0))
+                return
+            slope, intercept = np.polyfit(work_values, times, 1)
+            if intercept < 0:
+                # A negative fixed cost is noise; refit through the origin rather than just
+                # dropping it, which would underpredict every small workload
+                slope, intercept = float(work_values @ times / (work_values @ work_values)), 0.0
+            self.per_unit_ms = max(float(slope), 0.0)
+            self.fixed_ms = float(intercept)
+    
+    def predict(self, work: int) -> float:
+        return self.fixed_ms + self.per_unit_ms * work
+    
+    def get_stats(self) -> Dict:
+        with self.lock:
+            return {'fixed_ms': self.fixed_ms, 'per_unit_ms': self.per_unit_ms, 'samples': len(self.samples)}
+
+def select_quality(model: CostModel, estimate_work: Optional[Callable[[QualityLevel], int]] = None,
+                   quality: Optional[str] = None, budget_ms: Optional[float] = None) -> Tuple[QualityLevel, Dict]:
+    """Pick a tier and describe the choice
+    
+    Without a budget the named tier (default "high") is used as is. With
+    ``budget_ms`` the highest tier up to the named one (up to "ultra" if
+    none is named) whose predicted time for ``estimate_work(level)`` fits
+    is chosen, falling back to the cheapest tier when none does.
+    """
+    ceiling = get_quality_level(quality if quality is not None or budget_ms is None else 'ultra')
+    report = {'level': ceiling.name, 'requested': quality, 'budget_ms': budget_ms}
+    if budget_ms is None:
+        return ceiling, report
+    
+    candidates = QUALITY_LEVELS[:QUALITY_LEVELS.index(ceiling) + 1]
+    chosen, work = candidates[0], estimate_work(candidates[0])
+    for level in reversed(candidates):
+        level_work = estimate_work(level)
+        if model.predict(level_work) <= budget_ms:
+            chosen, work = level, level_work
+            break
+    
+    report.update(level=chosen.name, work=work, predicted_ms=round(model.predict(work), 2))
+    return chosen, report
@@ -1,16 +1,23 @@
 import numpy as np
 import trimesh
-import noise
-from perlin_noise import PerlinNoise
 from typing import Dict, List, Tuple, Optional
-from ..core.nlp_processor import NLPProcessor, ObjectDescription, ShapeType
+from ..core.nlp_processor import ObjectDescription, ShapeType, get_nlp_processor
+from .mesh_cache import MeshCache, get_mesh_cache
+from .quality import QUALITY_LEVELS, CostModel, QualityLevel, get_quality_level, select_quality
+from ..procedural.fractal_noise import GradientNoise
+from ..procedural.grid_mesh import grid_mesh
+from ..procedural import primitives
+from ..procedural.mesh_builder import MeshBuilder
+import dataclasses
 import math
-import random
+import time
 
 class TextTo3DGenerator:
-    def __init__(self):
-        self.nlp = NLPProcessor()
-        self.noise_gen = PerlinNoise(octaves=4, seed=42)
+    def __init__(self, cache: Optional[MeshCache] = None):
+        self.nlp = get_nlp_processor()
+        self.cache = cache if cache is not None else get_mesh_cache()
+        self.noise = GradientNoise(seed=42)
+        self.cost_model = CostModel()
         
         self.generators = {
             ShapeType.CUBE: self._generate_cube,
@@ -23,12 +30,65 @@ class TextTo3DGenerator:
             ShapeType.COMPLEX: self._generate_complex
         }
     
-    def generate_from_text(self, description: str) -> trimesh.Trimesh:
+    def generate_from_text(self, description: str, seed: Optional[int] = None,
+                           quality: Optional[str] = None, budget_ms: Optional[float] = None) -> trimesh.Trimesh:
         """Generate advanced 3D model from text description"""
-        obj_desc = self.nlp.parse_description(description)
-        
+        return self.generate_with_description(description, seed, quality, budget_ms)[0]
+    
+    def generate_with_description(self, description: str, seed: Optional[int] = None,
+                                  quality: Optional[str] = None,
+                                  budget_ms: Optional[float] = None) -> Tuple[trimesh.Trimesh, ObjectDescription]:
+        """Generate a model and return it with its parsed description
+        
+        ``quality`` names a tier from ``QUALITY_LEVELS`` (default "high");
+        ``budget_ms`` picks the most detailed tier, up to ``quality``, that
+        the calibrated cost model predicts will finish in time. The tier used
+        is reported in ``mesh.metadata['quality']``.
+        
+        Results are cached by normalized description, ``seed`` and tier.
+        Without a seed, shapes assembled from random parts are regenerated
+        every call.
+        """
+        start = time.perf_counter()
+        obj_desc = None
+        if budget_ms is None:
+            level, report = select_quality(self.cost_model, quality=quality)
+        else:
+            if not self.cost_model.calibrated:
+                self.calibrate()
+            obj_desc = self.nlp.parse_description(description)
+            level, report = select_quality(self.cost_model, lambda level: self._estimate_vertices(obj_desc, level),
+                                           quality, budget_ms)
+        
+        key = (self.cache.normalize(description), seed, level.name)
+        cached = self.cache.get(key)
+        if cached is not None:
+            mesh, obj_desc = cached
+            mesh.metadata['quality'] = {**report, 'cached': True,
+                                        'elapsed_ms': round((time.perf_counter() - start) * 1000.0, 2)}
+            return cached
+        
+        if obj_desc is None:
+            obj_desc = self.nlp.parse_description(description)
+        rng = np.random.default_rng(seed)
+        
+        build_start = time.perf_counter()
+        mesh = self._build(obj_desc, rng, level)
+        self.cost_model.observe(len(mesh.vertices), (time.perf_counter() - build_start) * 1000.0)
+        
+        if seed is not None or not self._is_random(obj_desc):
+            # Hand back the cached copy so a miss returns the same read-only mesh a later hit would
+            mesh = self.cache.put(key, mesh, obj_desc)
+        mesh.metadata['quality'] = {**report, 'cached': False,
+                                    'elapsed_ms': round((time.perf_counter() - start) * 1000.0, 2)}
+        return mesh, obj_desc
+    
+    def _build(self, obj_desc: ObjectDescription, rng: np.random.Generator, level: QualityLevel) -> trimesh.Trimesh:
         # Generate base mesh
-        mesh = self.generators[obj_desc.shape](obj_desc)
+        if obj_desc.shape == ShapeType.COMPLEX:
+            mesh = self._generate_complex(obj_desc, level, rng)
+        else:
+            mesh = self.generators[obj_desc.shape](obj_desc, level)
         
         # Apply transformations
         mesh = self._apply_transformations(mesh, obj_desc)
@@ -42,9 +102,55 @@ class TextTo3DGenerator:
         
         return mesh
     
-    def _generate_cube(self, desc: ObjectDescription) -> trimesh.Trimesh:
+    def calibrate(self):
+        """Fit the cost model by timing textured terrain planes the sizes the tiers produce"""
+        level = get_quality_level(None)
+        desc = ObjectDescription(shape=ShapeType.PLANE, size=1.0, color=(0.5, 0.5, 0.5), material='default',
+                                 texture='rough', position=(0, 0, 0), rotation=(0, 0, 0), scale=(1.0, 1.0, 1.0),
+                                 properties={'terrain': True})
+        
+        def run(vertices: int):
+            resolution = max(int(math.sqrt(vertices)) - 1, 1)
+            self._build(desc, np.random.default_rng(0), dataclasses.replace(level, plane_resolution=resolution))
+        
+        # Tier outputs are a few dozen to a few hundred vertices, where fixed per-call cost dominates;
+        # fitting on much larger meshes would extrapolate that cost away
+        self.cost_model.calibrate(run, sorted({(tier.plane_resolution + 1) ** 2 for tier in QUALITY_LEVELS}))
+    
+    def _estimate_vertices(self, desc: ObjectDescription, level: QualityLevel) -> int:
+        """Vertex count ``_build`` will produce for a description at a tier"""
+        smooth = desc.material == 'smooth'
+        sections = level.sections * (2 if smooth else 1)
+        
+        if desc.shape == ShapeType.SPHERE:
+            return len(primitives.template('icosphere', level.subdivisions + smooth)[0])
+        elif desc.shape == ShapeType.CYLINDER:
+            count = len(primitives.template('cylinder', sections)[0])
+            return count if 'open' in desc.properties else 2 * count
+        elif desc.shape == ShapeType.CONE:
+            return len(primitives.template('cone', sections)[0])
+        elif desc.shape == ShapeType.TORUS:
+            return level.torus_sections[0] * level.torus_sections[1]
+        elif desc.shape == ShapeType.PLANE:
+            resolution = level.plane_resolution * (5 if 'detailed' in desc.properties else 1)
+            return (resolution + 1) ** 2
+        elif desc.shape == ShapeType.COMPLEX:
+            if 'building' in desc.properties or 'house' in desc.properties:
+                return 13
+            elif 'tower' in desc.properties:
+                return 5 * len(primitives.template('cylinder', level.sections * 2)[0])
+            # Five random components on average, sized like spheres
+            return 5 * len(primitives.template('icosphere', level.subdivisions)[0])
+        return 8
+    
+    def _is_random(self, desc: ObjectDescription) -> bool:
+        """Whether generation draws random numbers (abstract complex shapes)"""
+        return desc.shape == ShapeType.COMPLEX and not any(
+            word in desc.properties for word in ('building', 'house', 'tower'))
+    
+    def _generate_cube(self, desc: ObjectDescription, level: QualityLevel) -> trimesh.Trimesh:
         extents = [desc.scale[0], desc.scale[1], desc.scale[2]]
-        mesh = trimesh.creation.box(extents=extents)
+        mesh = primitives.box(extents=extents)
         
         # Add beveled edges for realism
         if desc.material == 'metallic':
@@ -52,53 +158,50 @@ class TextTo3DGenerator:
         
         return mesh
     
-    def _generate_sphere(self, desc: ObjectDescription) -> trimesh.Trimesh:
+    def _generate_sphere(self, desc: ObjectDescription, level: QualityLevel) -> trimesh.Trimesh:
         radius = desc.size
-        subdivisions = 3 if desc.material == 'smooth' else 2
-        mesh = trimesh.creation.icosphere(radius=radius, subdivisions=subdivisions)
+        subdivisions = level.subdivisions + (1 if desc.material == 'smooth' else 0)
+        mesh = primitives.icosphere(radius=radius, subdivisions=subdivisions)
         
         # Add surface noise for organic feel
         if 'organic' in desc.properties:
-            vertices = mesh.vertices.copy()
-            for i, vertex in enumerate(vertices):
-                noise_val = self.noise_gen(vertex[0]*2, vertex[1]*2, vertex[2]*2)
-                vertices[i] += vertex * noise_val * 0.1
-            mesh.vertices = vertices
+            vertices = mesh.vertices
+            noise_val = self.noise.fbm(*(vertices * 2).T, octaves=4)
+            mesh.vertices = vertices + vertices * noise_val[:, None] * 0.1
         
         return mesh
     
-    def _generate_cylinder(self, desc: ObjectDescription) -> trimesh.Trimesh:
+    def _generate_cylinder(self, desc: ObjectDescription, level: QualityLevel) -> trimesh.Trimesh:
         radius = desc.scale[0]
         height = desc.scale[1] * 2
-        sections = 32 if desc.material == 'smooth' else 16
+        sections = level.sections * (2 if desc.material == 'smooth' else 1)
         
-        mesh = trimesh.creation.cylinder(radius=radius, height=height, sections=sections)
+        builder = MeshBuilder().cylinder(radius, height, sections)
         
         # Add caps based on description
         if 'open' not in desc.properties:
-            mesh = mesh + trimesh.creation.cylinder(radius=radius*0.95, height=height*1.1, sections=sections)
+            builder.cylinder(radius*0.95, height*1.1, sections)
         
-        return mesh
+        return builder.build()
     
-    def _generate_cone(self, desc: ObjectDescription) -> trimesh.Trimesh:
+    def _generate_cone(self, desc: ObjectDescription, level: QualityLevel) -> trimesh.Trimesh:
         radius = desc.scale[0]
         height = desc.scale[1] * 2
-        sections = 32 if desc.material == 'smooth' else 16
+        sections = level.sections * (2 if desc.material == 'smooth' else 1)
         
-        mesh = trimesh.creation.cone(radius=radius, height=height, sections=sections)
+        mesh = primitives.cone(radius=radius, height=height, sections=sections)
         return mesh
     
-    def _generate_torus(self, desc: ObjectDescription) -> trimesh.Trimesh:
+    def _generate_torus(self, desc: ObjectDescription, level: QualityLevel) -> trimesh.Trimesh:
         major_radius = desc.scale[0]
         minor_radius = desc.scale[0] * 0.3
-        major_sections = 32
-        minor_sections = 16
+        major_sections, minor_sections = level.torus_sections
         
         mesh = trimesh.creation.torus(major_radius=major_radius, minor_radius=minor_radius,
                                     major_sections=major_sections, minor_sections=minor_sections)
         return mesh
     
-    def _generate_pyramid(self, desc: ObjectDescription) -> trimesh.Trimesh:
+    def _generate_pyramid(self, desc: ObjectDescription, level: QualityLevel) -> trimesh.Trimesh:
         base_size = desc.scale[0]
         height = desc.scale[1] * 2
         
@@ -118,54 +221,40 @@ class TextTo3DGenerator:
         
         return trimesh.Trimesh(vertices=vertices, faces=faces)
     
-    def _generate_plane(self, desc: ObjectDescription) -> trimesh.Trimesh:
+    def _generate_plane(self, desc: ObjectDescription, level: QualityLevel) -> trimesh.Trimesh:
         size_x, size_z = desc.scale[0], desc.scale[2]
-        resolution = 50 if 'detailed' in desc.properties else 10
+        resolution = level.plane_resolution * (5 if 'detailed' in desc.properties else 1)
         
         # Generate terrain-like plane
-        vertices = []
-        faces = []
-        
-        for i in range(resolution + 1):
-            for j in range(resolution + 1):
-                x = (i / resolution - 0.5) * size_x
-                z = (j / resolution - 0.5) * size_z
-                y = 0
-                
-                # Add height variation
-                if 'terrain' in desc.properties:
-                    y = self.noise_gen(x * 0.1, z * 0.1) * desc.scale[1]
-                
-                vertices.append([x, y, z])
-        
-        # Generate faces
-        for i in range(resolution):
-            for j in range(resolution):
-                v1 = i * (resolution + 1) + j
-                v2 = v1 + 1
-                v3 = (i + 1) * (resolution + 1) + j
-                v4 = v3 + 1
-                
-                faces.extend([[v1, v2, v3], [v2, v4, v3]])
-        
-        return trimesh.Trimesh(vertices=np.array(vertices), faces=np.array(faces))
+        steps = np.arange(resolution + 1) / resolution - 0.5
+        x, z = np.meshgrid(steps * size_x, steps * size_z, indexing='ij')
+        y = np.zeros_like(x)
+        
+        # Add height variation
+        if 'terrain' in desc.properties:
+            y = self.noise.fbm(x * 0.1, z * 0.1, octaves=4) * desc.scale[1]
+        
+        return grid_mesh(np.stack([x, y, z], axis=-1))
     
-    def _generate_complex(self, desc: ObjectDescription) -> trimesh.Trimesh:
+    def _generate_complex(self, desc: ObjectDescription, level: QualityLevel,
+                          rng: np.random.Generator) -> trimesh.Trimesh:
         """Generate complex structures like buildings"""
         if 'building' in desc.properties or 'house' in desc.properties:
-            return self._generate_building(desc)
+            return self._generate_building(desc, level)
         elif 'tower' in desc.properties:
-            return self._generate_tower(desc)
+            return self._generate_tower(desc, level)
         else:
-            return self._generate_abstract_complex(desc)
+            return self._generate_abstract_complex(desc, level, rng)
     
-    def _generate_building(self, desc: ObjectDescription) -> trimesh.Trimesh:
+    def _generate_building(self, desc: ObjectDescription, level: QualityLevel) -> trimesh.Trimesh:
         base_width = desc.scale[0]
         base_depth = desc.scale[2]
         height = desc.scale[1] * 3
         
+        builder = MeshBuilder()
+        
         # Main structure
-        main_building = trimesh.creation.box(extents=[base_width, height, base_depth])
+        builder.box([base_width, height, base_depth])
         
         # Add roof
         roof_vertices = np.array([
@@ -180,16 +269,16 @@ class TextTo3DGenerator:
             [0, 1, 4], [1, 2, 4], [2, 3, 4], [3, 0, 4]
         ])
         
-        roof = trimesh.Trimesh(vertices=roof_vertices, faces=roof_faces)
+        builder.add(roof_vertices, roof_faces)
         
-        return main_building + roof
+        return builder.build()
     
-    def _generate_tower(self, desc: ObjectDescription) -> trimesh.Trimesh:
+    def _generate_tower(self, desc: ObjectDescription, level: QualityLevel) -> trimesh.Trimesh:
         base_radius = desc.scale[0]
         height = desc.scale[1] * 5
         
         # Create tapered tower
-        sections = []
+        builder = MeshBuilder()
         num_sections = 5
         
         for i in range(num_sections):
@@ -197,37 +286,36 @@ class TextTo3DGenerator:
             section_radius = base_radius * (1 - i * 0.1)
             section_y = i * section_height - height/2 + section_height/2
             
-            section = trimesh.creation.cylinder(radius=section_radius, height=section_height)
-            section.apply_translation([0, section_y, 0])
-            sections.append(section)
+            builder.cylinder(section_radius, section_height, level.sections * 2, translation=[0, section_y, 0])
         
-        return trimesh.util.concatenate(sections)
+        return builder.build()
     
-    def _generate_abstract_complex(self, desc: ObjectDescription) -> trimesh.Trimesh:
+    def _generate_abstract_complex(self, desc: ObjectDescription, level: QualityLevel,
+                                   rng: np.random.Generator) -> trimesh.Trimesh:
         """Generate abstract complex shapes"""
-        components = []
-        num_components = random.randint(3, 7)
+        builder = MeshBuilder()
+        num_components = int(rng.integers(3, 8))
+        component_types = [ShapeType.CUBE, ShapeType.SPHERE, ShapeType.CYLINDER]
         
         for i in range(num_components):
             # Random component
-            comp_type = random.choice([ShapeType.CUBE, ShapeType.SPHERE, ShapeType.CYLINDER])
+            comp_type = component_types[rng.integers(len(component_types))]
             comp_desc = ObjectDescription(
                 shape=comp_type,
-                size=desc.size * random.uniform(0.3, 0.8),
+                size=desc.size * rng.uniform(0.3, 0.8),
                 color=desc.color,
                 material=desc.material,
                 texture=desc.texture,
-                position=(random.uniform(-1, 1), random.uniform(-1, 1), random.uniform(-1, 1)),
+                position=(rng.uniform(-1, 1), rng.uniform(-1, 1), rng.uniform(-1, 1)),
                 rotation=(0, 0, 0),
-                scale=(random.uniform(0.5, 1.5), random.uniform(0.5, 1.5), random.uniform(0.5, 1.5)),
+                scale=(rng.uniform(0.5, 1.5), rng.uniform(0.5, 1.5), rng.uniform(0.5, 1.5)),
                 properties=desc.properties
             )
             
-            component = self.generators[comp_type](comp_desc)
-            component.apply_translation(comp_desc.position)
-            components.append(component)
+            component = self.generators[comp_type](comp_desc, level)
+            builder.add_mesh(component, translation=comp_desc.position)
         
-        return trimesh.util.concatenate(components)
+        return builder.build()
     
     def _apply_transformations(self, mesh: trimesh.Trimesh, desc: ObjectDescription) -> trimesh.Trimesh:
         """Apply position, rotation, and scale transformations"""
@@ -257,20 +345,14 @@ class TextTo3DGenerator:
         """Apply procedural textures to mesh surface"""
         if texture_type == 'rough':
             # Add surface roughness
-            vertices = mesh.vertices.copy()
-            for i, vertex in enumerate(vertices):
-                noise_val = self.noise_gen(vertex[0]*10, vertex[1]*10, vertex[2]*10)
-                normal = mesh.vertex_normals[i]
-                vertices[i] += normal * noise_val * 0.02
-            mesh.vertices = vertices
+            vertices = mesh.vertices
+            noise_val = self.noise.fbm(*(vertices * 10).T, octaves=4)
+            mesh.vertices = vertices + mesh.vertex_normals * noise_val[:, None] * 0.02
         
         elif texture_type == 'bumpy':
             # Add bumps
-            vertices = mesh.vertices.copy()
-            for i, vertex in enumerate(vertices):
-                noise_val = abs(self.noise_gen(vertex[0]*5, vertex[1]*5, vertex[2]*5))
-                normal = mesh.vertex_normals[i]
-                vertices[i] += normal * noise_val * 0.05
-            mesh.vertices = vertices
+            vertices = mesh.vertices
+            noise_val = np.abs(self.noise.fbm(*(vertices * 5).T, octaves=4))
+            mesh.vertices = vertices + mesh.vertex_normals * noise_val[:, None] * 0.05
         
         return mesh
\ No newline at end of file
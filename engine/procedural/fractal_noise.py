@@ -0,0 +1,194 @@
+import numpy as np
+from typing import Optional
+
+# Improved Perlin noise gradients: the 12 cube edge directions, padded to 16 so a hash picks one with & 15
+_GRADIENTS_3D = np.array([
+    [1, 1, 0], [-1, 1, 0], [1, -1, 0], [-1, -1, 0],
+    [1, 0, 1], [-1, 0, 1], [1, 0, -1], [-1, 0, -1],
+    [0, 1, 1], [0, -1, 1], [0, 1, -1], [0, -1, -1],
+    [1, 1, 0], [0, -1, 1], [-1, 1, 0], [0, -1, -1]
+], dtype=np.float64)
+_GRADIENTS_2D = np.array([
+    [1, 1], [-1, 1], [1, -1], [-1, -1],
+    [1, 0], [-1, 0], [0, 1], [0, -1]
+], dtype=np.float64)
+
+def _fade(t: np.ndarray) -> np.ndarray:
+    return t * t * t * (t * (t * 6.0 - 15.0) + 10.0)
+
+class GradientNoise:
+    """Seeded, vectorized Perlin gradient noise.
+    
+    Every method takes coordinate arrays (or scalars) of any matching shape and
+    returns an array of that shape, so whole vertex sets or height grids are
+    evaluated in a few NumPy passes. The same seed always gives the same
+    values; noise repeats every 256 units.
+    """
+    
+    def __init__(self, seed: int = 0):
+        self.seed = seed
+        permutation = np.random.default_rng(seed).permutation(256)
+        # Doubled so hash lookups of (index + 1) never wrap
+        self.perm = np.concatenate([permutation, permutation]).astype(np.intp)
+    
+    def noise2(self, x, y) -> np.ndarray:
+        """2D gradient noise in about [-1, 1]"""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        x0, y0 = np.floor(x), np.floor(y)
+        fx, fy = x - x0, y - y0
+        xi = x0.astype(np.intp) & 255
+        yi = y0.astype(np.intp) & 255
+        
+        perm = self.perm
+        a, b = perm[xi] + yi, perm[xi + 1] + yi
+        
+        def corner(h, dx, dy):
+            h &= 7
+            return _GRADIENTS_2D[h, 0] * dx + _GRADIENTS_2D[h, 1] * dy
+        
+        u, v = _fade(fx), _fade(fy)
+        n00 = corner(perm[a], fx, fy)
+        n10 = corner(perm[b], fx - 1.0, fy)
+        n01 = corner(perm[a + 1], fx, fy - 1.0)
+        n11 = corner(perm[b + 1], fx - 1.0, fy - 1.0)
+        
+        nx0 = n00 + u * (n10 - n00)
+        nx1 = n01 + u * (n11 - n01)
+        return nx0 + v * (nx1 - nx0)
+    
+    def noise3(self, x, y, z) -> np.ndarray:
+        """3D gradient noise in about [-1, 1]"""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        z = np.asarray(z, dtype=np.float64)
+        x0, y0, z0 = np.floor(x), np.floor(y), np.floor(z)
+        fx, fy, fz = x - x0, y - y0, z - z0
+        xi = x0.astype(np.intp) & 255
+        yi = y0.astype(np.intp) & 255
+        zi = z0.astype(np.intp) & 255
+        
+        perm = self.perm
+        a, b = perm[xi] + yi, perm[xi + 1] + yi
+        aa, ab, ba, bb = perm[a] + zi, perm[a + 1] + zi, perm[b] + zi, perm[b + 1] + zi
+        
+        def corner(h, dx, dy, dz):
+            h &= 15
+            return _GRADIENTS_3D[h, 0] * dx + _GRADIENTS_3D[h, 1] * dy + _GRADIENTS_3D[h, 2] * dz
+        
+        u, v, w = _fade(fx), _fade(fy), _fade(fz)
+        gx, gy, gz = fx - 1.0, fy - 1.0, fz - 1.0
+        
+        n000 = corner(perm[aa], fx, fy, fz)
+        n100 = corner(perm[ba], gx, fy, fz)
+        n010 = corner(perm[ab], fx, gy, fz)
+        n110 = corner(perm[bb], gx, gy, fz)
+        n001 = corner(perm[aa + 1], fx, fy, gz)
+        n101 = corner(perm[ba + 1], gx, fy, gz)
+        n011 = corner(perm[ab + 1], fx, gy, gz)
+        n111 = corner(perm[bb + 1], gx, gy, gz)
+        
+        nx00 = n000 + u * (n100 - n000)
+        nx10 = n010 + u * (n110 - n010)
+        nx01 = n001 + u * (n101 - n001)
+        nx11 = n011 + u * (n111 - n011)
+        nxy0 = nx00 + v * (nx10 - nx00)
+        nxy1 = nx01 + v * (nx11 - nx01)
+        return nxy0 + w * (nxy1 - nxy0)
+    
+    def _noise(self, coords) -> np.ndarray:
+        if len(coords) == 2:
+            return self.noise2(*coords)
+        if len(coords) == 3:
+            return self.noise3(*coords)
+        raise ValueError(f"Expected 2 or 3 coordinate arrays, got {len(coords)}")
+    
+    def fbm(self, *coords, octaves: int = 4, frequency: float = 1.0,
+            lacunarity: float = 2.0, gain: float = 0.5) -> np.ndarray:
+        """Fractal Brownian motion over 2 or 3 coordinate arrays
+        
+        Octaves are summed with amplitude ``gain ** octave`` and the result is
+        divided by the total amplitude, keeping it in about [-1, 1] like
+        ``noise.pnoise2(..., octaves=n)``.
+        """
+        coords = [np.asarray(c, dtype=np.float64) for c in coords]
+        total = np.zeros(np.broadcast(*coords).shape)
+        amplitude, weight = 1.0, 0.0
+        
+        for _ in range(octaves):
+            total += self._noise([c * frequency for c in coords]) * amplitude
+            weight += amplitude
+            frequency *= lacunarity
+            amplitude *= gain
+        
+        return total / weight
+    
+    def ridged(self, *coords, octaves: int = 4, frequency: float = 1.0,
+               lacunarity: float = 2.0, gain: float = 0.5, sharpness: float = 2.0) -> np.ndarray:
+        """Ridged multifractal noise in [0, 1]: sharp crests where the noise crosses zero
+        
+        Each octave is weighted by the previous one, so ridges carry finer
+        detail than valleys.
+        """
+        coords = [np.asarray(c, dtype=np.float64) for c in coords]
+        total = np.zeros(np.broadcast(*coords).shape)
+        previous = np.ones_like(total)
+        amplitude, weight = 1.0, 0.0
+        
+        for _ in range(octaves):
+            ridge = (1.0 - np.abs(self._noise([c * frequency for c in coords]))) ** sharpness
+            total += ridge * previous * amplitude
+            previous = ridge
+            weight += amplitude
+            frequency *= lacunarity
+            amplitude *= gain
+        
+        return total / weight
+
+def diamond_square(size: int, roughness: float = 0.5, seed: Optional[int] = None) -> np.ndarray:
+    """(size, size) fractal heightmap by the diamond-square algorithm
+    
+    Each level runs the diamond step (square centers from their four corners)
+    and then the square step (edge midpoints from their up to four diamond
+    neighbours) as whole-array operations. Grids that are not ``2**n + 1``
+    are generated at the next such size and cropped. Corners start in [0, 1)
+    and the random offset shrinks by ``roughness`` per level.
+    """
+    rng = np.random.default_rng(seed)
+    full = 2 ** int(np.ceil(np.log2(max(size - 1, 1)))) + 1
+    heightmap = np.zeros((full, full))
+    heightmap[::full - 1, ::full - 1] = rng.random((2, 2))
+    
+    step = full - 1
+    scale = 1.0
+    while step > 1:
+        half = step // 2
+        
+        # Diamond step: centers of each step x step square
+        corners = (heightmap[:-1:step, :-1:step] + heightmap[step::step, :-1:step] +
+                   heightmap[:-1:step, step::step] + heightmap[step::step, step::step])
+        centers = corners * 0.25 + (rng.random(corners.shape) - 0.5) * scale
+        heightmap[half::step, half::step] = centers
+        
+        # Square step, edge midpoints on corner rows: left/right corners plus centers above/below
+        total = heightmap[::step, :-1:step] + heightmap[::step, step::step]
+        count = np.full(total.shape, 2.0)
+        total[1:] += centers
+        total[:-1] += centers
+        count[1:] += 1.0
+        count[:-1] += 1.0
+        heightmap[::step, half::step] = total / count + (rng.random(total.shape) - 0.5) * scale
+        
+        # Edge midpoints on center rows: corners above/below plus centers left/right
+        total = heightmap[:-1:step, ::step] + heightmap[step::step, ::step]
+        count = np.full(total.shape, 2.0)
+        total[:, 1:] += centers
+        total[:, :-1] += centers
+        count[:, 1:] += 1.0
+        count[:, :-1] += 1.0
+        heightmap[half::step, ::step] = total / count + (rng.random(total.shape) - 0.5) * scale
+        
+        step = half
+        scale *= roughness
+    
+    return heightmap[:size, :size]
@@ -0,0 +1,71 @@
+import numpy as np
+import trimesh
+from typing import Optional
+
+def grid_faces(rows: int, cols: int, cell_mask: Optional[np.ndarray] = None,
+               alternate_diagonal: Optional[np.ndarray] = None,
+               vertex_index: Optional[np.ndarray] = None) -> np.ndarray:
+    """Triangles for a ``rows`` x ``cols`` vertex grid, two per cell in row-major cell order
+    
+    With corners ``v1 = (i, j)``, ``v2 = (i, j + 1)``, ``v3 = (i + 1, j)`` and
+    ``v4 = (i + 1, j + 1)``, a cell is split into ``(v1, v2, v3), (v2, v4, v3)``,
+    or along the other diagonal into ``(v1, v2, v4), (v1, v4, v3)`` where
+    ``alternate_diagonal`` (``(rows - 1, cols - 1)`` bool) is set. Cells where
+    ``cell_mask`` is False are skipped. ``vertex_index`` (``(rows, cols)``)
+    remaps grid points to vertex indices, with -1 for points that have no
+    vertex; cells touching one are skipped.
+    """
+    if rows < 2 or cols < 2:
+        return np.zeros((0, 3), dtype=np.int64)
+    
+    # Each cell's six triangle corners are fixed offsets from its first vertex
+    v1 = np.arange(rows - 1, dtype=np.int64)[:, None] * cols + np.arange(cols - 1, dtype=np.int64)
+    offsets = np.array([0, 1, cols, 1, cols + 1, cols], dtype=np.int64)
+    if alternate_diagonal is None:
+        triangles = v1[..., None] + offsets
+    else:
+        alternate_offsets = np.array([0, 1, cols + 1, 0, cols + 1, cols], dtype=np.int64)
+        alternate = np.asarray(alternate_diagonal, dtype=bool)[..., None]
+        triangles = v1[..., None] + np.where(alternate, alternate_offsets, offsets)
+    
+    keep = None if cell_mask is None else np.asarray(cell_mask, dtype=bool)
+    if vertex_index is not None:
+        triangles = np.asarray(vertex_index, dtype=np.int64).ravel()[triangles]
+        present = (triangles >= 0).all(axis=-1)
+        keep = present if keep is None else keep & present
+    
+    if keep is not None:
+        triangles = triangles[keep]
+    return triangles.reshape(-1, 3)
+
+def grid_mesh(points: np.ndarray, colors: Optional[np.ndarray] = None,
+              cell_mask: Optional[np.ndarray] = None, alternate_diagonal: Optional[np.ndarray] = None,
+              vertex_mask: Optional[np.ndarray] = None, flip_winding: bool = False,
+              process: bool = False) -> trimesh.Trimesh:
+    """Mesh over a ``(rows, cols, 3)`` grid of points, each point a vertex shared by its cells
+    
+    ``colors`` (``(rows, cols, 3 or 4)``) become vertex colors. ``vertex_mask``
+    keeps only some points as vertices (in row-major order); the other
+    options are those of ``grid_faces``. ``flip_winding`` reverses every
+    triangle. Grid vertices are unique, so trimesh processing is skipped
+    unless ``process`` is set (e.g. to weld the seams of a wrapped grid).
+    """
+    rows, cols = points.shape[:2]
+    vertices = points.reshape(-1, 3)
+    if colors is not None:
+        colors = colors.reshape(rows * cols, -1)
+    
+    vertex_index = None
+    if vertex_mask is not None:
+        keep = np.asarray(vertex_mask, dtype=bool).ravel()
+        vertex_index = np.full(rows * cols, -1, dtype=np.int64)
+        vertex_index[keep] = np.arange(np.count_nonzero(keep))
+        vertices = vertices[keep]
+        if colors is not None:
+            colors = colors[keep]
+    
+    faces = grid_faces(rows, cols, cell_mask, alternate_diagonal, vertex_index)
+    if flip_winding:
+        faces = faces[:, [0, 2, 1]]
+    
+    return trimesh.Trimesh(vertices=vertices, faces=faces, vertex_colors=colors, process=process)
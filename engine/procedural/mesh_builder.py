@@ -0,0 +1,107 @@
+import numpy as np
+import trimesh
+from typing import Optional, Sequence
+from . import primitives
+
+# trimesh's color for vertices that were never given one
+DEFAULT_COLOR = np.array([102, 102, 102, 255], dtype=np.uint8)
+
+class MeshBuilder:
+    """Accumulates mesh parts into growable arrays and emits one Trimesh.
+    
+    Parts are appended as raw arrays: their faces are offset by the vertices
+    already added and copied into buffers that double in size when full, so
+    combining many small parts costs one copy per part instead of one
+    Trimesh (and a full concatenate) per step. Every ``add*`` method takes an
+    optional 4x4 ``transform``, applied first, then a ``translation`` and an
+    RGBA ``color`` for the part's vertices.
+    """
+    
+    def __init__(self, vertex_capacity: int = 1024, face_capacity: int = 2048):
+        self.vertices = np.empty((vertex_capacity, 3), dtype=np.float64)
+        self.faces = np.empty((face_capacity, 3), dtype=np.int64)
+        self.colors: Optional[np.ndarray] = None
+        self.vertex_count = 0
+        self.face_count = 0
+    
+    @staticmethod
+    def _grow(buffer: np.ndarray, needed: int) -> np.ndarray:
+        if needed <= len(buffer):
+            return buffer
+        grown = np.empty((max(needed, 2 * len(buffer)),) + buffer.shape[1:], dtype=buffer.dtype)
+        grown[:len(buffer)] = buffer
+        return grown
+    
+    def _paint(self, start: int, end: int, color):
+        if self.colors is None:
+            # First colored part: earlier parts keep the default color
+            self.colors = np.empty((len(self.vertices), 4), dtype=np.uint8)
+            self.colors[:start] = DEFAULT_COLOR
+        self.colors = self._grow(self.colors, end)
+        self.colors[start:end] = color
+    
+    def add(self, vertices: np.ndarray, faces: np.ndarray, color: Optional[Sequence[int]] = None,
+            transform=None, translation: Optional[Sequence[float]] = None) -> 'MeshBuilder':
+        """Append a part given as ``(n, 3)`` vertices and faces indexing them"""
+        vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+        faces = np.asarray(faces, dtype=np.int64).reshape(-1, 3)
+        if transform is not None:
+            transform = np.asarray(transform, dtype=np.float64)
+            vertices = vertices @ transform[:3, :3].T + transform[:3, 3]
+        
+        start, end = self.vertex_count, self.vertex_count + len(vertices)
+        self.vertices = self._grow(self.vertices, end)
+        self.vertices[start:end] = vertices
+        if translation is not None:
+            self.vertices[start:end] += translation
+        
+        face_end = self.face_count + len(faces)
+        self.faces = self._grow(self.faces, face_end)
+        np.add(faces, start, out=self.faces[self.face_count:face_end])
+        
+        if color is not None or self.colors is not None:
+            self._paint(start, end, DEFAULT_COLOR if color is None else color)
+        
+        self.vertex_count, self.face_count = end, face_end
+        return self
+    
+    def add_mesh(self, mesh: trimesh.Trimesh, color: Optional[Sequence[int]] = None,
+                 transform=None, translation: Optional[Sequence[float]] = None) -> 'MeshBuilder':
+        """Append an existing mesh, keeping its vertex colors unless ``color`` is given"""
+        start = self.vertex_count
+        self.add(mesh.vertices, mesh.faces, color, transform, translation)
+        if color is None and mesh.visual.kind == 'vertex':
+            self._paint(start, self.vertex_count, mesh.visual.vertex_colors)
+        return self
+    
+    def box(self, extents: Optional[Sequence[float]] = None, **part) -> 'MeshBuilder':
+        return self.add(*primitives.box_arrays(extents), **part)
+    
+    def icosphere(self, subdivisions: int = 3, radius: float = 1.0, **part) -> 'MeshBuilder':
+        return self.add(*primitives.icosphere_arrays(subdivisions, radius), **part)
+    
+    def cylinder(self, radius: float = 1.0, height: float = 1.0, sections: int = 32, **part) -> 'MeshBuilder':
+        return self.add(*primitives.cylinder_arrays(radius, height, sections), **part)
+    
+    def cone(self, radius: float = 1.0, height: float = 1.0, sections: int = 32, **part) -> 'MeshBuilder':
+        return self.add(*primitives.cone_arrays(radius, height, sections), **part)
+    
+    def capsule(self, height: float = 1.0, radius: float = 1.0, count: Sequence[int] = (32, 32),
+                **part) -> 'MeshBuilder':
+        return self.add(*primitives.capsule_arrays(height, radius, count), **part)
+    
+    def build(self, color: Optional[Sequence[int]] = None, process: bool = False) -> trimesh.Trimesh:
+        """One mesh of every part added so far; ``color`` recolors all of it
+        
+        Parts are not welded to each other unless ``process`` is set.
+        """
+        n = self.vertex_count
+        vertex_colors = None
+        if color is not None:
+            vertex_colors = np.empty((n, 4), dtype=np.uint8)
+            vertex_colors[:] = color
+        elif self.colors is not None:
+            vertex_colors = self.colors[:n].copy()
+        
+        return trimesh.Trimesh(vertices=self.vertices[:n].copy(), faces=self.faces[:self.face_count].copy(),
+                               vertex_colors=vertex_colors, process=process)
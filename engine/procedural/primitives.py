@@ -0,0 +1,113 @@
+import threading
+import numpy as np
+import trimesh
+from typing import Dict, Optional, Sequence, Tuple
+
+# Unit-sized template arrays by (shape, resolution), built once per process
+_templates: Dict[Tuple, Tuple[np.ndarray, np.ndarray]] = {}
+_templates_lock = threading.Lock()
+
+_BUILDERS = {
+    'icosphere': lambda subdivisions: trimesh.creation.icosphere(subdivisions=subdivisions, radius=1.0),
+    'cylinder': lambda sections: trimesh.creation.cylinder(radius=1.0, height=1.0, sections=sections),
+    'cone': lambda sections: trimesh.creation.cone(radius=1.0, height=1.0, sections=sections),
+    'box': lambda _: trimesh.creation.box(extents=[1.0, 1.0, 1.0]),
+    'capsule': lambda count: trimesh.creation.capsule(height=1.0, radius=1.0, count=list(count)),
+}
+
+def template(shape: str, resolution=None) -> Tuple[np.ndarray, np.ndarray]:
+    """Read-only ``(vertices, faces)`` of a unit primitive
+    
+    Unit sizes are radius 1 and height 1 (cylinders centered on the origin
+    along z, cones from z=0 to the apex at z=1, capsules with hemisphere
+    centers at z=+-0.5) and a unit cube for boxes. ``resolution`` is the
+    icosphere subdivision count, the cylinder/cone section count or the
+    capsule ``(rings, sections)`` count.
+    """
+    key = (shape, resolution)
+    arrays = _templates.get(key)
+    if arrays is None:
+        with _templates_lock:
+            arrays = _templates.get(key)
+            if arrays is None:
+                mesh = _BUILDERS[shape](resolution)
+                arrays = (np.array(mesh.vertices, dtype=np.float64), np.array(mesh.faces, dtype=np.int64))
+                for array in arrays:
+                    array.flags.writeable = False
+                _templates[key] = arrays
+    return arrays
+
+def _mesh(vertices: np.ndarray, faces: np.ndarray, transform=None) -> trimesh.Trimesh:
+    if transform is not None:
+        transform = np.asarray(transform, dtype=np.float64)
+        vertices = vertices @ transform[:3, :3].T + transform[:3, 3]
+    # Template faces are shared: trimesh replaces arrays rather than writing into them
+    return trimesh.Trimesh(vertices=vertices, faces=faces, process=False)
+
+def icosphere_arrays(subdivisions: int = 3, radius: float = 1.0) -> Tuple[np.ndarray, np.ndarray]:
+    vertices, faces = template('icosphere', int(subdivisions))
+    return vertices * radius, faces
+
+def cylinder_arrays(radius: float = 1.0, height: float = 1.0, sections: int = 32) -> Tuple[np.ndarray, np.ndarray]:
+    vertices, faces = template('cylinder', int(sections))
+    return vertices * [radius, radius, height], faces
+
+def cone_arrays(radius: float = 1.0, height: float = 1.0, sections: int = 32) -> Tuple[np.ndarray, np.ndarray]:
+    vertices, faces = template('cone', int(sections))
+    return vertices * [radius, radius, height], faces
+
+def box_arrays(extents: Optional[Sequence[float]] = None) -> Tuple[np.ndarray, np.ndarray]:
+    vertices, faces = template('box')
+    return (vertices.copy() if extents is None else vertices * extents), faces
+
+def capsule_arrays(height: float = 1.0, radius: float = 1.0,
+                   count: Sequence[int] = (32, 32)) -> Tuple[np.ndarray, np.ndarray]:
+    """Capsule hemispheres are scaled by ``radius`` and moved apart to ``height``
+    rather than stretched, so they stay round for any aspect ratio.
+    """
+    vertices, faces = template('capsule', tuple(int(c) for c in count))
+    z = vertices[:, 2]
+    # Template hemispheres are centered at z=+-0.5; no template vertex lies at z=0
+    vertices = np.column_stack([vertices[:, :2] * radius,
+                                np.sign(z) * ((np.abs(z) - 0.5) * radius + height / 2.0)])
+    return vertices, faces
+
+# Drop-ins for the trimesh.creation functions of the same names
+
+def icosphere(subdivisions: int = 3, radius: float = 1.0, transform=None) -> trimesh.Trimesh:
+    return _mesh(*icosphere_arrays(subdivisions, radius), transform)
+
+def cylinder(radius: float = 1.0, height: float = 1.0, sections: int = 32, transform=None) -> trimesh.Trimesh:
+    return _mesh(*cylinder_arrays(radius, height, sections), transform)
+
+def cone(radius: float = 1.0, height: float = 1.0, sections: int = 32, transform=None) -> trimesh.Trimesh:
+    return _mesh(*cone_arrays(radius, height, sections), transform)
+
+def box(extents: Optional[Sequence[float]] = None, transform=None) -> trimesh.Trimesh:
+    return _mesh(*box_arrays(extents), transform)
+
+def capsule(height: float = 1.0, radius: float = 1.0, count: Sequence[int] = (32, 32),
+            transform=None) -> trimesh.Trimesh:
+    return _mesh(*capsule_arrays(height, radius, count), transform)
+
+def instances(shape: str, resolution, scales: np.ndarray, translations: np.ndarray,
+              colors: Optional[np.ndarray] = None) -> trimesh.Trimesh:
+    """One mesh holding a copy of a unit primitive per row of ``translations``
+    
+    ``scales`` is ``(n,)`` for uniform or ``(n, 3)`` for per-axis scaling and
+    ``colors`` an optional ``(n, 4)`` RGBA per copy. Building many small
+    shapes this way costs a few array operations instead of one mesh each.
+    """
+    vertices, faces = template(shape, resolution)
+    translations = np.asarray(translations, dtype=np.float64).reshape(-1, 3)
+    count = len(translations)
+    scales = np.asarray(scales, dtype=np.float64).reshape(count, -1)
+    
+    all_vertices = vertices[None] * scales[:, None, :] + translations[:, None, :]
+    all_faces = faces[None] + (np.arange(count, dtype=np.int64) * len(vertices))[:, None, None]
+    vertex_colors = None
+    if colors is not None:
+        vertex_colors = np.repeat(np.asarray(colors, dtype=np.uint8).reshape(count, -1), len(vertices), axis=0)
+    
+    return trimesh.Trimesh(vertices=all_vertices.reshape(-1, 3), faces=all_faces.reshape(-1, 3),
+                           vertex_colors=vertex_colors, process=False)
@@ -0,0 +1,27 @@
+import numpy as np
+from typing import List, Optional, Union
+
+# Anything np.random.default_rng accepts: None for fresh OS entropy, an int, a SeedSequence or a Generator
+SeedLike = Optional[Union[int, np.random.SeedSequence, np.random.Generator]]
+
+def seed_sequence(seed: SeedLike = None) -> np.random.SeedSequence:
+    """The SeedSequence behind ``seed`` (a Generator's own, so spawning from it advances it)"""
+    if isinstance(seed, np.random.Generator):
+        bit_generator = seed.bit_generator
+        # ``seed_seq`` is public from numpy 1.25; older releases only have the private attribute
+        seed_seq = getattr(bit_generator, 'seed_seq', None)
+        return seed_seq if seed_seq is not None else bit_generator._seed_seq
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    return np.random.SeedSequence(seed)
+
+def spawn(seed: SeedLike, count: int) -> List[np.random.SeedSequence]:
+    """``count`` independent child seeds for sub-tasks
+    
+    A child depends only on its parent and its index, never on which worker
+    runs it or when, so work fanned out over a pool gives the same result
+    as running it serially with any worker count. Sequences pickle, so
+    they can be sent to process pools; each task turns its own into a
+    Generator with ``np.random.default_rng``.
+    """
+    return seed_sequence(seed).spawn(count)
@@ -0,0 +1,84 @@
+import moderngl
+import numpy as np
+from typing import Dict, List, Optional
+
+class BufferPool:
+    """Size-bucketed pool of GPU buffers.
+    
+    Buffer sizes are rounded up to buckets (four steps per power of two, so at
+    most 25% is wasted) and released buffers are kept per bucket for reuse, so
+    spawning and despawning similar meshes does not reallocate GPU memory.
+    Idle buffers beyond ``max_free_bytes`` are destroyed. The pool also keeps
+    the byte counts used for GPU memory accounting.
+    """
+    
+    def __init__(self, ctx: moderngl.Context, min_bucket: int = 4096, max_free_bytes: int = 64 << 20):
+        self.ctx = ctx
+        self.min_bucket = min_bucket
+        self.max_free_bytes = max_free_bytes
+        
+        # Idle buffers by bucket size, oldest first
+        self.free: Dict[int, List[moderngl.Buffer]] = {}
+        self.in_use_bytes = 0
+        self.free_bytes = 0
+        self.stats = {'reused': 0, 'allocated': 0, 'destroyed': 0}
+    
+    @property
+    def allocated_bytes(self) -> int:
+        """Bytes of every live buffer owned by the pool, in use or idle"""
+        return self.in_use_bytes + self.free_bytes
+    
+    def bucket_size(self, nbytes: int) -> int:
+        if nbytes <= self.min_bucket:
+            return self.min_bucket
+        step = 1 << max(int(nbytes - 1).bit_length() - 3, 0)
+        return -(-nbytes // step) * step
+    
+    def acquire(self, data=None, reserve: int = 0) -> moderngl.Buffer:
+        """Get a buffer of at least ``len(data)`` (or ``reserve``) bytes, with ``data`` written at the start"""
+        if data is not None:
+            data = np.ascontiguousarray(data) if isinstance(data, np.ndarray) else data
+            nbytes = data.nbytes if isinstance(data, np.ndarray) else len(data)
+        else:
+            nbytes = reserve
+        size = self.bucket_size(nbytes)
+        
+        bucket = self.free.get(size)
+        if bucket:
+            buffer = bucket.pop()
+            self.free_bytes -= size
+            self.stats['reused'] += 1
+        else:
+            buffer = self.ctx.buffer(reserve=size, dynamic=True)
+            self.stats['allocated'] += 1
+        self.in_use_bytes += size
+        
+        if data is not None and nbytes:
+            buffer.write(data)
+        return buffer
+    
+    def release(self, buffer: moderngl.Buffer):
+        """Return a buffer from ``acquire`` to the pool"""
+        self.in_use_bytes -= buffer.size
+        self.free.setdefault(buffer.size, []).append(buffer)
+        self.free_bytes += buffer.size
+        if self.free_bytes > self.max_free_bytes:
+            self.trim(self.max_free_bytes)
+    
+    def trim(self, max_free_bytes: Optional[int] = None):
+        """Destroy idle buffers, largest buckets first, until at most ``max_free_bytes`` remain idle"""
+        limit = self.max_free_bytes if max_free_bytes is None else max_free_bytes
+        for size in sorted(self.free, reverse=True):
+            bucket = self.free[size]
+            while bucket and self.free_bytes > limit:
+                bucket.pop(0).release()
+                self.free_bytes -= size
+                self.stats['destroyed'] += 1
+            if not bucket:
+                del self.free[size]
+            if self.free_bytes <= limit:
+                break
+    
+    def clear(self):
+        """Destroy all idle buffers (buffers still in use belong to their owners)"""
+        self.trim(0)
@@ -0,0 +1,102 @@
+import numpy as np
+from typing import Tuple
+
+class ClusterGrid:
+    """View-space froxel grid for clustered forward lighting.
+    
+    The view frustum is split into ``tiles_x`` x ``tiles_y`` screen tiles and
+    ``slices`` depth slices spaced logarithmically between the near and far
+    planes. Each frame, point lights (spheres) are binned into every cluster
+    their bounds overlap, producing a flat light index list plus an (offset,
+    count) pair per cluster for the fragment shader. Lights are expanded per
+    depth slice first, so each slice only gets the screen tiles covered by the
+    part of the sphere inside that slice.
+    """
+    
+    def __init__(self, tiles_x: int = 16, tiles_y: int = 9, slices: int = 24):
+        self.tiles_x = tiles_x
+        self.tiles_y = tiles_y
+        self.slices = slices
+        self.cluster_count = tiles_x * tiles_y * slices
+        
+        # Radix-sortable key type for cluster indices
+        self.key_dtype = np.uint16 if self.cluster_count <= np.iinfo(np.uint16).max else np.int64
+    
+    def slice_scale(self, near: float, far: float) -> float:
+        """Factor turning log(depth / near) into a slice index"""
+        return self.slices / np.log(far / near)
+    
+    def assign(self, view_positions: np.ndarray, radii: np.ndarray, projection: np.ndarray,
+               near: float, far: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Bin lights into clusters
+        
+        ``view_positions`` are (N, 3) light centers in view space (camera looking
+        down -Z). Returns ``(grid, indices)``: ``grid`` is (cluster_count, 2)
+        uint32 offsets and counts into ``indices``, the concatenated light lists.
+        Clusters are numbered ``x + y * tiles_x + z * tiles_x * tiles_y``.
+        """
+        grid = np.zeros((self.cluster_count, 2), dtype=np.uint32)
+        
+        depth = -view_positions[:, 2]
+        lights = np.flatnonzero((depth + radii > near) & (depth - radii < far))
+        if len(lights) == 0:
+            return grid, np.zeros(0, dtype=np.uint32)
+        
+        # Expand each light over the depth slices its sphere spans
+        scale = self.slice_scale(near, far)
+        slice_edges = near * np.exp(np.arange(self.slices + 1) / scale)
+        center = view_positions[lights]
+        radius = radii[lights]
+        first = self._slice(depth[lights] - radius, near, scale)
+        last = self._slice(depth[lights] + radius, near, scale)
+        
+        counts = last - first + 1
+        owner = np.repeat(np.arange(len(lights)), counts)
+        slice_index = np.arange(int(counts.sum())) - np.repeat(np.cumsum(counts) - counts, counts) + first[owner]
+        
+        # Part of the sphere inside the slice: its depth range and cross-section radius
+        light_depth = depth[lights][owner]
+        z_low = np.maximum(slice_edges[slice_index], light_depth - radius[owner])
+        z_high = np.minimum(slice_edges[slice_index + 1], light_depth + radius[owner])
+        offset = np.maximum(np.maximum(z_low - light_depth, light_depth - z_high), 0.0)
+        section = np.sqrt(np.maximum(np.square(radius[owner]) - np.square(offset), 0.0))
+        
+        # Screen tiles of that part: x/z over the corners of its view-space box
+        tx0, tx1 = self._tile_range(center[owner, 0], section, z_low, z_high, projection[0, 0], self.tiles_x)
+        ty0, ty1 = self._tile_range(center[owner, 1], section, z_low, z_high, projection[1, 1], self.tiles_y)
+        on_screen = (tx0 <= tx1) & (ty0 <= ty1)
+        owner, slice_index = owner[on_screen], slice_index[on_screen]
+        tx0, tx1, ty0, ty1 = tx0[on_screen], tx1[on_screen], ty0[on_screen], ty1[on_screen]
+        
+        # Expand each (light, slice) over its tile rectangle
+        extent_x = tx1 - tx0 + 1
+        counts = extent_x * (ty1 - ty0 + 1)
+        total = int(counts.sum())
+        pair = np.repeat(np.arange(len(owner), dtype=np.int32), counts)
+        local = np.arange(total, dtype=np.int32) - np.repeat((np.cumsum(counts) - counts).astype(np.int32), counts)
+        cy, cx = np.divmod(local, extent_x[pair])
+        cx += tx0[pair]
+        cy += ty0[pair]
+        clusters = (cx + cy * self.tiles_x + slice_index[pair] * (self.tiles_x * self.tiles_y)).astype(self.key_dtype)
+        
+        order = np.argsort(clusters, kind='stable')
+        indices = lights[owner[pair[order]]].astype(np.uint32)
+        
+        cluster_counts = np.bincount(clusters, minlength=self.cluster_count)
+        grid[:, 0] = np.cumsum(cluster_counts) - cluster_counts
+        grid[:, 1] = cluster_counts
+        return grid, indices
+    
+    def _slice(self, depth: np.ndarray, near: float, scale: float) -> np.ndarray:
+        return np.clip(np.floor(np.log(np.maximum(depth, near) / near) * scale), 0, self.slices - 1).astype(np.int64)
+    
+    @staticmethod
+    def _tile_range(coordinate: np.ndarray, radius: np.ndarray, z_low: np.ndarray, z_high: np.ndarray,
+                    scale: float, tiles: int) -> Tuple[np.ndarray, np.ndarray]:
+        """First and last tile along one screen axis covered by a view-space box (empty when first > last)"""
+        corners = np.stack([(coordinate - radius) / z_low, (coordinate + radius) / z_low,
+                            (coordinate - radius) / z_high, (coordinate + radius) / z_high])
+        low = np.floor((corners.min(axis=0) * scale * 0.5 + 0.5) * tiles)
+        high = np.floor((corners.max(axis=0) * scale * 0.5 + 0.5) * tiles)
+        return (np.maximum(low, 0).astype(np.int32),
+                np.minimum(high, tiles - 1).astype(np.int32))
@@ -0,0 +1,259 @@
+import numpy as np
+from typing import Dict, List, Hashable
+
+def frustum_planes(view_projection: np.ndarray) -> np.ndarray:
+    """Extract the six (left, right, bottom, top, near, far) planes of a view-projection matrix
+    
+    Planes are returned as (6, 4) rows ``(nx, ny, nz, d)`` with inward-facing
+    normals, so a point ``p`` is inside when ``n . p + d >= 0`` for every plane.
+    """
+    m = np.asarray(view_projection, dtype=np.float64)
+    planes = np.array([
+        m[3] + m[0],
+        m[3] - m[0],
+        m[3] + m[1],
+        m[3] - m[1],
+        m[3] + m[2],
+        m[3] - m[2]
+    ])
+    planes /= np.linalg.norm(planes[:, :3], axis=1, keepdims=True)
+    return planes
+
+def transform_bounds(local_bounds: np.ndarray, transforms: np.ndarray) -> np.ndarray:
+    """Transform (N, 2, 3) local AABBs by (N, 4, 4) matrices into world-space AABBs"""
+    center = (local_bounds[:, 0] + local_bounds[:, 1]) * 0.5
+    extent = (local_bounds[:, 1] - local_bounds[:, 0]) * 0.5
+    
+    rotation = transforms[:, :3, :3]
+    world_center = np.einsum('nij,nj->ni', rotation, center) + transforms[:, :3, 3]
+    world_extent = np.einsum('nij,nj->ni', np.abs(rotation), extent)
+    
+    return np.stack([world_center - world_extent, world_center + world_extent], axis=1)
+
+class BoundingVolumeHierarchy:
+    """Flat AABB hierarchy over keyed bounding boxes for frustum queries.
+    
+    Nodes are stored in arrays and every node covers a contiguous range of the
+    sorted primitive order, so a node fully inside the frustum accepts its whole
+    range at once. Moving primitives only refits node bounds; adding or removing
+    primitives, or refits that have degraded the tree, trigger a rebuild.
+    """
+    
+    def __init__(self, leaf_size: int = 8, rebuild_ratio: float = 2.0):
+        self.leaf_size = leaf_size
+        self.rebuild_ratio = rebuild_ratio
+        
+        # Primitive storage (packed; index order is insertion order with swap-removal).
+        # Bounds live in a capacity-doubling buffer so bulk inserts stay amortized O(1)
+        self.keys: List[Hashable] = []
+        self.key_index: Dict[Hashable, int] = {}
+        self._bounds_buffer = np.zeros((64, 2, 3), dtype=np.float64)
+        
+        # Node arrays, filled by _build
+        self.order = np.zeros(0, dtype=np.int64)
+        self.node_bounds = np.zeros((0, 2, 3), dtype=np.float64)
+        self.node_start = np.zeros(0, dtype=np.int64)
+        self.node_count = np.zeros(0, dtype=np.int64)
+        self.node_left = np.zeros(0, dtype=np.int64)
+        self.node_depth = np.zeros(0, dtype=np.int64)
+        self.leaf_nodes = np.zeros(0, dtype=np.int64)
+        self.build_cost = 0.0
+        
+        self.needs_rebuild = False
+        self.needs_refit = False
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.key_index
+    
+    @property
+    def bounds(self) -> np.ndarray:
+        """(N, 2, 3) bounds of the live primitives, a view into the backing buffer"""
+        return self._bounds_buffer[:len(self.keys)]
+    
+    def insert(self, key: Hashable, bounds: np.ndarray):
+        """Add (or replace) a primitive with (2, 3) world-space bounds"""
+        if key in self.key_index:
+            self.update(key, bounds)
+            return
+        
+        index = len(self.keys)
+        if index == len(self._bounds_buffer):
+            grown = np.zeros((2 * index, 2, 3), dtype=np.float64)
+            grown[:index] = self._bounds_buffer
+            self._bounds_buffer = grown
+        
+        self._bounds_buffer[index] = np.asarray(bounds, dtype=np.float64).reshape(2, 3)
+        self.key_index[key] = index
+        self.keys.append(key)
+        self.needs_rebuild = True
+    
+    def update(self, key: Hashable, bounds: np.ndarray):
+        """Change one primitive's bounds; the tree is refit lazily"""
+        self.bounds[self.key_index[key]] = bounds
+        self.needs_refit = True
+    
+    def update_many(self, keys: List[Hashable], bounds: np.ndarray):
+        """Change the bounds of many primitives at once"""
+        if not keys:
+            return
+        
+        indices = np.fromiter((self.key_index[key] for key in keys), dtype=np.int64, count=len(keys))
+        self.bounds[indices] = bounds
+        self.needs_refit = True
+    
+    def remove(self, key: Hashable):
+        """Remove a primitive (no-op if absent)"""
+        index = self.key_index.pop(key, None)
+        if index is None:
+            return
+        
+        last = len(self.keys) - 1
+        if index != last:
+            moved = self.keys[last]
+            self.keys[index] = moved
+            self.key_index[moved] = index
+            self._bounds_buffer[index] = self._bounds_buffer[last]
+        
+        self.keys.pop()
+        self.needs_rebuild = True
+    
+    def clear(self):
+        self.keys.clear()
+        self.key_index.clear()
+        self._bounds_buffer = np.zeros((64, 2, 3), dtype=np.float64)
+        self.needs_rebuild = True
+    
+    def query_frustum(self, planes: np.ndarray) -> List[Hashable]:
+        """Return the keys of all primitives whose bounds intersect the frustum"""
+        if not self.keys:
+            return []
+        
+        self._prepare()
+        
+        normals = planes[:, :3]
+        offsets = planes[:, 3]
+        abs_normals = np.abs(normals)
+        
+        accepted = []
+        frontier = np.zeros(1, dtype=np.int64)
+        
+        # Breadth-first over the tree, one vectorized plane test per level
+        while len(frontier):
+            bounds = self.node_bounds[frontier]
+            center = (bounds[:, 0] + bounds[:, 1]) * 0.5
+            extent = (bounds[:, 1] - bounds[:, 0]) * 0.5
+            
+            distance = center @ normals.T + offsets
+            radius = extent @ abs_normals.T
+            
+            outside = np.any(distance < -radius, axis=1)
+            inside = np.all(distance >= radius, axis=1)
+            
+            # Whole subtrees fully inside the frustum are accepted without descending
+            accepted.append(self._node_primitives(frontier[inside]))
+            
+            partial = frontier[~outside & ~inside]
+            is_leaf = self.node_left[partial] < 0
+            accepted.append(self._test_primitives(self._node_primitives(partial[is_leaf]),
+                                                  normals, abs_normals, offsets))
+            
+            internal = partial[~is_leaf]
+            left = self.node_left[internal]
+            frontier = np.concatenate([left, left + 1]) if len(internal) else np.zeros(0, dtype=np.int64)
+        
+        keys = self.keys
+        return [keys[i] for i in np.concatenate(accepted)]
+    
+    def _node_primitives(self, nodes: np.ndarray) -> np.ndarray:
+        """Primitive indices covered by ``nodes`` (each node owns a contiguous range of ``order``)"""
+        counts = self.node_count[nodes]
+        total = int(counts.sum())
+        if total == 0:
+            return np.zeros(0, dtype=np.int64)
+        
+        range_offsets = np.repeat(self.node_start[nodes] - (np.cumsum(counts) - counts), counts)
+        return self.order[range_offsets + np.arange(total)]
+    
+    def _test_primitives(self, indices: np.ndarray, normals: np.ndarray, abs_normals: np.ndarray,
+                         offsets: np.ndarray) -> np.ndarray:
+        bounds = self.bounds[indices]
+        center = (bounds[:, 0] + bounds[:, 1]) * 0.5
+        extent = (bounds[:, 1] - bounds[:, 0]) * 0.5
+        
+        distance = center @ normals.T + offsets
+        radius = extent @ abs_normals.T
+        return indices[~np.any(distance < -radius, axis=1)]
+    
+    def _prepare(self):
+        if self.needs_rebuild:
+            self._build()
+        elif self.needs_refit:
+            self._refit()
+            if self._tree_cost() > self.build_cost * self.rebuild_ratio:
+                self._build()
+    
+    def _build(self):
+        """Breadth-first median split on the longest centroid axis; siblings are stored adjacently"""
+        count = len(self.keys)
+        centroids = (self.bounds[:, 0] + self.bounds[:, 1]) * 0.5
+        order = np.arange(count, dtype=np.int64)
+        
+        starts, counts, lefts, depths = [0], [count], [-1], [0]
+        node = 0
+        while node < len(starts):
+            start, n = starts[node], counts[node]
+            if n > self.leaf_size:
+                segment = order[start:start + n]
+                points = centroids[segment]
+                axis = np.argmax(points.max(axis=0) - points.min(axis=0))
+                half = n // 2
+                order[start:start + n] = segment[np.argpartition(points[:, axis], half)]
+                
+                lefts[node] = len(starts)
+                starts += [start, start + half]
+                counts += [half, n - half]
+                lefts += [-1, -1]
+                depths += [depths[node] + 1] * 2
+            node += 1
+        
+        self.order = order
+        self.node_start = np.array(starts, dtype=np.int64)
+        self.node_count = np.array(counts, dtype=np.int64)
+        self.node_left = np.array(lefts, dtype=np.int64)
+        self.node_depth = np.array(depths, dtype=np.int64)
+        self.leaf_nodes = np.flatnonzero(self.node_left < 0)
+        self.node_bounds = np.zeros((len(starts), 2, 3), dtype=np.float64)
+        
+        self.needs_rebuild = False
+        self._refit()
+        self.build_cost = self._tree_cost()
+    
+    def _refit(self):
+        """Recompute node bounds bottom-up, one vectorized pass per tree level"""
+        sorted_bounds = self.bounds[self.order]
+        leaves = self.leaf_nodes
+        leaf_order = np.argsort(self.node_start[leaves])
+        leaves = leaves[leaf_order]
+        leaf_starts = self.node_start[leaves]
+        
+        self.node_bounds[leaves, 0] = np.minimum.reduceat(sorted_bounds[:, 0], leaf_starts, axis=0)
+        self.node_bounds[leaves, 1] = np.maximum.reduceat(sorted_bounds[:, 1], leaf_starts, axis=0)
+        
+        internal = np.flatnonzero(self.node_left >= 0)
+        for depth in range(int(self.node_depth.max(initial=0)), -1, -1):
+            nodes = internal[self.node_depth[internal] == depth]
+            if not len(nodes):
+                continue
+            left = self.node_left[nodes]
+            self.node_bounds[nodes, 0] = np.minimum(self.node_bounds[left, 0], self.node_bounds[left + 1, 0])
+            self.node_bounds[nodes, 1] = np.maximum(self.node_bounds[left, 1], self.node_bounds[left + 1, 1])
+        
+        self.needs_refit = False
+    
+    def _tree_cost(self) -> float:
+        """Total node surface area, a cheap proxy for traversal cost"""
+        size = self.node_bounds[:, 1] - self.node_bounds[:, 0]
+        return float(np.sum(size[:, 0] * size[:, 1] + size[:, 1] * size[:, 2] + size[:, 2] * size[:, 0]))
@@ -0,0 +1,21 @@
+import trimesh
+from typing import List, Sequence
+
+# Face fractions of the full mesh for each coarser level, fine to coarse
+LOD_RATIOS = (0.5, 0.25, 0.1)
+# Below this many faces a mesh is cheap to draw at any distance, so no chain is built
+MIN_LOD_FACES = 2048
+
+def simplify_chain(mesh: trimesh.Trimesh, ratios: Sequence[float] = LOD_RATIOS) -> List[trimesh.Trimesh]:
+    """Quadric-decimated copies of ``mesh`` at each of ``ratios``, fine to coarse
+    
+    The full mesh itself is not included. Levels the simplifier cannot build
+    are left out, so the chain may be shorter than ``ratios`` or empty.
+    """
+    lods = []
+    for ratio in ratios:
+        try:
+            lods.append(mesh.simplify_quadric_decimation(face_count=max(int(len(mesh.faces) * ratio), 4)))
+        except Exception:
+            continue
+    return lods
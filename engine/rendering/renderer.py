@@ -5,20 +5,50 @@ from typing import Dict, List, Tuple, Optional
 import trimesh
 from OpenGL.GL import *
 import math
+import time
+from .culling import BoundingVolumeHierarchy, frustum_planes, transform_bounds
+from .clustered_lighting import ClusterGrid
+from .buffer_pool import BufferPool
+from .vertex_formats import (COMPACT_VERTEX, COMPACT_VERTEX_FORMAT, FLOAT_VERTEX_FORMAT, dequantize_vertices,
+                             index_array, quantize_vertices)
 
 class AdvancedRenderer:
-    def __init__(self, width: int, height: int):
+    # Object matrix texture layout: 8 RGBA32F texels (model + normal matrix columns) per object
+    OBJECTS_PER_ROW = 128
+    OBJECT_MATRIX_UNIT = 1
+    FRAME_UBO_BINDING = 0
+    MAX_LOD_LEVELS = 8
+    
+    # Clustered lighting textures: per-cluster (offset, count), flat light index list, and
+    # 2 RGBA32F texels (position + radius, color * intensity) per light
+    CLUSTER_GRID_UNIT = 2
+    LIGHT_INDEX_UNIT = 3
+    LIGHT_DATA_UNIT = 4
+    LIGHT_INDEX_WIDTH = 4096
+    LIGHTS_PER_ROW = 1024
+    
+    def __init__(self, width: int, height: int, standalone: bool = False):
         self.width = width
         self.height = height
+        self.standalone = standalone
         
-        # Initialize OpenGL context
-        pygame.init()
-        pygame.display.set_mode((width, height), pygame.OPENGL | pygame.DOUBLEBUF)
-        
-        self.ctx = moderngl.create_context()
+        # Initialize OpenGL context (standalone: headless, frames stay in self.framebuffer)
+        if standalone:
+            try:
+                self.ctx = moderngl.create_standalone_context()
+            except Exception:
+                # No X display (e.g. servers): fall back to EGL
+                self.ctx = moderngl.create_standalone_context(backend='egl')
+        else:
+            pygame.init()
+            pygame.display.set_mode((width, height), pygame.OPENGL | pygame.DOUBLEBUF)
+            self.ctx = moderngl.create_context()
         self.ctx.enable(moderngl.DEPTH_TEST)
         self.ctx.enable(moderngl.CULL_FACE)
         
+        # Clustered forward lighting: point lights are binned into view-space clusters every frame
+        self.clusters = ClusterGrid()
+        
         # Shader programs
         self.programs = {}
         self._init_shaders()
@@ -32,12 +62,1529 @@ class AdvancedRenderer:
         self.lights = []
         self._setup_default_lighting()
         
-        # Render objects
+        # Bulk point lights (e.g. streetlights), shaded through the cluster grid along with lights[1:].
+        # A light's radius defaults to the distance where its falloff drops to light_cutoff
+        self.light_cutoff = 0.01
+        self.point_light_positions = np.zeros((0, 3), dtype=np.float32)
+        self.point_light_colors = np.zeros((0, 3), dtype=np.float32)
+        self.point_light_radii = np.zeros(0, dtype=np.float32)
+        self.cluster_grid_texture = self.ctx.texture((self.clusters.tiles_x * self.clusters.tiles_y, self.clusters.slices), 2, dtype='u4')
+        self.cluster_grid_texture.filter = (moderngl.NEAREST, moderngl.NEAREST)
+        self.light_index_texture = None
+        self.light_data_texture = None
+        self._grow_light_textures(self.LIGHT_INDEX_WIDTH, self.LIGHTS_PER_ROW)
+        
+        # Render objects and shared geometry keyed by prototype
         self.render_objects = {}
+        self.mesh_prototypes = {}
+        
+        # Geometry and instance buffers come from a size-bucketed pool. Uploaded LOD levels are
+        # tracked by (id(geometry), level) so an optional budget (bytes) can evict them LRU-first
+        self.buffer_pool = BufferPool(self.ctx)
+        self.gpu_memory_budget = None
+        self.resident_lods = {}
+        self.lod_geometry_bytes = 0
+        self.frame_index = 0
+        
+        # Upload add_mesh geometry in the compact quantized layout (20 bytes per vertex, 16-bit
+        # indices when possible) instead of float32 (44 bytes per vertex, 32-bit indices)
+        self.compact_vertices = True
+        
+        # Instanced meshes: one geometry buffer plus a packed per-instance buffer each
+        self.instanced_meshes = {}
+        
+        # Frustum culling: world-space bounds of render objects, refit when transforms change
+        self.frustum_culling = True
+        self.bvh = BoundingVolumeHierarchy()
+        self.dirty_bounds = set()
+        self.render_stats = {'objects_drawn': 0, 'objects_culled': 0, 'draw_calls': 0, 'triangles': 0,
+                             'lights_visible': 0, 'light_assignments': 0, 'gpu_memory_bytes': 0,
+                             'gpu_time_ms': 0.0, 'resolution_scale': 1.0}
+        
+        # Projection and screen-space-error LOD selection (error in pixels, +/- hysteresis band)
+        self.fov = 45.0
+        self.near_plane = 0.1
+        self.far_plane = 100.0
+        self.lod_error_threshold = 2.0
+        self.lod_hysteresis = 0.25
+        
+        # Draw sorting and static batching: materials are interned to small integer IDs
+        self.material_ids = {}
+        self.static_batches = {}
+        self.next_batch_id = 0
+        self.stale_batches = set()
+        
+        # Per-frame uniform buffer (view-projection, camera, main light, cluster grid parameters)
+        self.frame_ubo = self.ctx.buffer(reserve=160, dynamic=True)
+        
+        # Per-object float32 model/normal matrices, mirrored to a texture; dirty slots are uploaded once per frame
+        self.object_matrices = np.zeros((0, 8, 4), dtype=np.float32)
+        self.object_matrix_texture = None
+        self.free_object_slots = []
+        self.object_slot_count = 0
+        self.dirty_matrix_slots = set()
+        self._grow_object_matrices(self.OBJECTS_PER_ROW)
+        
+        # Dynamic resolution: with a frame-time target (ms), the scene is drawn into a scaled
+        # viewport of the offscreen framebuffer and upscaled by the blit. The scale follows
+        # smoothed GPU time (timer queries, read a few frames late to avoid stalls)
+        self.target_frame_time = None
+        self.resolution_scale = 1.0
+        self.min_resolution_scale = 0.5
+        self.max_resolution_scale = 1.0
+        self.resolution_adjust_interval = 15
+        self.render_width = width
+        self.render_height = height
+        self.gpu_time_ms = 0.0
+        self.frame_time_ms = 0.0
+        self.last_frame_start = None
+        self.last_resolution_change = 0
+        try:
+            self.timer_queries = [self.ctx.query(time=True) for _ in range(3)]
+        except Exception:
+            # No timer queries: fall back to wall-clock frame time
+            self.timer_queries = None
         
         # Post-processing
         self.framebuffer = None
         self._setup_post_processing()
     
     def _init_shaders(self):
-        \"\"\"Initialize shader programs\"\"\"\n        # Basic PBR shader\n        vertex_shader = '''\n        #version 330 core\n        \n        in vec3 in_position;\n        in vec3 in_normal;\n        in vec2 in_texcoord;\n        in vec3 in_color;\n        \n        uniform mat4 mvp_matrix;\n        uniform mat4 model_matrix;\n        uniform mat4 normal_matrix;\n        \n        out vec3 world_pos;\n        out vec3 normal;\n        out vec2 texcoord;\n        out vec3 vertex_color;\n        \n        void main() {\n            world_pos = (model_matrix * vec4(in_position, 1.0)).xyz;\n            normal = normalize((normal_matrix * vec4(in_normal, 0.0)).xyz);\n            texcoord = in_texcoord;\n            vertex_color = in_color;\n            \n            gl_Position = mvp_matrix * vec4(in_position, 1.0);\n        }\n        '''\n        \n        fragment_shader = '''\n        #version 330 core\n        \n        in vec3 world_pos;\n        in vec3 normal;\n        in vec2 texcoord;\n        in vec3 vertex_color;\n        \n        uniform vec3 camera_pos;\n        uniform vec3 light_pos;\n        uniform vec3 light_color;\n        uniform float light_intensity;\n        \n        uniform vec3 material_albedo;\n        uniform float material_metallic;\n        uniform float material_roughness;\n        uniform float material_ao;\n        \n        out vec4 fragColor;\n        \n        vec3 calculatePBR(vec3 albedo, float metallic, float roughness, vec3 normal, vec3 viewDir, vec3 lightDir, vec3 lightColor) {\n            vec3 F0 = mix(vec3(0.04), albedo, metallic);\n            vec3 halfwayDir = normalize(lightDir + viewDir);\n            \n            float NdotV = max(dot(normal, viewDir), 0.0);\n            float NdotL = max(dot(normal, lightDir), 0.0);\n            float HdotV = max(dot(halfwayDir, viewDir), 0.0);\n            float NdotH = max(dot(normal, halfwayDir), 0.0);\n            \n            // Fresnel\n            vec3 F = F0 + (1.0 - F0) * pow(1.0 - HdotV, 5.0);\n            \n            // Distribution\n            float alpha = roughness * roughness;\n            float alpha2 = alpha * alpha;\n            float denom = NdotH * NdotH * (alpha2 - 1.0) + 1.0;\n            float D = alpha2 / (3.14159265 * denom * denom);\n            \n            // Geometry\n            float k = (roughness + 1.0) * (roughness + 1.0) / 8.0;\n            float G1L = NdotL / (NdotL * (1.0 - k) + k);\n            float G1V = NdotV / (NdotV * (1.0 - k) + k);\n            float G = G1L * G1V;\n            \n            // BRDF\n            vec3 numerator = D * G * F;\n            float denominator = 4.0 * NdotV * NdotL + 0.001;\n            vec3 specular = numerator / denominator;\n            \n            vec3 kS = F;\n            vec3 kD = vec3(1.0) - kS;\n            kD *= 1.0 - metallic;\n            \n            return (kD * albedo / 3.14159265 + specular) * lightColor * NdotL;\n        }\n        \n        void main() {\n            vec3 albedo = material_albedo * vertex_color;\n            \n            vec3 viewDir = normalize(camera_pos - world_pos);\n            vec3 lightDir = normalize(light_pos - world_pos);\n            \n            vec3 color = calculatePBR(albedo, material_metallic, material_roughness, normal, viewDir, lightDir, light_color * light_intensity);\n            \n            // Ambient\n            vec3 ambient = vec3(0.03) * albedo * material_ao;\n            color += ambient;\n            \n            // Tone mapping\n            color = color / (color + vec3(1.0));\n            \n            // Gamma correction\n            color = pow(color, vec3(1.0/2.2));\n            \n            fragColor = vec4(color, 1.0);\n        }\n        '''\n        \n        self.programs['pbr'] = self.ctx.program(vertex_shader=vertex_shader, fragment_shader=fragment_shader)\n        \n        # Skybox shader\n        skybox_vertex = '''\n        #version 330 core\n        in vec3 in_position;\n        uniform mat4 view_matrix;\n        uniform mat4 projection_matrix;\n        out vec3 texCoords;\n        \n        void main() {\n            texCoords = in_position;\n            vec4 pos = projection_matrix * view_matrix * vec4(in_position, 1.0);\n            gl_Position = pos.xyww;\n        }\n        '''\n        \n        skybox_fragment = '''\n        #version 330 core\n        in vec3 texCoords;\n        out vec4 fragColor;\n        \n        void main() {\n            vec3 color = mix(vec3(0.5, 0.7, 1.0), vec3(0.1, 0.1, 0.2), normalize(texCoords).y * 0.5 + 0.5);\n            fragColor = vec4(color, 1.0);\n        }\n        '''\n        \n        self.programs['skybox'] = self.ctx.program(vertex_shader=skybox_vertex, fragment_shader=skybox_fragment)\n    \n    def _setup_default_lighting(self):\n        \"\"\"Setup default lighting\"\"\"\n        self.lights = [\n            {\n                'position': np.array([5.0, 5.0, 5.0]),\n                'color': np.array([1.0, 1.0, 1.0]),\n                'intensity': 10.0\n            },\n            {\n                'position': np.array([-5.0, 3.0, 2.0]),\n                'color': np.array([0.8, 0.9, 1.0]),\n                'intensity': 5.0\n            }\n        ]\n    \n    def _setup_post_processing(self):\n        \"\"\"Setup post-processing pipeline\"\"\"\n        # Create framebuffer for post-processing\n        self.color_texture = self.ctx.texture((self.width, self.height), 4)\n        self.depth_texture = self.ctx.depth_texture((self.width, self.height))\n        self.framebuffer = self.ctx.framebuffer(color_attachments=[self.color_texture], depth_attachment=self.depth_texture)\n        \n        # Post-processing quad\n        quad_vertices = np.array([\n            -1.0, -1.0, 0.0, 0.0,\n             1.0, -1.0, 1.0, 0.0,\n             1.0,  1.0, 1.0, 1.0,\n            -1.0,  1.0, 0.0, 1.0\n        ], dtype=np.float32)\n        \n        quad_indices = np.array([0, 1, 2, 0, 2, 3], dtype=np.uint32)\n        \n        self.quad_vbo = self.ctx.buffer(quad_vertices.tobytes())\n        self.quad_ibo = self.ctx.buffer(quad_indices.tobytes())\n        self.quad_vao = self.ctx.vertex_array(self.programs['pbr'], [(self.quad_vbo, '2f 2f', 'in_position', 'in_texcoord')])\n    \n    def add_mesh(self, mesh_id: str, mesh: trimesh.Trimesh, material: Optional[Dict] = None):\n        \"\"\"Add mesh to renderer\"\"\"\n        if material is None:\n            material = {\n                'albedo': [0.7, 0.7, 0.7],\n                'metallic': 0.0,\n                'roughness': 0.5,\n                'ao': 1.0\n            }\n        \n        # Prepare vertex data\n        vertices = mesh.vertices.astype(np.float32)\n        normals = mesh.vertex_normals.astype(np.float32)\n        \n        # Generate texture coordinates if not present\n        if hasattr(mesh.visual, 'uv') and mesh.visual.uv is not None:\n            texcoords = mesh.visual.uv.astype(np.float32)\n        else:\n            # Generate spherical UV coordinates\n            texcoords = self._generate_spherical_uv(vertices)\n        \n        # Get vertex colors\n        if hasattr(mesh.visual, 'vertex_colors') and mesh.visual.vertex_colors is not None:\n            colors = mesh.visual.vertex_colors[:, :3].astype(np.float32) / 255.0\n        else:\n            colors = np.ones((len(vertices), 3), dtype=np.float32) * 0.7\n        \n        # Interleave vertex data\n        vertex_data = np.column_stack([vertices, normals, texcoords, colors]).astype(np.float32)\n        \n        # Create buffers\n        vbo = self.ctx.buffer(vertex_data.tobytes())\n        ibo = self.ctx.buffer(mesh.faces.astype(np.uint32).tobytes())\n        \n        # Create VAO\n        vao = self.ctx.vertex_array(\n            self.programs['pbr'],\n            [(vbo, '3f 3f 2f 3f', 'in_position', 'in_normal', 'in_texcoord', 'in_color')],\n            ibo\n        )\n        \n        self.render_objects[mesh_id] = {\n            'vao': vao,\n            'material': material,\n            'transform': np.eye(4),\n            'face_count': len(mesh.faces)\n        }\n    \n    def _generate_spherical_uv(self, vertices: np.ndarray) -> np.ndarray:\n        \"\"\"Generate spherical UV coordinates\"\"\"\n        normalized = vertices / np.linalg.norm(vertices, axis=1, keepdims=True)\n        u = 0.5 + np.arctan2(normalized[:, 2], normalized[:, 0]) / (2 * np.pi)\n        v = 0.5 - np.arcsin(normalized[:, 1]) / np.pi\n        return np.column_stack([u, v])\n    \n    def set_camera(self, position: np.ndarray, target: np.ndarray, up: np.ndarray = None):\n        \"\"\"Set camera parameters\"\"\"\n        self.camera_pos = position\n        self.camera_target = target\n        if up is not None:\n            self.camera_up = up\n    \n    def update_object_transform(self, mesh_id: str, transform: np.ndarray):\n        \"\"\"Update object transformation matrix\"\"\"\n        if mesh_id in self.render_objects:\n            self.render_objects[mesh_id]['transform'] = transform\n    \n    def render(self):\n        \"\"\"Render the scene\"\"\"\n        # Render to framebuffer\n        self.framebuffer.use()\n        self.ctx.clear(0.1, 0.1, 0.1, 1.0)\n        self.ctx.clear(depth=1.0)\n        \n        # Calculate matrices\n        view_matrix = self._look_at(self.camera_pos, self.camera_target, self.camera_up)\n        projection_matrix = self._perspective(45.0, self.width / self.height, 0.1, 100.0)\n        \n        # Render skybox first\n        self._render_skybox(view_matrix, projection_matrix)\n        \n        # Render objects\n        for obj_id, obj in self.render_objects.items():\n            self._render_object(obj, view_matrix, projection_matrix)\n        \n        # Post-processing pass\n        self.ctx.screen.use()\n        self.ctx.clear(0.0, 0.0, 0.0, 1.0)\n        \n        # Simple blit for now (can be extended with effects)\n        self.color_texture.use(0)\n        self.quad_vao.render()\n    \n    def _render_skybox(self, view_matrix: np.ndarray, projection_matrix: np.ndarray):\n        \"\"\"Render skybox\"\"\"\n        # Create skybox cube if not exists\n        if not hasattr(self, 'skybox_vao'):\n            skybox_vertices = np.array([\n                -1.0,  1.0, -1.0, -1.0, -1.0, -1.0,  1.0, -1.0, -1.0,\n                 1.0, -1.0, -1.0,  1.0,  1.0, -1.0, -1.0,  1.0, -1.0,\n                -1.0, -1.0,  1.0, -1.0, -1.0, -1.0, -1.0,  1.0, -1.0,\n                -1.0,  1.0, -1.0, -1.0,  1.0,  1.0, -1.0, -1.0,  1.0,\n                 1.0, -1.0, -1.0,  1.0, -1.0,  1.0,  1.0,  1.0,  1.0,\n                 1.0,  1.0,  1.0,  1.0,  1.0, -1.0,  1.0, -1.0, -1.0,\n                -1.0, -1.0,  1.0, -1.0,  1.0,  1.0,  1.0,  1.0,  1.0,\n                 1.0,  1.0,  1.0,  1.0, -1.0,  1.0, -1.0, -1.0,  1.0,\n                -1.0,  1.0, -1.0,  1.0,  1.0, -1.0,  1.0,  1.0,  1.0,\n                 1.0,  1.0,  1.0, -1.0,  1.0,  1.0, -1.0,  1.0, -1.0,\n                -1.0, -1.0, -1.0, -1.0, -1.0,  1.0,  1.0, -1.0, -1.0,\n                 1.0, -1.0, -1.0, -1.0, -1.0,  1.0,  1.0, -1.0,  1.0\n            ], dtype=np.float32)\n            \n            skybox_vbo = self.ctx.buffer(skybox_vertices.tobytes())\n            self.skybox_vao = self.ctx.vertex_array(self.programs['skybox'], [(skybox_vbo, '3f', 'in_position')])\n        \n        # Remove translation from view matrix\n        skybox_view = view_matrix.copy()\n        skybox_view[:3, 3] = 0\n        \n        program = self.programs['skybox']\n        program['view_matrix'].write(skybox_view.astype(np.float32).tobytes())\n        program['projection_matrix'].write(projection_matrix.astype(np.float32).tobytes())\n        \n        self.ctx.depth_func = moderngl.LEQUAL\n        self.skybox_vao.render()\n        self.ctx.depth_func = moderngl.LESS\n    \n    def _render_object(self, obj: Dict, view_matrix: np.ndarray, projection_matrix: np.ndarray):\n        \"\"\"Render individual object\"\"\"\n        program = self.programs['pbr']\n        \n        # Calculate matrices\n        model_matrix = obj['transform']\n        mvp_matrix = projection_matrix @ view_matrix @ model_matrix\n        normal_matrix = np.linalg.inv(model_matrix).T\n        \n        # Set uniforms\n        program['mvp_matrix'].write(mvp_matrix.astype(np.float32).tobytes())\n        program['model_matrix'].write(model_matrix.astype(np.float32).tobytes())\n        program['normal_matrix'].write(normal_matrix.astype(np.float32).tobytes())\n        \n        program['camera_pos'].write(self.camera_pos.astype(np.float32).tobytes())\n        \n        # Lighting (use first light for now)\n        if self.lights:\n            light = self.lights[0]\n            program['light_pos'].write(light['position'].astype(np.float32).tobytes())\n            program['light_color'].write(light['color'].astype(np.float32).tobytes())\n            program['light_intensity'].value = light['intensity']\n        \n        # Material properties\n        material = obj['material']\n        program['material_albedo'].write(np.array(material['albedo'], dtype=np.float32).tobytes())\n        program['material_metallic'].value = material['metallic']\n        program['material_roughness'].value = material['roughness']\n        program['material_ao'].value = material['ao']\n        \n        # Render\n        obj['vao'].render()\n    \n    def _look_at(self, eye: np.ndarray, target: np.ndarray, up: np.ndarray) -> np.ndarray:\n        \"\"\"Create look-at view matrix\"\"\"\n        f = (target - eye)\n        f = f / np.linalg.norm(f)\n        \n        s = np.cross(f, up)\n        s = s / np.linalg.norm(s)\n        \n        u = np.cross(s, f)\n        \n        result = np.eye(4)\n        result[0, :3] = s\n        result[1, :3] = u\n        result[2, :3] = -f\n        result[:3, 3] = [-np.dot(s, eye), -np.dot(u, eye), np.dot(f, eye)]\n        \n        return result\n    \n    def _perspective(self, fovy: float, aspect: float, near: float, far: float) -> np.ndarray:\n        \"\"\"Create perspective projection matrix\"\"\"\n        f = 1.0 / math.tan(math.radians(fovy) / 2.0)\n        \n        result = np.zeros((4, 4))\n        result[0, 0] = f / aspect\n        result[1, 1] = f\n        result[2, 2] = (far + near) / (near - far)\n        result[2, 3] = (2.0 * far * near) / (near - far)\n        result[3, 2] = -1.0\n        \n        return result\n    \n    def cleanup(self):\n        \"\"\"Cleanup resources\"\"\"\n        for obj in self.render_objects.values():\n            obj['vao'].release()\n        \n        if hasattr(self, 'skybox_vao'):\n            self.skybox_vao.release()\n        \n        if self.framebuffer:\n            self.framebuffer.release()\n        \n        self.ctx.release()
\ No newline at end of file
+        """Initialize shader programs"""
+        # Per-frame camera and light data, shared by all programs through one uniform buffer
+        frame_block = '''
+        layout(std140) uniform FrameData {
+            mat4 view_projection;
+            vec4 camera_pos;
+            vec4 light_pos;
+            vec4 light_color;  // rgb color, w intensity
+            vec4 cluster_params;  // near, far, slice scale (slice = log(depth / near) * scale)
+            vec4 cluster_dims;  // tiles x, tiles y, depth slices
+            vec4 viewport_size;
+        };
+        '''
+        
+        # Vertex inputs of the two geometry layouts (see vertex_formats)
+        float_inputs = '''
+        in vec3 in_position;
+        in vec3 in_normal;
+        in vec2 in_texcoord;
+        in vec3 in_color;
+        
+        vec3 vertexPosition() { return in_position; }
+        vec3 vertexNormal() { return in_normal; }
+        '''
+        
+        compact_inputs = '''
+        in vec4 in_position;  // 16-bit fractions of the mesh bounds
+        in vec2 in_normal;  // 16-bit octahedral
+        in vec2 in_texcoord;
+        in vec3 in_color;
+        
+        uniform vec3 position_offset;
+        uniform vec3 position_scale;
+        
+        vec3 vertexPosition() { return position_offset + in_position.xyz * position_scale; }
+        
+        vec3 vertexNormal() {
+            vec2 e = max(in_normal / 32767.0, -1.0);
+            vec3 n = vec3(e, 1.0 - abs(e.x) - abs(e.y));
+            if (n.z < 0.0) {
+                n.xy = (1.0 - abs(n.yx)) * vec2(n.x >= 0.0 ? 1.0 : -1.0, n.y >= 0.0 ? 1.0 : -1.0);
+            }
+            return normalize(n);
+        }
+        '''
+        
+        # Basic PBR shader; model and normal matrices are fetched from the object matrix texture
+        vertex_shader = '''
+        #version 330 core
+        ''' + frame_block + '''
+        VERTEX_INPUTS
+        
+        uniform sampler2D object_matrices;
+        uniform int object_index;
+        
+        out vec3 world_pos;
+        out vec3 normal;
+        out vec2 texcoord;
+        out vec3 vertex_color;
+        
+        void main() {
+            ivec2 base = ivec2((object_index % OBJECTS_PER_ROW) * 8, object_index / OBJECTS_PER_ROW);
+            mat4 model_matrix = mat4(
+                texelFetch(object_matrices, base, 0),
+                texelFetch(object_matrices, base + ivec2(1, 0), 0),
+                texelFetch(object_matrices, base + ivec2(2, 0), 0),
+                texelFetch(object_matrices, base + ivec2(3, 0), 0)
+            );
+            mat3 normal_matrix = mat3(
+                texelFetch(object_matrices, base + ivec2(4, 0), 0).xyz,
+                texelFetch(object_matrices, base + ivec2(5, 0), 0).xyz,
+                texelFetch(object_matrices, base + ivec2(6, 0), 0).xyz
+            );
+            
+            vec4 world = model_matrix * vec4(vertexPosition(), 1.0);
+            world_pos = world.xyz;
+            normal = normalize(normal_matrix * vertexNormal());
+            texcoord = in_texcoord;
+            vertex_color = in_color;
+            
+            gl_Position = view_projection * world;
+        }
+        '''.replace('OBJECTS_PER_ROW', str(self.OBJECTS_PER_ROW))
+        
+        fragment_shader = '''
+        #version 330 core
+        ''' + frame_block + '''
+        in vec3 world_pos;
+        in vec3 normal;
+        in vec2 texcoord;
+        in vec3 vertex_color;
+        
+        uniform vec3 material_albedo;
+        uniform float material_metallic;
+        uniform float material_roughness;
+        uniform float material_ao;
+        
+        uniform usampler2D cluster_grid;
+        uniform usampler2D light_indices;
+        uniform sampler2D light_data;
+        
+        out vec4 fragColor;
+        
+        vec3 calculatePBR(vec3 albedo, float metallic, float roughness, vec3 normal, vec3 viewDir, vec3 lightDir, vec3 lightColor) {
+            vec3 F0 = mix(vec3(0.04), albedo, metallic);
+            vec3 halfwayDir = normalize(lightDir + viewDir);
+            
+            float NdotV = max(dot(normal, viewDir), 0.0);
+            float NdotL = max(dot(normal, lightDir), 0.0);
+            float HdotV = max(dot(halfwayDir, viewDir), 0.0);
+            float NdotH = max(dot(normal, halfwayDir), 0.0);
+            
+            // Fresnel
+            vec3 F = F0 + (1.0 - F0) * pow(1.0 - HdotV, 5.0);
+            
+            // Distribution
+            float alpha = roughness * roughness;
+            float alpha2 = alpha * alpha;
+            float denom = NdotH * NdotH * (alpha2 - 1.0) + 1.0;
+            float D = alpha2 / (3.14159265 * denom * denom);
+            
+            // Geometry
+            float k = (roughness + 1.0) * (roughness + 1.0) / 8.0;
+            float G1L = NdotL / (NdotL * (1.0 - k) + k);
+            float G1V = NdotV / (NdotV * (1.0 - k) + k);
+            float G = G1L * G1V;
+            
+            // BRDF
+            vec3 numerator = D * G * F;
+            float denominator = 4.0 * NdotV * NdotL + 0.001;
+            vec3 specular = numerator / denominator;
+            
+            vec3 kS = F;
+            vec3 kD = vec3(1.0) - kS;
+            kD *= 1.0 - metallic;
+            
+            return (kD * albedo / 3.14159265 + specular) * lightColor * NdotL;
+        }
+        
+        // Point lights of the cluster containing this fragment
+        vec3 clusteredLighting(vec3 albedo, vec3 normal, vec3 viewDir) {
+            float near = cluster_params.x;
+            float far = cluster_params.y;
+            float depth = 2.0 * near * far / (far + near - (gl_FragCoord.z * 2.0 - 1.0) * (far - near));
+            
+            ivec3 dims = ivec3(cluster_dims.xyz);
+            int slice = clamp(int(log(depth / near) * cluster_params.z), 0, dims.z - 1);
+            ivec2 tile = clamp(ivec2(gl_FragCoord.xy / viewport_size.xy * vec2(dims.xy)), ivec2(0), dims.xy - 1);
+            uvec2 range = texelFetch(cluster_grid, ivec2(tile.x + tile.y * dims.x, slice), 0).xy;
+            
+            vec3 result = vec3(0.0);
+            for (uint i = 0u; i < range.y; i++) {
+                int index = int(range.x + i);
+                int light = int(texelFetch(light_indices, ivec2(index % LIGHT_INDEX_WIDTH, index / LIGHT_INDEX_WIDTH), 0).r);
+                ivec2 base = ivec2((light % LIGHTS_PER_ROW) * 2, light / LIGHTS_PER_ROW);
+                vec4 position_radius = texelFetch(light_data, base, 0);
+                vec3 light_color = texelFetch(light_data, base + ivec2(1, 0), 0).rgb;
+                
+                // Inverse-square falloff, windowed to reach zero at the light radius
+                vec3 toLight = position_radius.xyz - world_pos;
+                float distance = length(toLight);
+                float window = clamp(1.0 - pow(distance / position_radius.w, 4.0), 0.0, 1.0);
+                float attenuation = window * window / (distance * distance + 1.0);
+                
+                result += calculatePBR(albedo, material_metallic, material_roughness, normal, viewDir,
+                                       toLight / max(distance, 1e-4), light_color * attenuation);
+            }
+            return result;
+        }
+        
+        void main() {
+            vec3 albedo = material_albedo * vertex_color;
+            
+            vec3 viewDir = normalize(camera_pos.xyz - world_pos);
+            vec3 lightDir = normalize(light_pos.xyz - world_pos);
+            
+            vec3 color = calculatePBR(albedo, material_metallic, material_roughness, normal, viewDir, lightDir, light_color.rgb * light_color.w);
+            color += clusteredLighting(albedo, normal, viewDir);
+            
+            // Ambient
+            vec3 ambient = vec3(0.03) * albedo * material_ao;
+            color += ambient;
+            
+            // Tone mapping
+            color = color / (color + vec3(1.0));
+            
+            // Gamma correction
+            color = pow(color, vec3(1.0/2.2));
+            
+            fragColor = vec4(color, 1.0);
+        }
+        '''.replace('LIGHT_INDEX_WIDTH', str(self.LIGHT_INDEX_WIDTH)).replace('LIGHTS_PER_ROW', str(self.LIGHTS_PER_ROW))
+        
+        self.programs['pbr'] = self.ctx.program(vertex_shader=vertex_shader.replace('VERTEX_INPUTS', float_inputs),
+                                                fragment_shader=fragment_shader)
+        self.programs['pbr_compact'] = self.ctx.program(vertex_shader=vertex_shader.replace('VERTEX_INPUTS', compact_inputs),
+                                                        fragment_shader=fragment_shader)
+        
+        # Instanced PBR shader: per-instance model matrix and color tint, same lighting
+        instanced_vertex_shader = '''
+        #version 330 core
+        ''' + frame_block + '''
+        in vec3 in_position;
+        in vec3 in_normal;
+        in vec2 in_texcoord;
+        in vec3 in_color;
+        
+        in mat4 in_model;
+        in vec4 in_instance_color;
+        
+        out vec3 world_pos;
+        out vec3 normal;
+        out vec2 texcoord;
+        out vec3 vertex_color;
+        
+        void main() {
+            vec4 world = in_model * vec4(in_position, 1.0);
+            world_pos = world.xyz;
+            normal = normalize(transpose(inverse(mat3(in_model))) * in_normal);
+            texcoord = in_texcoord;
+            vertex_color = in_color * in_instance_color.rgb;
+            
+            gl_Position = view_projection * world;
+        }
+        '''
+        
+        self.programs['pbr_instanced'] = self.ctx.program(vertex_shader=instanced_vertex_shader, fragment_shader=fragment_shader)
+        
+        for name in ('pbr', 'pbr_compact', 'pbr_instanced'):
+            self.programs[name]['FrameData'].binding = self.FRAME_UBO_BINDING
+            self.programs[name]['cluster_grid'].value = self.CLUSTER_GRID_UNIT
+            self.programs[name]['light_indices'].value = self.LIGHT_INDEX_UNIT
+            self.programs[name]['light_data'].value = self.LIGHT_DATA_UNIT
+        for name in ('pbr', 'pbr_compact'):
+            self.programs[name]['object_matrices'].value = self.OBJECT_MATRIX_UNIT
+        
+        # Skybox shader
+        skybox_vertex = '''
+        #version 330 core
+        in vec3 in_position;
+        uniform mat4 view_matrix;
+        uniform mat4 projection_matrix;
+        out vec3 texCoords;
+        
+        void main() {
+            texCoords = in_position;
+            vec4 pos = projection_matrix * view_matrix * vec4(in_position, 1.0);
+            gl_Position = pos.xyww;
+        }
+        '''
+        
+        skybox_fragment = '''
+        #version 330 core
+        in vec3 texCoords;
+        out vec4 fragColor;
+        
+        void main() {
+            vec3 color = mix(vec3(0.5, 0.7, 1.0), vec3(0.1, 0.1, 0.2), normalize(texCoords).y * 0.5 + 0.5);
+            fragColor = vec4(color, 1.0);
+        }
+        '''
+        
+        self.programs['skybox'] = self.ctx.program(vertex_shader=skybox_vertex, fragment_shader=skybox_fragment)
+        
+        # Post-processing blit shader
+        blit_vertex = '''
+        #version 330 core
+        in vec2 in_position;
+        in vec2 in_texcoord;
+        out vec2 texcoord;
+        
+        void main() {
+            texcoord = in_texcoord;
+            gl_Position = vec4(in_position, 0.0, 1.0);
+        }
+        '''
+        
+        blit_fragment = '''
+        #version 330 core
+        uniform sampler2D color_texture;
+        uniform vec2 uv_scale;  // rendered fraction of the framebuffer (dynamic resolution)
+        in vec2 texcoord;
+        out vec4 fragColor;
+        
+        void main() {
+            fragColor = texture(color_texture, texcoord * uv_scale);
+        }
+        '''
+        
+        self.programs['blit'] = self.ctx.program(vertex_shader=blit_vertex, fragment_shader=blit_fragment)
+    
+    def _setup_default_lighting(self):
+        """Setup default lighting"""
+        self.lights = [
+            {
+                'position': np.array([5.0, 5.0, 5.0]),
+                'color': np.array([1.0, 1.0, 1.0]),
+                'intensity': 10.0
+            },
+            {
+                'position': np.array([-5.0, 3.0, 2.0]),
+                'color': np.array([0.8, 0.9, 1.0]),
+                'intensity': 5.0
+            }
+        ]
+    
+    def add_point_lights(self, positions: np.ndarray, colors: Optional[np.ndarray] = None,
+                         intensities: Optional[np.ndarray] = None, radii: Optional[np.ndarray] = None):
+        """Add many point lights at once
+        
+        ``positions`` is (N, 3); ``colors`` (N, 3) or (3,) defaults to white and
+        ``intensities`` (N,) or scalar to 1. Lights are clustered, so each
+        fragment only shades the lights whose ``radii`` reach it.
+        """
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 3)
+        n = len(positions)
+        colors = np.broadcast_to(np.asarray(1.0 if colors is None else colors, dtype=np.float32), (n, 3))
+        intensities = np.broadcast_to(np.asarray(1.0 if intensities is None else intensities, dtype=np.float32), (n,))
+        if radii is None:
+            radii = np.sqrt(intensities / self.light_cutoff)
+        radii = np.broadcast_to(np.asarray(radii, dtype=np.float32), (n,))
+        
+        self.point_light_positions = np.concatenate([self.point_light_positions, positions])
+        self.point_light_colors = np.concatenate([self.point_light_colors, colors * intensities[:, None]])
+        self.point_light_radii = np.concatenate([self.point_light_radii, radii])
+    
+    def clear_point_lights(self):
+        """Remove all lights added with add_point_lights"""
+        self.point_light_positions = np.zeros((0, 3), dtype=np.float32)
+        self.point_light_colors = np.zeros((0, 3), dtype=np.float32)
+        self.point_light_radii = np.zeros(0, dtype=np.float32)
+    
+    def _setup_post_processing(self):
+        """Setup post-processing pipeline"""
+        # Create framebuffer for post-processing
+        self.color_texture = self.ctx.texture((self.width, self.height), 4)
+        self.color_texture.filter = (moderngl.LINEAR, moderngl.LINEAR)
+        self.depth_texture = self.ctx.depth_texture((self.width, self.height))
+        self.framebuffer = self.ctx.framebuffer(color_attachments=[self.color_texture], depth_attachment=self.depth_texture)
+        
+        # Post-processing quad
+        quad_vertices = np.array([
+            -1.0, -1.0, 0.0, 0.0,
+             1.0, -1.0, 1.0, 0.0,
+             1.0,  1.0, 1.0, 1.0,
+            -1.0,  1.0, 0.0, 1.0
+        ], dtype=np.float32)
+        
+        quad_indices = np.array([0, 1, 2, 0, 2, 3], dtype=np.uint32)
+        
+        self.quad_vbo = self.ctx.buffer(quad_vertices.tobytes())
+        self.quad_ibo = self.ctx.buffer(quad_indices.tobytes())
+        self.quad_vao = self.ctx.vertex_array(self.programs['blit'], [(self.quad_vbo, '2f 2f', 'in_position', 'in_texcoord')], self.quad_ibo)
+    
+    def add_mesh(self, mesh_id: str, mesh: trimesh.Trimesh, material: Optional[Dict] = None,
+                 prototype_key: Optional[str] = None, vertex_data: Optional[np.ndarray] = None,
+                 lods: Optional[List[trimesh.Trimesh]] = None):
+        """Add mesh to renderer
+        
+        Meshes added with the same ``prototype_key`` share one VBO/IBO/VAO; each
+        render object then only carries its own transform and material.
+        ``vertex_data`` may supply an already interleaved float32 vertex block
+        (see ``interleave_vertex_data``), e.g. memory-mapped from a scene file.
+        ``lods`` are progressively simpler versions of ``mesh`` (e.g. from
+        ``lod.simplify_chain``); they are uploaded on first use.
+        """
+        if material is None:
+            material = {
+                'albedo': [0.7, 0.7, 0.7],
+                'metallic': 0.0,
+                'roughness': 0.5,
+                'ao': 1.0
+            }
+        
+        geometry = self.mesh_prototypes.get(prototype_key) if prototype_key else None
+        if geometry is None:
+            if vertex_data is None:
+                vertex_data = self.interleave_vertex_data(mesh)
+            geometry = self._upload_geometry(vertex_data, mesh.faces)
+            if prototype_key:
+                geometry['prototype_key'] = prototype_key
+                self.mesh_prototypes[prototype_key] = geometry
+        if lods and len(geometry['lods']) == 1:
+            self._attach_lod_chain(geometry, lods)
+        geometry['refcount'] += 1
+        
+        # Replacing an existing mesh (e.g. a generation placeholder) releases the old geometry
+        previous = self.render_objects.get(mesh_id)
+        if previous is not None:
+            if previous['batch'] is not None:
+                self._unbatch_object(mesh_id)
+            self._release_geometry(previous['geometry'])
+            slot = previous['slot']
+        else:
+            slot = self._allocate_object_slot()
+        
+        obj = {
+            'geometry': geometry,
+            'material': material,
+            'material_key': self._material_key(material),
+            'transform': np.eye(4),
+            'slot': slot,
+            'batch': None,
+            'lod_level': 0
+        }
+        self._use_geometry(obj, geometry)
+        self.render_objects[mesh_id] = obj
+        self._set_object_matrix(slot, np.eye(4))
+        self.bvh.insert(mesh_id, geometry['bounds'])
+    
+    def interleave_vertex_data(self, mesh: trimesh.Trimesh) -> np.ndarray:
+        """Build the interleaved position/normal/uv/color vertex block used by the PBR VAO"""
+        # Prepare vertex data
+        vertices = mesh.vertices.astype(np.float32)
+        normals = mesh.vertex_normals.astype(np.float32)
+        
+        # Generate texture coordinates if not present
+        if hasattr(mesh.visual, 'uv') and mesh.visual.uv is not None:
+            texcoords = mesh.visual.uv.astype(np.float32)
+        else:
+            # Generate spherical UV coordinates
+            texcoords = self._generate_spherical_uv(vertices)
+        
+        # Get vertex colors
+        if hasattr(mesh.visual, 'vertex_colors') and mesh.visual.vertex_colors is not None:
+            colors = mesh.visual.vertex_colors[:, :3].astype(np.float32) / 255.0
+        else:
+            colors = np.ones((len(vertices), 3), dtype=np.float32) * 0.7
+        
+        # Interleave vertex data
+        return np.column_stack([vertices, normals, texcoords, colors]).astype(np.float32)
+    
+    def _upload_geometry(self, vertex_data: np.ndarray, faces: np.ndarray) -> Dict:
+        """Upload interleaved float vertex data and faces, quantizing them if ``compact_vertices`` is set"""
+        if self.compact_vertices:
+            packed, offset, scale = quantize_vertices(vertex_data)
+            indices = index_array(faces, len(vertex_data))
+            program, vertex_format, dequantize = 'pbr_compact', COMPACT_VERTEX_FORMAT, (offset, scale)
+        else:
+            packed = np.ascontiguousarray(vertex_data, dtype=np.float32)
+            indices = np.ascontiguousarray(faces, dtype=np.uint32)
+            program, vertex_format, dequantize = 'pbr', FLOAT_VERTEX_FORMAT, None
+        
+        # Pooled buffers may be larger than the data, so the VAO's index count is set explicitly
+        vbo = self.buffer_pool.acquire(packed)
+        ibo = self.buffer_pool.acquire(indices)
+        
+        vao = self.ctx.vertex_array(
+            self.programs[program],
+            [(vbo, vertex_format, 'in_position', 'in_normal', 'in_texcoord', 'in_color')],
+            ibo,
+            index_element_size=indices.itemsize,
+            skip_errors=True  # the compiler drops attributes the shaders don't use (e.g. texcoords)
+        )
+        vao.vertices = len(faces) * 3
+        
+        positions = np.asarray(vertex_data).reshape(len(vertex_data), -1)[:, :3]
+        
+        return {
+            'vao': vao,
+            'vbo': vbo,
+            'ibo': ibo,
+            'bounds': np.array([positions.min(axis=0), positions.max(axis=0)], dtype=np.float64),
+            'face_count': len(faces),
+            'vertex_count': len(vertex_data),
+            'program': program,
+            'dequantize': dequantize,
+            'prototype_key': None,
+            'refcount': 0,
+            # LOD chain: level 0 is this geometry; coarser levels are uploaded lazily
+            'lods': [{'geometry': None, 'mesh': None, 'face_count': len(faces)}],
+            'lod_errors': np.zeros(self.MAX_LOD_LEVELS)
+        }
+    
+    def add_lods(self, prototype_key: str, lods: List[trimesh.Trimesh]):
+        """Attach a LOD chain to shared geometry that was added without one
+        
+        For chains simplified in the background after the prototype was first
+        drawn; ignored if the geometry has since been released or already has
+        a chain.
+        """
+        geometry = self.mesh_prototypes.get(prototype_key)
+        if geometry is not None and lods and len(geometry['lods']) == 1:
+            self._attach_lod_chain(geometry, lods)
+    
+    def _attach_lod_chain(self, geometry: Dict, lods: List[trimesh.Trimesh]):
+        """Register simplified meshes as coarser LOD levels of ``geometry``
+        
+        Each level's geometric error is estimated as half its mean edge length;
+        levels that do not reduce the face count are dropped.
+        """
+        errors = [0.0]
+        face_count = geometry['face_count']
+        for lod in lods:
+            if len(geometry['lods']) == self.MAX_LOD_LEVELS:
+                break
+            if len(lod.faces) >= face_count or len(lod.faces) == 0:
+                continue
+            
+            face_count = len(lod.faces)
+            errors.append(max(0.5 * float(lod.edges_unique_length.mean()), errors[-1]))
+            geometry['lods'].append({'geometry': None, 'mesh': lod, 'face_count': face_count})
+        
+        # Levels past the end of the chain are never acceptable
+        lod_errors = np.full(self.MAX_LOD_LEVELS, np.inf)
+        lod_errors[:len(errors)] = errors
+        geometry['lod_errors'] = lod_errors
+    
+    def _lod_geometry(self, geometry: Dict, level: int) -> Dict:
+        """GPU geometry for one LOD level, uploading it on first use"""
+        if level == 0:
+            return geometry
+        
+        lod = geometry['lods'][level]
+        if lod['geometry'] is None:
+            lod['geometry'] = self._upload_geometry(self.interleave_vertex_data(lod['mesh']), lod['mesh'].faces)
+            lod['geometry']['refcount'] = 1
+            lod['last_used'] = self.frame_index
+            self.resident_lods[(id(geometry), level)] = (geometry, level)
+            self.lod_geometry_bytes += lod['geometry']['vbo'].size + lod['geometry']['ibo'].size
+        return lod['geometry']
+    
+    def _use_geometry(self, obj: Dict, geometry: Dict):
+        """Point a render object or static batch at the GPU geometry it draws"""
+        obj['vao'] = geometry['vao']
+        obj['program'] = geometry['program']
+        obj['dequantize'] = geometry['dequantize']
+        obj['face_count'] = geometry['face_count']
+        obj['sort_key'] = (geometry['program'], obj['material_key'], id(geometry))
+    
+    def _evict_lod(self, geometry: Dict, level: int):
+        """Release one uploaded LOD level; it is re-uploaded from its mesh on next use"""
+        lod = geometry['lods'][level]
+        self.resident_lods.pop((id(geometry), level), None)
+        self.lod_geometry_bytes -= lod['geometry']['vbo'].size + lod['geometry']['ibo'].size
+        self._release_geometry(lod['geometry'])
+        lod['geometry'] = None
+    
+    def _release_geometry(self, geometry: Dict):
+        """Drop one reference to shared geometry, freeing GPU buffers on the last one"""
+        geometry['refcount'] -= 1
+        if geometry['refcount'] > 0:
+            return
+        
+        geometry['vao'].release()
+        self.buffer_pool.release(geometry['vbo'])
+        self.buffer_pool.release(geometry['ibo'])
+        
+        for level, lod in enumerate(geometry['lods'][1:], 1):
+            if lod['geometry'] is not None:
+                self._evict_lod(geometry, level)
+        
+        if geometry['prototype_key']:
+            self.mesh_prototypes.pop(geometry['prototype_key'], None)
+    
+    def add_instanced_mesh(self, mesh_id: str, mesh: trimesh.Trimesh, material: Optional[Dict] = None,
+                           capacity: int = 1024):
+        """Add a mesh drawn with hardware instancing (one draw call for all instances)"""
+        if material is None:
+            material = {
+                'albedo': [0.7, 0.7, 0.7],
+                'metallic': 0.0,
+                'roughness': 0.5,
+                'ao': 1.0
+            }
+        
+        if mesh_id in self.instanced_meshes:
+            self.remove_instanced_mesh(mesh_id)
+        
+        vertex_data = self.interleave_vertex_data(mesh)
+        capacity = max(int(capacity), 1)
+        
+        instanced = {
+            'vbo': self.buffer_pool.acquire(vertex_data),
+            'ibo': self.buffer_pool.acquire(np.ascontiguousarray(mesh.faces, dtype=np.uint32)),
+            'instance_vbo': None,
+            'vao': None,
+            'material': material,
+            'face_count': len(mesh.faces),
+            'bounds': np.array(mesh.bounds, dtype=np.float32),
+            # Packed instance data; slots [0, count) are live
+            'transforms': np.zeros((capacity, 4, 4), dtype=np.float32),
+            'colors': np.ones((capacity, 4), dtype=np.float32),
+            'slot_ids': np.zeros(capacity, dtype=np.int64),
+            'id_to_slot': {},
+            'next_id': 0,
+            'count': 0,
+            'capacity': capacity,
+            'dirty': False
+        }
+        self._create_instance_buffer(instanced)
+        self.instanced_meshes[mesh_id] = instanced
+    
+    def _create_instance_buffer(self, instanced: Dict):
+        """(Re)create the per-instance buffer and the VAO binding it"""
+        if instanced['vao'] is not None:
+            instanced['vao'].release()
+            self.buffer_pool.release(instanced['instance_vbo'])
+        
+        # 16 floats of model matrix + 4 floats of color per instance
+        instanced['instance_vbo'] = self.buffer_pool.acquire(reserve=instanced['capacity'] * 20 * 4)
+        instanced['vao'] = self.ctx.vertex_array(
+            self.programs['pbr_instanced'],
+            [
+                (instanced['vbo'], FLOAT_VERTEX_FORMAT, 'in_position', 'in_normal', 'in_texcoord', 'in_color'),
+                (instanced['instance_vbo'], '16f 4f/i', 'in_model', 'in_instance_color')
+            ],
+            instanced['ibo'],
+            skip_errors=True
+        )
+        instanced['vao'].vertices = instanced['face_count'] * 3
+        instanced['dirty'] = True
+    
+    def _grow_instances(self, instanced: Dict, required: int):
+        """Grow instance storage geometrically so bulk adds stay amortized O(1)"""
+        if required <= instanced['capacity']:
+            return
+        
+        capacity = instanced['capacity']
+        while capacity < required:
+            capacity *= 2
+        
+        count = instanced['count']
+        for name, shape in (('transforms', (capacity, 4, 4)), ('colors', (capacity, 4)), ('slot_ids', (capacity,))):
+            grown = np.ones(shape, dtype=instanced[name].dtype) if name == 'colors' else np.zeros(shape, dtype=instanced[name].dtype)
+            grown[:count] = instanced[name][:count]
+            instanced[name] = grown
+        
+        instanced['capacity'] = capacity
+        self._create_instance_buffer(instanced)
+    
+    def add_instances(self, mesh_id: str, transforms: np.ndarray, colors: Optional[np.ndarray] = None) -> np.ndarray:
+        """Add instances in bulk; returns their instance IDs
+        
+        ``transforms`` is (N, 4, 4) or (N, 3) translations; ``colors`` is an
+        optional (N, 3) or (N, 4) tint in 0-1 (or a single color for all).
+        """
+        instanced = self.instanced_meshes[mesh_id]
+        transforms = self._as_instance_transforms(transforms)
+        n = len(transforms)
+        
+        start = instanced['count']
+        self._grow_instances(instanced, start + n)
+        
+        ids = np.arange(instanced['next_id'], instanced['next_id'] + n, dtype=np.int64)
+        instanced['next_id'] += n
+        
+        instanced['transforms'][start:start + n] = transforms
+        instanced['colors'][start:start + n] = self._as_instance_colors(colors, n)
+        instanced['slot_ids'][start:start + n] = ids
+        instanced['id_to_slot'].update(zip(ids.tolist(), range(start, start + n)))
+        instanced['count'] = start + n
+        instanced['dirty'] = True
+        
+        return ids
+    
+    def update_instances(self, mesh_id: str, instance_ids, transforms: Optional[np.ndarray] = None,
+                         colors: Optional[np.ndarray] = None):
+        """Update transforms and/or colors of existing instances in bulk"""
+        instanced = self.instanced_meshes[mesh_id]
+        slots = self._instance_slots(instanced, instance_ids)
+        
+        if transforms is not None:
+            instanced['transforms'][slots] = self._as_instance_transforms(transforms)
+        if colors is not None:
+            instanced['colors'][slots] = self._as_instance_colors(colors, len(slots))
+        instanced['dirty'] = True
+    
+    def remove_instances(self, mesh_id: str, instance_ids):
+        """Remove instances in bulk, keeping the live range packed"""
+        instanced = self.instanced_meshes[mesh_id]
+        id_to_slot = instanced['id_to_slot']
+        
+        # Fill holes from the tail; highest slots first so moved entries stay valid
+        for slot in sorted(self._instance_slots(instanced, instance_ids).tolist(), reverse=True):
+            last = instanced['count'] - 1
+            del id_to_slot[int(instanced['slot_ids'][slot])]
+            
+            if slot != last:
+                moved_id = int(instanced['slot_ids'][last])
+                instanced['transforms'][slot] = instanced['transforms'][last]
+                instanced['colors'][slot] = instanced['colors'][last]
+                instanced['slot_ids'][slot] = moved_id
+                id_to_slot[moved_id] = slot
+            
+            instanced['count'] = last
+        
+        instanced['dirty'] = True
+    
+    def remove_instanced_mesh(self, mesh_id: str):
+        """Release an instanced mesh and all of its instances"""
+        instanced = self.instanced_meshes.pop(mesh_id, None)
+        if instanced is None:
+            return
+        
+        instanced['vao'].release()
+        for name in ('instance_vbo', 'vbo', 'ibo'):
+            self.buffer_pool.release(instanced[name])
+    
+    def _instance_slots(self, instanced: Dict, instance_ids) -> np.ndarray:
+        id_to_slot = instanced['id_to_slot']
+        return np.array([id_to_slot[int(i)] for i in np.atleast_1d(instance_ids)], dtype=np.int64)
+    
+    def _as_instance_transforms(self, transforms: np.ndarray) -> np.ndarray:
+        transforms = np.asarray(transforms, dtype=np.float32)
+        if transforms.ndim == 2 and transforms.shape[1] == 3:
+            # Plain translations
+            result = np.tile(np.eye(4, dtype=np.float32), (len(transforms), 1, 1))
+            result[:, :3, 3] = transforms
+            return result
+        return transforms.reshape(-1, 4, 4)
+    
+    def _as_instance_colors(self, colors: Optional[np.ndarray], n: int) -> np.ndarray:
+        result = np.ones((n, 4), dtype=np.float32)
+        if colors is not None:
+            colors = np.asarray(colors, dtype=np.float32)
+            if colors.max(initial=0.0) > 1.0:
+                colors = colors / 255.0
+            result[:, :colors.shape[-1]] = colors
+        return result
+    
+    def _generate_spherical_uv(self, vertices: np.ndarray) -> np.ndarray:
+        """Generate spherical UV coordinates"""
+        normalized = vertices / np.linalg.norm(vertices, axis=1, keepdims=True)
+        u = 0.5 + np.arctan2(normalized[:, 2], normalized[:, 0]) / (2 * np.pi)
+        v = 0.5 - np.arcsin(normalized[:, 1]) / np.pi
+        return np.column_stack([u, v])
+    
+    def set_camera(self, position: np.ndarray, target: np.ndarray, up: np.ndarray = None):
+        """Set camera parameters"""
+        self.camera_pos = position
+        self.camera_target = target
+        if up is not None:
+            self.camera_up = up
+    
+    def remove_mesh(self, mesh_id: str):
+        """Remove a render object, releasing its geometry reference"""
+        obj = self.render_objects.get(mesh_id)
+        if obj is None:
+            return
+        
+        if obj['batch'] is not None:
+            self._unbatch_object(mesh_id)
+        
+        del self.render_objects[mesh_id]
+        self._release_geometry(obj['geometry'])
+        self._free_object_slot(obj['slot'])
+        self.bvh.remove(mesh_id)
+        self.dirty_bounds.discard(mesh_id)
+    
+    def update_object_transform(self, mesh_id: str, transform: np.ndarray):
+        """Update object transformation matrix"""
+        obj = self.render_objects.get(mesh_id)
+        if obj is not None:
+            if obj['batch'] is not None:
+                if np.array_equal(obj['transform'], transform):
+                    return
+                # A batched object that moves is drawn on its own again
+                self._unbatch_object(mesh_id)
+            
+            obj['transform'] = transform
+            self._set_object_matrix(obj['slot'], transform)
+            self.dirty_bounds.add(mesh_id)
+    
+    def _allocate_object_slot(self) -> int:
+        if self.free_object_slots:
+            return self.free_object_slots.pop()
+        
+        slot = self.object_slot_count
+        self.object_slot_count += 1
+        if slot >= len(self.object_matrices):
+            self._grow_object_matrices(len(self.object_matrices) * 2)
+        return slot
+    
+    def _free_object_slot(self, slot: int):
+        self.free_object_slots.append(slot)
+    
+    def _grow_object_matrices(self, capacity: int):
+        """Resize the matrix array and texture; capacity is a whole number of texture rows"""
+        rows = -(-capacity // self.OBJECTS_PER_ROW)
+        grown = np.zeros((rows * self.OBJECTS_PER_ROW, 8, 4), dtype=np.float32)
+        grown[:len(self.object_matrices)] = self.object_matrices
+        self.object_matrices = grown
+        
+        if self.object_matrix_texture is not None:
+            self.object_matrix_texture.release()
+        self.object_matrix_texture = self.ctx.texture((self.OBJECTS_PER_ROW * 8, rows), 4, dtype='f4')
+        self.object_matrix_texture.filter = (moderngl.NEAREST, moderngl.NEAREST)
+        
+        # The new texture is empty: everything allocated so far must be uploaded again
+        self.dirty_matrix_slots.update(range(self.object_slot_count))
+    
+    def _set_object_matrix(self, slot: int, transform: np.ndarray):
+        # Stored column-major, matching GLSL's mat4 layout; normal matrices are derived at upload
+        self.object_matrices[slot, :4] = np.asarray(transform, dtype=np.float32).T
+        self.dirty_matrix_slots.add(slot)
+    
+    def _upload_object_matrices(self):
+        """Recompute normal matrices of changed objects and upload them in a single texture write"""
+        if not self.dirty_matrix_slots:
+            return
+        
+        slots = np.fromiter(self.dirty_matrix_slots, dtype=np.int64, count=len(self.dirty_matrix_slots))
+        self.dirty_matrix_slots.clear()
+        
+        linear = np.swapaxes(self.object_matrices[slots, :3, :3], 1, 2)
+        self.object_matrices[slots, 4:7, :3] = np.swapaxes(self._normal_matrices(linear), 1, 2)
+        
+        # One write covering every texture row that changed
+        first_row = int(slots.min()) // self.OBJECTS_PER_ROW
+        last_row = int(slots.max()) // self.OBJECTS_PER_ROW + 1
+        start, end = first_row * self.OBJECTS_PER_ROW, last_row * self.OBJECTS_PER_ROW
+        self.object_matrix_texture.write(
+            self.object_matrices[start:end],
+            viewport=(0, first_row, self.OBJECTS_PER_ROW * 8, last_row - first_row)
+        )
+    
+    @staticmethod
+    def _normal_matrices(linear: np.ndarray) -> np.ndarray:
+        """Normal matrices for (N, 3, 3) linear transforms
+        
+        Uses the cofactor matrix: same direction as the inverse transpose, and
+        defined even for degenerate scales. Results are not unit-scaled.
+        """
+        r0, r1, r2 = linear[:, 0], linear[:, 1], linear[:, 2]
+        cofactor = np.stack([np.cross(r1, r2), np.cross(r2, r0), np.cross(r0, r1)], axis=1)
+        determinant = np.einsum('ni,ni->n', r0, cofactor[:, 0])
+        cofactor *= np.where(determinant < 0, -1.0, 1.0).astype(cofactor.dtype)[:, None, None]
+        return cofactor
+    
+    def _material_key(self, material: Dict) -> int:
+        """Intern a material's values so equal materials sort together"""
+        key = (tuple(np.asarray(material['albedo'], dtype=np.float64).ravel().tolist()),
+               float(material['metallic']), float(material['roughness']), float(material['ao']))
+        return self.material_ids.setdefault(key, len(self.material_ids))
+    
+    def build_static_batches(self, mesh_ids: List[str], cell_size: float = 100.0,
+                             max_vertices: int = 1 << 20) -> int:
+        """Merge static objects sharing a material into combined vertex/index buffers
+        
+        Objects are grouped by material and by a coarse spatial grid cell, so
+        batches can still be frustum culled. Vertices are pre-transformed to
+        world space. Moving a batched object later splits it back out and the
+        rest of its batch is rebuilt. Returns the number of batches created.
+        """
+        candidates = [mesh_id for mesh_id in mesh_ids
+                      if mesh_id in self.render_objects and self.render_objects[mesh_id]['batch'] is None]
+        if len(candidates) < 2:
+            return 0
+        
+        local_bounds = np.stack([self.render_objects[mesh_id]['geometry']['bounds'] for mesh_id in candidates])
+        transforms = np.stack([self.render_objects[mesh_id]['transform'] for mesh_id in candidates])
+        world_bounds = transform_bounds(local_bounds, transforms)
+        cells = np.floor((world_bounds[:, 0] + world_bounds[:, 1]) * 0.5 / cell_size).astype(np.int64)
+        
+        groups = {}
+        for mesh_id, cell in zip(candidates, map(tuple, cells)):
+            obj = self.render_objects[mesh_id]
+            groups.setdefault((obj['program'], obj['material_key'], cell), []).append(mesh_id)
+        
+        geometry_cache = {}
+        created = 0
+        for members in groups.values():
+            # Split oversized groups so every batch stays within max_vertices
+            chunk, chunk_vertices = [], 0
+            for mesh_id in members:
+                vertex_count = self._geometry_arrays(self.render_objects[mesh_id]['geometry'], geometry_cache)[0].shape[0]
+                if chunk and chunk_vertices + vertex_count > max_vertices:
+                    created += self._create_static_batch(chunk, geometry_cache)
+                    chunk, chunk_vertices = [], 0
+                chunk.append(mesh_id)
+                chunk_vertices += vertex_count
+            created += self._create_static_batch(chunk, geometry_cache)
+        
+        return created
+    
+    def _geometry_arrays(self, geometry: Dict, cache: Dict) -> Tuple[np.ndarray, np.ndarray]:
+        """Read a geometry's interleaved vertices and faces back from the GPU (cached per build)"""
+        arrays = cache.get(id(geometry))
+        if arrays is None:
+            if geometry['dequantize'] is not None:
+                packed = np.frombuffer(geometry['vbo'].read(size=geometry['vertex_count'] * COMPACT_VERTEX.itemsize),
+                                       dtype=COMPACT_VERTEX)
+                vertices = dequantize_vertices(packed, *geometry['dequantize'])
+            else:
+                vertices = np.frombuffer(geometry['vbo'].read(size=geometry['vertex_count'] * 44),
+                                         dtype=np.float32).reshape(-1, 11)
+            index_dtype = np.uint16 if geometry['vao'].index_element_size == 2 else np.uint32
+            faces = np.frombuffer(geometry['ibo'].read(size=geometry['face_count'] * 3 * np.dtype(index_dtype).itemsize),
+                                  dtype=index_dtype).reshape(-1, 3).astype(np.uint32)
+            arrays = cache[id(geometry)] = (vertices, faces)
+        return arrays
+    
+    def _create_static_batch(self, mesh_ids: List[str], geometry_cache: Dict) -> int:
+        if len(mesh_ids) < 2:
+            return 0
+        
+        vertex_parts, face_parts = [], []
+        vertex_offset = 0
+        for mesh_id in mesh_ids:
+            obj = self.render_objects[mesh_id]
+            vertices, faces = self._geometry_arrays(obj['geometry'], geometry_cache)
+            transform = np.asarray(obj['transform'], dtype=np.float32)
+            
+            # Bake the object transform into positions and normals
+            world = vertices.copy()
+            world[:, :3] = vertices[:, :3] @ transform[:3, :3].T + transform[:3, 3]
+            normals = vertices[:, 3:6] @ self._normal_matrices(transform[None, :3, :3])[0].T
+            world[:, 3:6] = normals / np.maximum(np.linalg.norm(normals, axis=1, keepdims=True), 1e-12)
+            
+            vertex_parts.append(world)
+            face_parts.append(faces + vertex_offset)
+            vertex_offset += len(vertices)
+        
+        geometry = self._upload_geometry(np.concatenate(vertex_parts), np.concatenate(face_parts))
+        geometry['refcount'] = 1
+        
+        first = self.render_objects[mesh_ids[0]]
+        slot = self._allocate_object_slot()
+        self._set_object_matrix(slot, np.eye(4))
+        
+        batch_key = ('static_batch', self.next_batch_id)
+        self.next_batch_id += 1
+        batch = {
+            'geometry': geometry,
+            'material': first['material'],
+            'material_key': first['material_key'],
+            'slot': slot,
+            'members': list(mesh_ids)
+        }
+        self._use_geometry(batch, geometry)
+        self.static_batches[batch_key] = batch
+        
+        # The batch is culled as a whole in place of its members
+        self.bvh.insert(batch_key, geometry['bounds'])
+        for mesh_id in mesh_ids:
+            self.render_objects[mesh_id]['batch'] = batch_key
+            self.bvh.remove(mesh_id)
+            self.dirty_bounds.discard(mesh_id)
+        
+        return 1
+    
+    def _unbatch_object(self, mesh_id: str):
+        """Return a batched object to individual drawing; its batch is rebuilt before the next frame"""
+        obj = self.render_objects[mesh_id]
+        batch_key = obj['batch']
+        obj['batch'] = None
+        self.static_batches[batch_key]['members'].remove(mesh_id)
+        self.stale_batches.add(batch_key)
+        
+        self.bvh.insert(mesh_id, obj['geometry']['bounds'])
+        self.dirty_bounds.add(mesh_id)
+    
+    def _rebuild_stale_batches(self):
+        for batch_key in self.stale_batches:
+            batch = self.static_batches.pop(batch_key)
+            self._release_static_batch(batch_key, batch)
+            
+            for mesh_id in batch['members']:
+                self.render_objects[mesh_id]['batch'] = None
+                self.bvh.insert(mesh_id, self.render_objects[mesh_id]['geometry']['bounds'])
+                self.dirty_bounds.add(mesh_id)
+            
+            self._create_static_batch(batch['members'], {})
+        self.stale_batches.clear()
+    
+    def _release_static_batch(self, batch_key, batch: Dict):
+        self._release_geometry(batch['geometry'])
+        self._free_object_slot(batch['slot'])
+        self.bvh.remove(batch_key)
+    
+    def _point_light_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Positions, premultiplied colors and radii of every clustered light (lights[1:] first)"""
+        extra = self.lights[1:]
+        if not extra:
+            return self.point_light_positions, self.point_light_colors, self.point_light_radii
+        
+        positions = np.array([light['position'] for light in extra], dtype=np.float32)
+        intensities = np.array([light['intensity'] for light in extra], dtype=np.float32)
+        colors = np.array([light['color'] for light in extra], dtype=np.float32) * intensities[:, None]
+        radii = np.array([light.get('radius', np.sqrt(light['intensity'] / self.light_cutoff)) for light in extra],
+                         dtype=np.float32)
+        return (np.concatenate([positions, self.point_light_positions]),
+                np.concatenate([colors, self.point_light_colors]),
+                np.concatenate([radii, self.point_light_radii]))
+    
+    def _grow_light_textures(self, index_capacity: int, light_capacity: int):
+        """(Re)allocate the light index and light data textures if they are too small"""
+        index_rows = max(-(-index_capacity // self.LIGHT_INDEX_WIDTH), 1)
+        if self.light_index_texture is None or self.light_index_texture.height < index_rows:
+            if self.light_index_texture is not None:
+                self.light_index_texture.release()
+            self.light_index_texture = self.ctx.texture((self.LIGHT_INDEX_WIDTH, index_rows), 1, dtype='u4')
+            self.light_index_texture.filter = (moderngl.NEAREST, moderngl.NEAREST)
+        
+        light_rows = max(-(-light_capacity // self.LIGHTS_PER_ROW), 1)
+        if self.light_data_texture is None or self.light_data_texture.height < light_rows:
+            if self.light_data_texture is not None:
+                self.light_data_texture.release()
+            self.light_data_texture = self.ctx.texture((self.LIGHTS_PER_ROW * 2, light_rows), 4, dtype='f4')
+            self.light_data_texture.filter = (moderngl.NEAREST, moderngl.NEAREST)
+    
+    def _update_light_clusters(self, view_matrix: np.ndarray, projection_matrix: np.ndarray):
+        """Bin point lights into the cluster grid and upload the grid, index list and light data"""
+        positions, colors, radii = self._point_light_arrays()
+        view_positions = positions @ view_matrix[:3, :3].T + view_matrix[:3, 3]
+        grid, indices = self.clusters.assign(view_positions, radii, projection_matrix, self.near_plane, self.far_plane)
+        
+        self.render_stats['lights_visible'] = len(np.unique(indices))
+        self.render_stats['light_assignments'] = len(indices)
+        
+        self.cluster_grid_texture.write(grid)
+        if len(indices):
+            self._grow_light_textures(len(indices), len(positions))
+            
+            # Whole rows only: pad the tails of the index list and light data
+            index_rows = -(-len(indices) // self.LIGHT_INDEX_WIDTH)
+            padded_indices = np.zeros(index_rows * self.LIGHT_INDEX_WIDTH, dtype=np.uint32)
+            padded_indices[:len(indices)] = indices
+            self.light_index_texture.write(padded_indices, viewport=(0, 0, self.LIGHT_INDEX_WIDTH, index_rows))
+            
+            light_rows = -(-len(positions) // self.LIGHTS_PER_ROW)
+            light_data = np.zeros((light_rows * self.LIGHTS_PER_ROW, 2, 4), dtype=np.float32)
+            light_data[:len(positions), 0, :3] = positions
+            light_data[:len(positions), 0, 3] = radii
+            light_data[:len(positions), 1, :3] = colors
+            self.light_data_texture.write(light_data, viewport=(0, 0, self.LIGHTS_PER_ROW * 2, light_rows))
+        
+        self.cluster_grid_texture.use(self.CLUSTER_GRID_UNIT)
+        self.light_index_texture.use(self.LIGHT_INDEX_UNIT)
+        self.light_data_texture.use(self.LIGHT_DATA_UNIT)
+    
+    def _write_frame_uniforms(self, view_projection: np.ndarray):
+        """Upload camera, main light and cluster grid data for the frame"""
+        frame_data = np.zeros(40, dtype=np.float32)
+        frame_data[:16] = view_projection.T.ravel()
+        frame_data[16:19] = self.camera_pos
+        
+        # Main light; the remaining lights are shaded through the cluster grid
+        if self.lights:
+            light = self.lights[0]
+            frame_data[20:23] = light['position']
+            frame_data[24:27] = light['color']
+            frame_data[27] = light['intensity']
+        
+        frame_data[28:31] = self.near_plane, self.far_plane, self.clusters.slice_scale(self.near_plane, self.far_plane)
+        frame_data[32:35] = self.clusters.tiles_x, self.clusters.tiles_y, self.clusters.slices
+        frame_data[36:38] = self.render_width, self.render_height
+        
+        self.frame_ubo.write(frame_data)
+        self.frame_ubo.bind_to_uniform_block(self.FRAME_UBO_BINDING)
+    
+    def gpu_memory_usage(self) -> Dict[str, int]:
+        """GPU memory held by this renderer, in bytes
+        
+        ``geometry`` counts pooled buffers in use (``lod_geometry`` is the part
+        holding uploaded LOD levels), ``pooled_idle`` released buffers kept for
+        reuse, and ``textures`` the matrix, light and framebuffer textures.
+        """
+        textures = [self.object_matrix_texture, self.cluster_grid_texture, self.light_index_texture,
+                    self.light_data_texture, self.color_texture, self.depth_texture]
+        texture_bytes = sum(texture.width * texture.height * texture.components * int(texture.dtype[1:])
+                            for texture in textures)
+        other_bytes = self.frame_ubo.size + self.quad_vbo.size + self.quad_ibo.size
+        
+        usage = {
+            'geometry': self.buffer_pool.in_use_bytes,
+            'lod_geometry': self.lod_geometry_bytes,
+            'pooled_idle': self.buffer_pool.free_bytes,
+            'textures': texture_bytes,
+            'other_buffers': other_bytes
+        }
+        usage['total'] = usage['geometry'] + usage['pooled_idle'] + texture_bytes + other_bytes
+        return usage
+    
+    def _enforce_memory_budget(self) -> int:
+        """Evict LOD levels not drawn this frame (least recently used first), then idle pooled
+        buffers, until usage fits ``gpu_memory_budget``; returns the resulting total
+        
+        Full-detail geometry is never evicted, so a scene whose base meshes alone
+        exceed the budget stays over it.
+        """
+        usage = self.gpu_memory_usage()
+        if self.gpu_memory_budget is None or usage['total'] <= self.gpu_memory_budget:
+            return usage['total']
+        
+        # Bytes that stay allocated whatever the pool keeps idle
+        required = usage['total'] - usage['pooled_idle']
+        candidates = sorted(self.resident_lods.values(), key=lambda entry: entry[0]['lods'][entry[1]]['last_used'])
+        evicted = set()
+        for geometry, level in candidates:
+            if required <= self.gpu_memory_budget:
+                break
+            if geometry['lods'][level]['last_used'] >= self.frame_index:
+                break
+            size = geometry['lods'][level]['geometry']['vbo'].size + geometry['lods'][level]['geometry']['ibo'].size
+            self._evict_lod(geometry, level)
+            evicted.add((id(geometry), level))
+            required -= size
+        
+        # Objects left on an evicted level go back to full detail until LOD selection sees them again
+        if evicted:
+            for obj in self.render_objects.values():
+                if obj['lod_level'] and (id(obj['geometry']), obj['lod_level']) in evicted:
+                    obj['lod_level'] = 0
+                    self._use_geometry(obj, obj['geometry'])
+        
+        self.buffer_pool.trim(max(self.gpu_memory_budget - required, 0))
+        return required + self.buffer_pool.free_bytes
+    
+    def render(self):
+        """Render the scene"""
+        self.frame_index += 1
+        self._update_resolution_scale()
+        
+        # Time the frame on the GPU with a ring of queries; each is read back when reused
+        if self.timer_queries is None:
+            self._render_frame()
+        else:
+            ring = len(self.timer_queries)
+            query = self.timer_queries[self.frame_index % ring]
+            # The first pass over the ring reads back uninitialized results on some drivers, so skip it
+            if self.frame_index > 2 * ring:
+                elapsed = query.elapsed / 1e6
+                # A query can't outlast the frames between its start and its readback; longer readings are bogus
+                if 0.0 < elapsed <= self.frame_time_ms * ring:
+                    if not self.gpu_time_ms:
+                        # Seed from CPU frame time rather than from a single GPU sample
+                        self.gpu_time_ms = self.frame_time_ms
+                    self.gpu_time_ms += (elapsed - self.gpu_time_ms) * 0.1
+            with query:
+                self._render_frame()
+        
+        self.render_stats['gpu_time_ms'] = self.gpu_time_ms
+        self.render_stats['resolution_scale'] = self.resolution_scale
+    
+    def _update_resolution_scale(self):
+        """Rescale the render viewport toward ``target_frame_time``
+        
+        Pixel cost is taken as proportional to area, so the scale moves by the
+        square root of the time ratio, aiming at 90% of the target. It drops as
+        soon as frames run over the target but only rises again below 80%, and
+        changes at most every ``resolution_adjust_interval`` frames.
+        """
+        now = time.perf_counter()
+        if self.last_frame_start is not None:
+            elapsed = (now - self.last_frame_start) * 1000.0
+            self.frame_time_ms += (elapsed - self.frame_time_ms) * (0.1 if self.frame_time_ms else 1.0)
+        self.last_frame_start = now
+        
+        scale = self.resolution_scale
+        if self.target_frame_time is None:
+            scale = 1.0
+        elif self.frame_index - self.last_resolution_change >= self.resolution_adjust_interval:
+            cost = self.frame_time_ms if self.timer_queries is None else self.gpu_time_ms
+            if cost > self.target_frame_time or 0.0 < cost < self.target_frame_time * 0.8:
+                desired = scale * math.sqrt(self.target_frame_time * 0.9 / cost)
+                # Quantized steps keep the viewport from jittering between nearby sizes
+                scale = float(np.clip(round(desired * 20.0) / 20.0, self.min_resolution_scale, self.max_resolution_scale))
+        
+        if scale != self.resolution_scale:
+            self.resolution_scale = scale
+            self.last_resolution_change = self.frame_index
+        self.render_width = max(int(round(self.width * scale)), 1)
+        self.render_height = max(int(round(self.height * scale)), 1)
+    
+    def _render_frame(self):
+        # Render to the (possibly scaled-down) viewport of the offscreen framebuffer
+        self.framebuffer.viewport = (0, 0, self.render_width, self.render_height)
+        self.framebuffer.use()
+        self.ctx.clear(0.1, 0.1, 0.1, 1.0)
+        self.ctx.clear(depth=1.0)
+        
+        # Calculate matrices
+        view_matrix = self._look_at(self.camera_pos, self.camera_target, self.camera_up)
+        projection_matrix = self._perspective(self.fov, self.width / self.height, self.near_plane, self.far_plane)
+        view_projection = projection_matrix @ view_matrix
+        
+        # Per-frame uploads: camera/light block, light clusters and any changed object matrices
+        self._write_frame_uniforms(view_projection)
+        self._update_light_clusters(view_matrix, projection_matrix)
+        self._upload_object_matrices()
+        self.object_matrix_texture.use(self.OBJECT_MATRIX_UNIT)
+        
+        # Render skybox first
+        self._render_skybox(view_matrix, projection_matrix)
+        
+        # Render objects and static batches that survive frustum culling, sorted to minimize state changes
+        visible = self._visible_objects(view_projection)
+        self._select_lods(visible)
+        render_queue = self._build_render_queue(visible)
+        self._draw_render_queue(render_queue)
+        
+        drawn = sum(len(entry['members']) if 'members' in entry else 1 for entry in render_queue)
+        self.render_stats['objects_drawn'] = drawn
+        self.render_stats['objects_culled'] = len(self.render_objects) - drawn
+        self.render_stats['draw_calls'] = len(render_queue)
+        self.render_stats['triangles'] = sum(entry['face_count'] for entry in render_queue)
+        
+        # Instanced meshes: one draw call per mesh regardless of instance count
+        for instanced in self.instanced_meshes.values():
+            self._render_instanced(instanced)
+            self.render_stats['draw_calls'] += instanced['count'] > 0
+            self.render_stats['triangles'] += instanced['face_count'] * instanced['count']
+        
+        self.render_stats['gpu_memory_bytes'] = self._enforce_memory_budget()
+        
+        # Post-processing pass (headless renderers read the offscreen framebuffer directly)
+        if self.standalone:
+            return
+        
+        self.ctx.screen.use()
+        self.ctx.clear(0.0, 0.0, 0.0, 1.0)
+        
+        # Simple blit for now (can be extended with effects); upscales the rendered viewport
+        self.color_texture.use(0)
+        self.programs['blit']['uv_scale'].value = (self.render_width / self.width, self.render_height / self.height)
+        self.quad_vao.render()
+    
+    def _visible_objects(self, view_projection: np.ndarray) -> List:
+        """Keys of render objects and static batches whose world bounds intersect the view frustum"""
+        if self.stale_batches:
+            self._rebuild_stale_batches()
+        
+        # Refit moved objects in one batch (world bounds also drive LOD selection)
+        if self.dirty_bounds:
+            moved = [obj_id for obj_id in self.dirty_bounds if obj_id in self.render_objects]
+            if moved:
+                local_bounds = np.stack([self.render_objects[obj_id]['geometry']['bounds'] for obj_id in moved])
+                transforms = np.stack([self.render_objects[obj_id]['transform'] for obj_id in moved])
+                self.bvh.update_many(moved, transform_bounds(local_bounds, transforms))
+            self.dirty_bounds.clear()
+        
+        if not self.frustum_culling:
+            return [obj_id for obj_id, obj in self.render_objects.items() if obj['batch'] is None] + \
+                list(self.static_batches.keys())
+        
+        return self.bvh.query_frustum(frustum_planes(view_projection))
+    
+    def _select_lods(self, keys: List):
+        """Pick each visible object's LOD from its projected geometric error, with hysteresis"""
+        lod_keys = [key for key in keys
+                    if key in self.render_objects and len(self.render_objects[key]['geometry']['lods']) > 1]
+        if not lod_keys:
+            return
+        objects = [self.render_objects[key] for key in lod_keys]
+        
+        # Distance from the camera to each object's bounding sphere
+        bounds = self.bvh.bounds[[self.bvh.key_index[key] for key in lod_keys]]
+        center = (bounds[:, 0] + bounds[:, 1]) * 0.5
+        radius = np.linalg.norm(bounds[:, 1] - bounds[:, 0], axis=1) * 0.5
+        distance = np.maximum(np.linalg.norm(center - self.camera_pos, axis=1) - radius, self.near_plane)
+        
+        # World units to pixels at that distance, then per-level error in pixels
+        pixels_per_unit = (self.render_height * 0.5) / (math.tan(math.radians(self.fov) / 2.0) * distance)
+        errors = np.stack([obj['geometry']['lod_errors'] for obj in objects]) * pixels_per_unit[:, None]
+        
+        # Coarsen only when comfortably under the threshold; refine once clearly over it
+        current = np.array([obj['lod_level'] for obj in objects])
+        coarser = np.sum(errors <= self.lod_error_threshold * (1.0 - self.lod_hysteresis), axis=1) - 1
+        finer = np.sum(errors <= self.lod_error_threshold * (1.0 + self.lod_hysteresis), axis=1) - 1
+        current_error = errors[np.arange(len(objects)), current]
+        
+        level = np.where(coarser > current, coarser, current)
+        level = np.where(current_error > self.lod_error_threshold * (1.0 + self.lod_hysteresis), finer, level)
+        
+        for index in np.flatnonzero(level != current):
+            obj = objects[index]
+            obj['lod_level'] = int(level[index])
+            self._use_geometry(obj, self._lod_geometry(obj['geometry'], obj['lod_level']))
+        
+        # Stamp the levels drawn this frame; the memory budget only evicts levels left idle
+        for index in np.flatnonzero(level > 0):
+            objects[index]['geometry']['lods'][level[index]]['last_used'] = self.frame_index
+    
+    def _render_skybox(self, view_matrix: np.ndarray, projection_matrix: np.ndarray):
+        """Render skybox"""
+        # Create skybox cube if not exists
+        if not hasattr(self, 'skybox_vao'):
+            skybox_vertices = np.array([
+                -1.0,  1.0, -1.0, -1.0, -1.0, -1.0,  1.0, -1.0, -1.0,
+                 1.0, -1.0, -1.0,  1.0,  1.0, -1.0, -1.0,  1.0, -1.0,
+                -1.0, -1.0,  1.0, -1.0, -1.0, -1.0, -1.0,  1.0, -1.0,
+                -1.0,  1.0, -1.0, -1.0,  1.0,  1.0, -1.0, -1.0,  1.0,
+                 1.0, -1.0, -1.0,  1.0, -1.0,  1.0,  1.0,  1.0,  1.0,
+                 1.0,  1.0,  1.0,  1.0,  1.0, -1.0,  1.0, -1.0, -1.0,
+                -1.0, -1.0,  1.0, -1.0,  1.0,  1.0,  1.0,  1.0,  1.0,
+                 1.0,  1.0,  1.0,  1.0, -1.0,  1.0, -1.0, -1.0,  1.0,
+                -1.0,  1.0, -1.0,  1.0,  1.0, -1.0,  1.0,  1.0,  1.0,
+                 1.0,  1.0,  1.0, -1.0,  1.0,  1.0, -1.0,  1.0, -1.0,
+                -1.0, -1.0, -1.0, -1.0, -1.0,  1.0,  1.0, -1.0, -1.0,
+                 1.0, -1.0, -1.0, -1.0, -1.0,  1.0,  1.0, -1.0,  1.0
+            ], dtype=np.float32)
+            
+            skybox_vbo = self.ctx.buffer(skybox_vertices.tobytes())
+            self.skybox_vao = self.ctx.vertex_array(self.programs['skybox'], [(skybox_vbo, '3f', 'in_position')])
+        
+        # Remove translation from view matrix
+        skybox_view = view_matrix.copy()
+        skybox_view[:3, 3] = 0
+        
+        program = self.programs['skybox']
+        program['view_matrix'].write(skybox_view.T.astype(np.float32).tobytes())
+        program['projection_matrix'].write(projection_matrix.T.astype(np.float32).tobytes())
+        
+        self.ctx.depth_func = '<='
+        self.skybox_vao.render()
+        self.ctx.depth_func = '<'
+    
+    def _build_render_queue(self, keys: List) -> List[Dict]:
+        """Resolve visible keys to draw entries sorted by program, material and mesh"""
+        render_objects = self.render_objects
+        static_batches = self.static_batches
+        queue = [render_objects[key] if key in render_objects else static_batches[key] for key in keys]
+        queue.sort(key=lambda entry: entry['sort_key'])
+        return queue
+    
+    def _draw_render_queue(self, queue: List[Dict]):
+        """Issue draws, only rewriting material and dequantization uniforms when they change"""
+        current_program = None
+        current_material = None
+        current_dequantize = None
+        
+        for entry in queue:
+            program = self.programs[entry['program']]
+            if entry['program'] != current_program:
+                current_program = entry['program']
+                current_material = None
+                current_dequantize = None
+            
+            # Matrices live in the object matrix texture; camera and light in the frame uniform block
+            program['object_index'].value = entry['slot']
+            
+            if entry['material_key'] != current_material:
+                current_material = entry['material_key']
+                self._apply_material(program, entry['material'])
+            
+            # Compact geometry: map 16-bit positions back to object space
+            if entry['dequantize'] is not None and entry['dequantize'] is not current_dequantize:
+                current_dequantize = entry['dequantize']
+                program['position_offset'].write(current_dequantize[0].tobytes())
+                program['position_scale'].write(current_dequantize[1].tobytes())
+            
+            entry['vao'].render()
+    
+    def _apply_material(self, program: moderngl.Program, material: Dict):
+        program['material_albedo'].write(np.array(material['albedo'], dtype=np.float32).tobytes())
+        program['material_metallic'].value = material['metallic']
+        program['material_roughness'].value = material['roughness']
+        program['material_ao'].value = material['ao']
+    
+    def _render_instanced(self, instanced: Dict):
+        """Draw all instances of one mesh with a single instanced draw call"""
+        count = instanced['count']
+        if count == 0:
+            return
+        
+        if instanced['dirty']:
+            # GL expects column-major matrices: transpose each model matrix
+            instance_data = np.empty((count, 20), dtype=np.float32)
+            instance_data[:, :16] = instanced['transforms'][:count].transpose(0, 2, 1).reshape(count, 16)
+            instance_data[:, 16:] = instanced['colors'][:count]
+            instanced['instance_vbo'].write(instance_data)
+            instanced['dirty'] = False
+        
+        program = self.programs['pbr_instanced']
+        self._apply_material(program, instanced['material'])
+        
+        instanced['vao'].render(instances=count)
+    
+    def _look_at(self, eye: np.ndarray, target: np.ndarray, up: np.ndarray) -> np.ndarray:
+        """Create look-at view matrix"""
+        f = (target - eye)
+        f = f / np.linalg.norm(f)
+        
+        s = np.cross(f, up)
+        s = s / np.linalg.norm(s)
+        
+        u = np.cross(s, f)
+        
+        result = np.eye(4)
+        result[0, :3] = s
+        result[1, :3] = u
+        result[2, :3] = -f
+        result[:3, 3] = [-np.dot(s, eye), -np.dot(u, eye), np.dot(f, eye)]
+        
+        return result
+    
+    def _perspective(self, fovy: float, aspect: float, near: float, far: float) -> np.ndarray:
+        """Create perspective projection matrix"""
+        f = 1.0 / math.tan(math.radians(fovy) / 2.0)
+        
+        result = np.zeros((4, 4))
+        result[0, 0] = f / aspect
+        result[1, 1] = f
+        result[2, 2] = (far + near) / (near - far)
+        result[2, 3] = (2.0 * far * near) / (near - far)
+        result[3, 2] = -1.0
+        
+        return result
+    
+    def cleanup(self):
+        """Cleanup resources"""
+        for obj in self.render_objects.values():
+            self._release_geometry(obj['geometry'])
+        self.render_objects.clear()
+        
+        for batch in self.static_batches.values():
+            self._release_geometry(batch['geometry'])
+        self.static_batches.clear()
+        self.stale_batches.clear()
+        self.bvh.clear()
+        self.dirty_bounds.clear()
+        
+        self.free_object_slots.clear()
+        self.object_slot_count = 0
+        self.dirty_matrix_slots.clear()
+        self.object_matrix_texture.release()
+        self.frame_ubo.release()
+        
+        self.clear_point_lights()
+        self.cluster_grid_texture.release()
+        self.light_index_texture.release()
+        self.light_data_texture.release()
+        
+        for mesh_id in list(self.instanced_meshes.keys()):
+            self.remove_instanced_mesh(mesh_id)
+        
+        # Every pooled buffer has been released back by now
+        self.buffer_pool.clear()
+        
+        if hasattr(self, 'skybox_vao'):
+            self.skybox_vao.release()
+        
+        if self.framebuffer:
+            self.framebuffer.release()
+        
+        self.ctx.release()
\ No newline at end of file
@@ -0,0 +1,236 @@
+import hashlib
+import io
+import os
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import trimesh
+from PIL import Image
+from .renderer import AdvancedRenderer
+
+class ThumbnailRenderer:
+    """Headless preview renderer for generated assets.
+    
+    A single worker thread owns a standalone ``AdvancedRenderer`` (GL contexts
+    are bound to the thread that created them) and renders queued assets in
+    batches through one reused framebuffer. Pixels are read back through two
+    alternating pixel buffers, so the readback of one asset overlaps the
+    rendering of the next. Thumbnails are cached as PNG by asset content hash,
+    in memory and on disk.
+    """
+    
+    def __init__(self, size: int = 256, cache_dir: str = "assets/thumbnails",
+                 memory_cache_entries: int = 1024, batch_size: int = 16):
+        self.size = size
+        self.cache_dir = cache_dir
+        self.memory_cache_entries = memory_cache_entries
+        self.batch_size = batch_size
+        os.makedirs(cache_dir, exist_ok=True)
+        
+        # PNG bytes by content hash (LRU), and path -> (mtime, size, hash) so hits skip rehashing
+        self.memory_cache: OrderedDict = OrderedDict()
+        self.file_hashes: Dict[str, Tuple[float, int, str]] = {}
+        self.cache_lock = threading.Lock()
+        
+        # Requests waiting for the render thread; in-flight futures are shared per hash
+        self.requests = queue.Queue()
+        self.in_flight: Dict[str, Future] = {}
+        
+        self.stats = {'memory_hits': 0, 'disk_hits': 0, 'rendered': 0, 'batches': 0}
+        
+        self.running = True
+        self.worker = threading.Thread(target=self._render_loop, daemon=True)
+        self.worker.start()
+    
+    def asset_hash(self, path: str) -> str:
+        """Content hash of an asset file, memoized by modification time and size"""
+        stat = os.stat(path)
+        with self.cache_lock:
+            known = self.file_hashes.get(path)
+        if known is not None and known[:2] == (stat.st_mtime, stat.st_size):
+            return known[2]
+        
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        asset_hash = digest.hexdigest()
+        
+        with self.cache_lock:
+            self.file_hashes[path] = (stat.st_mtime, stat.st_size, asset_hash)
+        return asset_hash
+    
+    def cached_thumbnail(self, path: str) -> Optional[bytes]:
+        """Return the cached PNG for an asset file without rendering, or None"""
+        asset_hash = self.asset_hash(path)
+        
+        with self.cache_lock:
+            data = self.memory_cache.get(asset_hash)
+            if data is not None:
+                self.memory_cache.move_to_end(asset_hash)
+                self.stats['memory_hits'] += 1
+                return data
+        
+        cache_path = self._cache_path(asset_hash)
+        if os.path.exists(cache_path):
+            with open(cache_path, 'rb') as f:
+                data = f.read()
+            self._remember(asset_hash, data)
+            with self.cache_lock:
+                self.stats['disk_hits'] += 1
+            return data
+        
+        return None
+    
+    def request(self, path: str, mesh: Optional[trimesh.Trimesh] = None) -> Future:
+        """Get a Future for an asset's PNG thumbnail, rendering it if not cached
+        
+        ``mesh`` may pass the already loaded mesh to skip reading the file.
+        """
+        asset_hash = self.asset_hash(path)
+        
+        future = Future()
+        data = self.cached_thumbnail(path)
+        if data is not None:
+            future.set_result(data)
+            return future
+        
+        with self.cache_lock:
+            pending = self.in_flight.get(asset_hash)
+            if pending is not None:
+                return pending
+            self.in_flight[asset_hash] = future
+        
+        self.requests.put((asset_hash, path, mesh, future))
+        return future
+    
+    def _render_loop(self):
+        try:
+            renderer = AdvancedRenderer(self.size, self.size, standalone=True)
+        except Exception as e:
+            # No GL available: fail every request instead of hanging it
+            while self.running:
+                item = self.requests.get()
+                if item is None:
+                    break
+                self._finish(item[0], item[3], error=e)
+            return
+        
+        # Two pixel buffers: one being filled by the GPU while the other is read
+        frame_bytes = self.size * self.size * 4
+        pixel_buffers = [renderer.ctx.buffer(reserve=frame_bytes) for _ in range(2)]
+        
+        while self.running:
+            item = self.requests.get()
+            if item is None:
+                break
+            
+            # Drain whatever else is queued into the same batch
+            batch = [item]
+            while len(batch) < self.batch_size:
+                try:
+                    item = self.requests.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self.running = False
+                    break
+                batch.append(item)
+            
+            self._render_batch(renderer, pixel_buffers, batch)
+        
+        for buffer in pixel_buffers:
+            buffer.release()
+        renderer.cleanup()
+    
+    def _render_batch(self, renderer: AdvancedRenderer, pixel_buffers: List, batch: List):
+        pending = None  # (item, buffer index) whose readback is still in flight
+        
+        for index, item in enumerate(batch):
+            asset_hash, path, mesh, future = item
+            try:
+                if mesh is None:
+                    mesh = trimesh.load(path, force='mesh')
+                self._draw_asset(renderer, mesh)
+            except Exception as e:
+                self._finish(asset_hash, future, error=e)
+                continue
+            
+            # Queue this frame's readback, then collect the previous one
+            buffer_index = index % 2
+            renderer.framebuffer.read_into(pixel_buffers[buffer_index], components=4)
+            if pending is not None:
+                self._collect(pixel_buffers, *pending)
+            pending = (item, buffer_index)
+        
+        if pending is not None:
+            self._collect(pixel_buffers, *pending)
+        
+        with self.cache_lock:
+            self.stats['batches'] += 1
+    
+    def _draw_asset(self, renderer: AdvancedRenderer, mesh: trimesh.Trimesh):
+        """Frame the mesh in the reused offscreen framebuffer and render it"""
+        renderer.remove_mesh('thumbnail')
+        renderer.add_mesh('thumbnail', mesh)
+        
+        center = mesh.bounds.mean(axis=0)
+        radius = max(float(np.linalg.norm(mesh.extents)) * 0.5, 1e-3)
+        distance = radius / np.sin(np.radians(renderer.fov) / 2.0) * 1.1
+        direction = np.array([0.6, 0.5, 0.8]) / np.linalg.norm([0.6, 0.5, 0.8])
+        
+        renderer.near_plane = max(distance - radius * 1.5, distance * 0.01)
+        renderer.far_plane = distance + radius * 1.5
+        renderer.set_camera(center + direction * distance, center)
+        renderer.lights[0]['position'] = center + np.array([1.0, 2.0, 1.5]) * distance
+        renderer.render()
+    
+    def _collect(self, pixel_buffers: List, item: Tuple, buffer_index: int):
+        asset_hash, _, _, future = item
+        try:
+            pixels = pixel_buffers[buffer_index].read()
+            image = Image.frombytes('RGBA', (self.size, self.size), pixels).transpose(Image.FLIP_TOP_BOTTOM)
+            output = io.BytesIO()
+            image.save(output, format='PNG')
+            data = output.getvalue()
+            
+            with open(self._cache_path(asset_hash), 'wb') as f:
+                f.write(data)
+            self._remember(asset_hash, data)
+        except Exception as e:
+            self._finish(asset_hash, future, error=e)
+            return
+        
+        with self.cache_lock:
+            self.stats['rendered'] += 1
+        self._finish(asset_hash, future, data=data)
+    
+    def _finish(self, asset_hash: str, future: Future, data: bytes = None, error: Exception = None):
+        with self.cache_lock:
+            self.in_flight.pop(asset_hash, None)
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(data)
+    
+    def _remember(self, asset_hash: str, data: bytes):
+        with self.cache_lock:
+            self.memory_cache[asset_hash] = data
+            self.memory_cache.move_to_end(asset_hash)
+            while len(self.memory_cache) > self.memory_cache_entries:
+                self.memory_cache.popitem(last=False)
+    
+    def _cache_path(self, asset_hash: str) -> str:
+        return os.path.join(self.cache_dir, f"{asset_hash}_{self.size}.png")
+    
+    def get_stats(self) -> Dict:
+        with self.cache_lock:
+            return {**self.stats, 'memory_entries': len(self.memory_cache), 'queued': self.requests.qsize()}
+    
+    def close(self):
+        """Stop the render thread after the queued requests"""
+        self.requests.put(None)
+        self.worker.join()
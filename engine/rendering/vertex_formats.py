@@ -0,0 +1,79 @@
+import numpy as np
+from typing import Tuple
+
+# Float layout: position, normal, texcoord, color as float32 (44 bytes per vertex)
+FLOAT_VERTEX_FORMAT = '3f 3f 2f 3f'
+
+# Compact layout (20 bytes per vertex): positions as 16-bit fractions of the mesh bounds (w unused),
+# octahedral normals as 16-bit signed, half-float texcoords and RGBA8 colors
+COMPACT_VERTEX = np.dtype([
+    ('position', '<u2', 4),
+    ('normal', '<i2', 2),
+    ('texcoord', '<f2', 2),
+    ('color', 'u1', 4)
+])
+COMPACT_VERTEX_FORMAT = '4u2 2i2 2f2 4f1'
+
+def octahedral_encode(normals: np.ndarray) -> np.ndarray:
+    """Encode (N, 3) unit normals as (N, 2) int16 octahedral coordinates"""
+    normals = np.asarray(normals, dtype=np.float32)
+    n = normals / np.maximum(np.abs(normals).sum(axis=1, keepdims=True), 1e-12)
+    
+    # Fold the lower hemisphere over the diagonals
+    lower = n[:, 2] < 0.0
+    signs = np.where(n[:, :2] >= 0.0, 1.0, -1.0)
+    folded = (1.0 - np.abs(n[:, [1, 0]])) * signs
+    encoded = np.where(lower[:, None], folded, n[:, :2])
+    
+    return np.round(np.clip(encoded, -1.0, 1.0) * 32767.0).astype(np.int16)
+
+def octahedral_decode(encoded: np.ndarray) -> np.ndarray:
+    """Decode (N, 2) int16 octahedral coordinates to (N, 3) unit normals"""
+    e = np.maximum(np.asarray(encoded, dtype=np.float32) / 32767.0, -1.0)
+    n = np.column_stack([e, 1.0 - np.abs(e).sum(axis=1)])
+    
+    lower = n[:, 2] < 0.0
+    signs = np.where(n[:, :2] >= 0.0, 1.0, -1.0)
+    n[lower, :2] = ((1.0 - np.abs(n[:, [1, 0]])) * signs)[lower]
+    
+    return n / np.maximum(np.linalg.norm(n, axis=1, keepdims=True), 1e-12)
+
+def quantize_vertices(vertex_data: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Pack (N, 11) float vertices into the compact layout
+    
+    Returns the packed array plus the ``offset`` and ``scale`` that map the
+    16-bit positions back to object space (``offset + position * scale``).
+    """
+    vertex_data = np.asarray(vertex_data, dtype=np.float32).reshape(-1, 11)
+    positions = vertex_data[:, :3]
+    
+    if len(positions):
+        offset = positions.min(axis=0)
+        scale = (positions.max(axis=0) - offset) / 65535.0
+    else:
+        offset = np.zeros(3, dtype=np.float32)
+        scale = np.zeros(3, dtype=np.float32)
+    scale = np.where(scale > 0.0, scale, 1.0).astype(np.float32)
+    
+    packed = np.zeros(len(vertex_data), dtype=COMPACT_VERTEX)
+    packed['position'][:, :3] = np.clip(np.round((positions - offset) / scale), 0, 65535)
+    packed['normal'] = octahedral_encode(vertex_data[:, 3:6])
+    packed['texcoord'] = np.clip(vertex_data[:, 6:8], -65504.0, 65504.0)
+    packed['color'][:, :3] = np.clip(np.round(vertex_data[:, 8:11] * 255.0), 0, 255)
+    packed['color'][:, 3] = 255
+    
+    return packed, offset.astype(np.float32), scale
+
+def dequantize_vertices(packed: np.ndarray, offset: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """Unpack compact vertices back to the (N, 11) float layout"""
+    vertex_data = np.empty((len(packed), 11), dtype=np.float32)
+    vertex_data[:, :3] = offset + packed['position'][:, :3] * scale
+    vertex_data[:, 3:6] = octahedral_decode(packed['normal'])
+    vertex_data[:, 6:8] = packed['texcoord']
+    vertex_data[:, 8:11] = packed['color'][:, :3] / 255.0
+    return vertex_data
+
+def index_array(faces: np.ndarray, vertex_count: int) -> np.ndarray:
+    """Flat index data, 16-bit when every vertex is addressable with it"""
+    dtype = np.uint16 if vertex_count <= 65536 else np.uint32
+    return np.ascontiguousarray(faces, dtype=dtype).ravel()
@@ -1,5 +1,5 @@
 from fastapi import FastAPI, File, UploadFile, HTTPException, WebSocket, WebSocketDisconnect, BackgroundTasks
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
@@ -12,7 +12,7 @@ import os
 import sys
 import uuid
 import time
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Literal, Optional, Any
 from concurrent.futures import ThreadPoolExecutor
 import threading
 from celery import Celery
@@ -22,15 +22,21 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from engine.generators.text_to_3d import TextTo3DGenerator
 from engine.generators.image_to_3d import ImageTo3DGenerator
+from engine.generators.quality import LEVELS_BY_NAME, get_quality_level
 from engine.core.game_engine import GameEngine
+from engine.rendering.thumbnail_renderer import ThumbnailRenderer
 
 # Pydantic models
+# Tier names, taken from the tier table so request validation follows any added or renamed tier
+QualityName = Literal[tuple(LEVELS_BY_NAME)]
+
 class TextGenerationRequest(BaseModel):
     description: str
     position: Optional[List[float]] = [0, 0, 0]
     enable_physics: Optional[bool] = True
     physics_properties: Optional[Dict] = None
-    quality: Optional[str] = "high"
+    quality: Optional[QualityName] = "high"
+    latency_budget_ms: Optional[float] = None
     material_override: Optional[Dict] = None
 
 class ImageGenerationRequest(BaseModel):
@@ -38,6 +44,8 @@ class ImageGenerationRequest(BaseModel):
     method: Optional[str] = "advanced"
     enable_physics: Optional[bool] = True
     physics_properties: Optional[Dict] = None
+    quality: Optional[QualityName] = "high"
+    latency_budget_ms: Optional[float] = None
 
 class ObjectUpdateRequest(BaseModel):
     position: Optional[List[float]] = None
@@ -80,10 +88,39 @@ text_gen = TextTo3DGenerator()
 image_gen = ImageTo3DGenerator()
 executor = ThreadPoolExecutor(max_workers=4)
 
+# Headless preview renderer, created on first use (owns its own GL context thread)
+THUMBNAIL_FORMATS = ['glb', 'obj', 'ply', 'stl']
+thumbnail_renderer: Optional[ThumbnailRenderer] = None
+thumbnail_lock = threading.Lock()
+
+def get_thumbnail_renderer() -> ThumbnailRenderer:
+    global thumbnail_renderer
+    with thumbnail_lock:
+        if thumbnail_renderer is None:
+            thumbnail_renderer = ThumbnailRenderer(cache_dir='assets/thumbnails')
+        return thumbnail_renderer
+
+def prefetch_thumbnail(request_id: str, model_path: str, mesh=None) -> str:
+    """Start rendering a generated asset's thumbnail in the background; returns its URL"""
+    try:
+        get_thumbnail_renderer().request(model_path, mesh)
+    except Exception as e:
+        print(f"Thumbnail prefetch failed for {request_id}: {e}")
+    return f"/thumbnail/{request_id}"
+
 # Game engine instances (for multi-session support)
 game_engines: Dict[str, GameEngine] = {}
 active_sessions: Dict[str, Dict] = {}
 
+# Idle sessions are snapshotted to disk and their engines freed; they are
+# destroyed outright after SESSION_TIMEOUT seconds without activity
+SESSION_HIBERNATE_AFTER = 300
+SESSION_TIMEOUT = 3600
+HIBERNATION_DIR = 'assets/hibernated'
+# Where GameEngine keeps each session's journal (under its "assets" asset directory)
+JOURNAL_DIR = 'assets/journals'
+os.makedirs(HIBERNATION_DIR, exist_ok=True)
+
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
@@ -185,20 +222,101 @@ async def health_check():
             "memory_available": memory.available
         },
         "active_sessions": len(active_sessions),
-        "active_connections": len(manager.active_connections)
+        "hibernated_sessions": sum(1 for session in active_sessions.values() if session.get('snapshot_path')),
+        "active_connections": len(manager.active_connections),
+        "generation_cache": text_gen.cache.get_stats(),
+        "generation_cost_models": {
+            "text": text_gen.cost_model.get_stats(),
+            **{f"image_{method}": model.get_stats() for method, model in list(image_gen.cost_models.items())}
+        }
     }
 
+def get_session_engine(session_id: Optional[str]) -> Optional[GameEngine]:
+    """Return the session's engine, rehydrating it from its snapshot if hibernated"""
+    if not session_id or session_id not in active_sessions:
+        return None
+    
+    session = active_sessions[session_id]
+    session['last_activity'] = time.time()
+    
+    if session_id not in game_engines and session.get('snapshot_path'):
+        engine = GameEngine(enable_physics=True, session_id=session_id)
+        try:
+            _register_generation_listeners(session_id, engine)
+            # The session's journal already records these objects from before hibernation
+            engine.load_scene(session['snapshot_path'], journal=False)
+        except Exception as e:
+            # A corrupt snapshot can't be restored; drop the session instead of leaking an engine per request
+            print(f"Failed to restore session {session_id}: {e}")
+            engine.release()
+            destroy_session(session_id)
+            return None
+        
+        os.remove(session['snapshot_path'])
+        session['snapshot_path'] = None
+        game_engines[session_id] = engine
+    
+    return game_engines.get(session_id)
+
+def hibernate_session(session_id: str) -> bool:
+    """Snapshot an idle session to disk and release its engine, physics thread and GPU resources"""
+    engine = game_engines.get(session_id)
+    if engine is None or engine.pending_generations:
+        return False
+    
+    snapshot_path = os.path.join(HIBERNATION_DIR, f"{session_id}.scene")
+    engine.save_scene(snapshot_path)
+    engine.release()
+    
+    del game_engines[session_id]
+    active_sessions[session_id]['snapshot_path'] = snapshot_path
+    active_sessions[session_id]['hibernated_at'] = time.time()
+    return True
+
+def destroy_session(session_id: str):
+    """Release a session whether it is live or hibernated"""
+    engine = game_engines.pop(session_id, None)
+    if engine is not None:
+        engine.release()
+    
+    session = active_sessions.pop(session_id, None)
+    if session and session.get('snapshot_path') and os.path.exists(session['snapshot_path']):
+        os.remove(session['snapshot_path'])
+    
+    journal_path = os.path.join(JOURNAL_DIR, f"{session_id}.jsonl")
+    if os.path.exists(journal_path):
+        os.remove(journal_path)
+
+def _register_generation_listeners(session_id: str, engine: GameEngine):
+    """Forward background generation results to the session's WebSocket clients"""
+    def on_ready(data):
+        asyncio.create_task(manager.send_to_session(
+            json.dumps({'type': 'object_ready', **data}),
+            session_id
+        ))
+    
+    def on_failed(data):
+        asyncio.create_task(manager.send_to_session(
+            json.dumps({'type': 'object_failed', **data}),
+            session_id
+        ))
+    
+    engine.add_event_listener('object_ready', on_ready)
+    engine.add_event_listener('object_failed', on_failed)
+
 @app.post("/api/session/create")
 async def create_session():
     """Create new game engine session"""
     session_id = str(uuid.uuid4())
     
     # Initialize game engine for session
-    game_engines[session_id] = GameEngine(enable_physics=True)
+    game_engines[session_id] = GameEngine(enable_physics=True, session_id=session_id)
+    _register_generation_listeners(session_id, game_engines[session_id])
     active_sessions[session_id] = {
         'created_at': time.time(),
         'objects': {},
-        'last_activity': time.time()
+        'last_activity': time.time(),
+        'snapshot_path': None
     }
     
     return {
@@ -210,11 +328,9 @@ async def create_session():
 @app.delete("/api/session/{session_id}")
 async def delete_session(session_id: str):
     """Delete game engine session"""
-    if session_id in game_engines:
-        # Cleanup game engine
-        game_engines[session_id]._cleanup()
-        del game_engines[session_id]
-        del active_sessions[session_id]
+    if session_id in active_sessions:
+        # Cleanup game engine (or its hibernation snapshot)
+        destroy_session(session_id)
         
         return {"status": "deleted"}
     
@@ -226,14 +342,17 @@ async def generate_from_text(request: TextGenerationRequest, background_tasks: B
     try:
         request_id = str(uuid.uuid4())
         
-        if session_id and session_id in game_engines:
+        engine = get_session_engine(session_id)
+        if engine is not None:
             # Add to game engine directly
-            engine = game_engines[session_id]
             obj_id = engine.add_object_from_text(
                 request.description,
                 tuple(request.position),
                 request.enable_physics,
-                request.physics_properties
+                request.physics_properties,
+                request.material_override,
+                request.quality,
+                request.latency_budget_ms
             )
             
             active_sessions[session_id]['objects'][obj_id] = {
@@ -260,7 +379,8 @@ async def generate_from_text(request: TextGenerationRequest, background_tasks: B
             }
         else:
             # Generate mesh for download
-            mesh = text_gen.generate_from_text(request.description)
+            mesh = text_gen.generate_from_text(request.description, quality=request.quality,
+                                               budget_ms=request.latency_budget_ms)
             
             # Save in multiple formats
             output_paths = {}
@@ -273,8 +393,10 @@ async def generate_from_text(request: TextGenerationRequest, background_tasks: B
                 'success': True,
                 'request_id': request_id,
                 'model_paths': output_paths,
+                'thumbnail_url': prefetch_thumbnail(request_id, output_paths['obj'], mesh),
                 'vertices': len(mesh.vertices),
                 'faces': len(mesh.faces),
+                'quality': mesh.metadata.get('quality'),
                 'description': request.description
             }
     
@@ -298,15 +420,17 @@ async def generate_from_image(file: UploadFile = File(...),
             content = await file.read()
             await f.write(content)
         
-        if session_id and session_id in game_engines:
+        engine = get_session_engine(session_id)
+        if engine is not None:
             # Add to game engine
-            engine = game_engines[session_id]
             obj_id = engine.add_object_from_image(
                 file_path,
                 tuple(request.position) if request else (0, 0, 0),
                 request.method if request else 'advanced',
                 request.enable_physics if request else True,
-                request.physics_properties if request else None
+                request.physics_properties if request else None,
+                request.quality if request else None,
+                request.latency_budget_ms if request else None
             )
             
             active_sessions[session_id]['objects'][obj_id] = {
@@ -333,7 +457,9 @@ async def generate_from_image(file: UploadFile = File(...),
         else:
             # Generate mesh for download
             method = request.method if request else 'advanced'
-            mesh = image_gen.generate_from_image(file_path, method)
+            mesh = image_gen.generate_from_image(file_path, method,
+                                                 request.quality if request else None,
+                                                 request.latency_budget_ms if request else None)
             
             # Save in multiple formats
             output_paths = {}
@@ -346,8 +472,11 @@ async def generate_from_image(file: UploadFile = File(...),
                 'success': True,
                 'request_id': request_id,
                 'model_paths': output_paths,
+                'thumbnail_url': prefetch_thumbnail(request_id, output_paths['obj'], mesh),
                 'vertices': len(mesh.vertices),
                 'faces': len(mesh.faces),
+                'quality': mesh.metadata.get('quality'),
+                'timings': mesh.metadata.get('timings'),
                 'original_image': file_path
             }
     
@@ -357,11 +486,10 @@ async def generate_from_image(file: UploadFile = File(...),
 @app.put("/api/session/{session_id}/object/{object_id}")
 async def update_object(session_id: str, object_id: str, request: ObjectUpdateRequest):
     """Update object in session"""
-    if session_id not in game_engines:
+    engine = get_session_engine(session_id)
+    if engine is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    engine = game_engines[session_id]
-    
     try:
         engine.update_object_transform(
             object_id,
@@ -389,11 +517,10 @@ async def update_object(session_id: str, object_id: str, request: ObjectUpdateRe
 @app.post("/api/session/{session_id}/object/{object_id}/force")
 async def apply_force(session_id: str, object_id: str, request: ForceRequest):
     """Apply force to object"""
-    if session_id not in game_engines:
+    engine = get_session_engine(session_id)
+    if engine is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    engine = game_engines[session_id]
-    
     try:
         import numpy as np
         force = np.array(request.force)
@@ -430,10 +557,9 @@ async def list_objects(session_id: str):
 @app.delete("/api/session/{session_id}/object/{object_id}")
 async def remove_object(session_id: str, object_id: str):
     """Remove object from session"""
-    if session_id not in game_engines:
+    engine = get_session_engine(session_id)
+    if engine is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    
-    engine = game_engines[session_id]
     engine.remove_object(object_id)
     
     if object_id in active_sessions[session_id]['objects']:
@@ -452,10 +578,9 @@ async def remove_object(session_id: str, object_id: str):
 @app.get("/api/session/{session_id}/performance")
 async def get_performance_stats(session_id: str):
     """Get performance statistics for session"""
-    if session_id not in game_engines:
+    engine = get_session_engine(session_id)
+    if engine is None:
         raise HTTPException(status_code=404, detail="Session not found")
-    
-    engine = game_engines[session_id]
     stats = engine.get_performance_stats()
     
     return {
@@ -481,6 +606,28 @@ async def download_file(file_id: str, format: str = "obj"):
         filename=f"{file_id}.{format}"
     )
 
+@app.get("/thumbnail/{asset_id}")
+async def get_thumbnail(asset_id: str):
+    """PNG preview of a generated asset (rendered once, then served from cache)"""
+    if os.path.basename(asset_id) != asset_id:
+        raise HTTPException(status_code=404, detail="Asset not found")
+    
+    model_path = next((f"assets/{asset_id}.{fmt}" for fmt in THUMBNAIL_FORMATS
+                       if os.path.exists(f"assets/{asset_id}.{fmt}")), None)
+    if model_path is None:
+        raise HTTPException(status_code=404, detail="Asset not found")
+    
+    renderer = get_thumbnail_renderer()
+    data = renderer.cached_thumbnail(model_path)
+    if data is None:
+        try:
+            data = await asyncio.wrap_future(renderer.request(model_path))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=f"Thumbnail rendering failed: {e}")
+    
+    return Response(content=data, media_type="image/png",
+                    headers={"Cache-Control": "public, max-age=86400"})
+
 # WebSocket endpoint
 @app.websocket("/ws/{session_id}")
 async def websocket_endpoint(websocket: WebSocket, session_id: str):
@@ -491,25 +638,43 @@ async def websocket_endpoint(websocket: WebSocket, session_id: str):
             data = await websocket.receive_text()
             message = json.loads(data)
             
+            # Any traffic counts as activity, not just generation requests
+            if session_id in active_sessions:
+                active_sessions[session_id]['last_activity'] = time.time()
+            
             if message['type'] == 'ping':
                 await manager.send_personal_message(
                     json.dumps({'type': 'pong', 'timestamp': time.time()}),
                     websocket
                 )
             elif message['type'] == 'generate_text':
-                # Handle real-time text generation
-                if session_id in game_engines:
-                    engine = game_engines[session_id]
-                    obj_id = engine.add_object_from_text(
+                # Handle real-time text generation; the mesh arrives later via 'object_ready'
+                if message.get('quality') is not None:
+                    # Reject unknown tiers now rather than as an 'object_failed' from the worker
+                    try:
+                        get_quality_level(message['quality'])
+                    except ValueError as e:
+                        await manager.send_personal_message(
+                            json.dumps({'type': 'error', 'request': 'generate_text', 'error': str(e)}),
+                            websocket
+                        )
+                        continue
+                
+                engine = get_session_engine(session_id)
+                if engine is not None:
+                    obj_id = engine.add_object_from_text_async(
                         message['description'],
-                        tuple(message.get('position', [0, 0, 0]))
+                        tuple(message.get('position', [0, 0, 0])),
+                        quality=message.get('quality'),
+                        budget_ms=message.get('latency_budget_ms')
                     )
                     
                     await manager.send_to_session(
                         json.dumps({
                             'type': 'object_generated',
                             'object_id': obj_id,
-                            'description': message['description']
+                            'description': message['description'],
+                            'pending': True
                         }),
                         session_id
                     )
@@ -524,20 +689,44 @@ async def startup_event():
         while True:
             current_time = time.time()
             inactive_sessions = []
+            idle_sessions = []
             
             for session_id, session_data in active_sessions.items():
-                if current_time - session_data['last_activity'] > 3600:  # 1 hour timeout
+                idle_time = current_time - session_data['last_activity']
+                if idle_time > SESSION_TIMEOUT:
                     inactive_sessions.append(session_id)
+                elif idle_time > SESSION_HIBERNATE_AFTER and session_id in game_engines:
+                    idle_sessions.append(session_id)
             
             for session_id in inactive_sessions:
-                if session_id in game_engines:
-                    game_engines[session_id]._cleanup()
-                    del game_engines[session_id]
-                    del active_sessions[session_id]
+                destroy_session(session_id)
             
-            await asyncio.sleep(300)  # Check every 5 minutes
+            for session_id in idle_sessions:
+                hibernate_session(session_id)
+            
+            await asyncio.sleep(60)  # Check every minute
+    
+    async def pump_generations():
+        # Integrate finished background generations on the loop thread that owns the GL contexts
+        while True:
+            for engine in list(game_engines.values()):
+                engine.process_completed_generations()
+            
+            await asyncio.sleep(1 / 60)
     
     asyncio.create_task(cleanup_sessions())
+    asyncio.create_task(pump_generations())
+    
+    # Measure this machine's generation costs for latency-budgeted requests
+    def report_calibration(name: str):
+        def done(future):
+            if not future.cancelled() and future.exception() is not None:
+                print(f"{name} cost model calibration failed: {future.exception()}")
+        return done
+    
+    loop = asyncio.get_event_loop()
+    loop.run_in_executor(executor, text_gen.calibrate).add_done_callback(report_calibration('Text'))
+    loop.run_in_executor(executor, image_gen.calibrate, 'advanced').add_done_callback(report_calibration('Image'))
 
 # Include conversion API extensions
 from server.api_extensions import router as conversion_router
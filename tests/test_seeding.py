@@ -0,0 +1,22 @@
+import numpy as np
+from engine.procedural.seeding import seed_sequence, spawn
+
+def test_spawn_from_generator():
+    children = spawn(np.random.default_rng(1), 2)
+    assert len(children) == 2
+    assert all(isinstance(child, np.random.SeedSequence) for child in children)
+
+def test_spawn_from_generator_is_reproducible():
+    first = [np.random.default_rng(child).random() for child in spawn(np.random.default_rng(1), 3)]
+    second = [np.random.default_rng(child).random() for child in spawn(np.random.default_rng(1), 3)]
+    assert first == second
+    assert len(set(first)) == 3
+
+def test_spawn_advances_generator():
+    rng = np.random.default_rng(1)
+    first = spawn(rng, 1)[0]
+    second = spawn(rng, 1)[0]
+    assert np.random.default_rng(first).random() != np.random.default_rng(second).random()
+
+def test_seed_sequence_matches_int_seed():
+    assert seed_sequence(np.random.default_rng(7)).entropy == seed_sequence(7).entropy